@@ -1,6 +1,8 @@
 # To add a new cell, type '# %%'
 # To add a new markdown cell, type '# %% [markdown]'
 # %%
+from functools import partial
+
 import numpy as np
 
 import prospect
@@ -27,13 +29,28 @@ team = prospect.Team(name="team", surveyor_list=[surveyor], assignment="naive")
 
 
 # %%
-# Create a bunch of transect Coverage configurations
-pass
+# Sweep over every combination of transect Coverage configurations...
+grid = prospect.SurveyGrid(name="transect_density", area=area, team=team, seed=5)
+grid.vary(
+    "coverage",
+    partial(prospect.Coverage.from_transects, name="coverage", area=area),
+    spacing=[5.0, 10.0, 20.0],
+    sweep_width=[1.0, 2.0],
+)
 
 
 # %%
-# Create a bunch of artifact Assemblage densities
-pass
+# ...and artifact Assemblage densities
+grid.vary(
+    "assemblage",
+    partial(prospect.Layer.from_poisson_points, name="artifacts", area=area),
+    rate=[0.0005, 0.001, 0.005],
+)
+grid.configs
 
 
 # %%
+results = grid.run(n_runs=100)
+results.groupby(["spacing", "sweep_width", "rate"])[
+    ["n_discovered", "total_time"]
+].mean()
@@ -2,8 +2,11 @@ from .area import Area  # noqa
 from .assemblage import Assemblage  # noqa
 from .coverage import Coverage  # noqa
 from .feature import Feature  # noqa
+from .grid import SurveyGrid  # noqa
 from .layer import Layer  # noqa
+from .results import SurveyResults  # noqa
 from .survey import Survey  # noqa
 from .surveyor import Surveyor  # noqa
 from .surveyunit import SurveyUnit  # noqa
 from .team import Team  # noqa
+from .visibility import VisibilitySurface  # noqa
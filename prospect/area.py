@@ -1,9 +1,16 @@
+import numbers
 import warnings
-from typing import Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence, Tuple, Union
 
 import geopandas as gpd
+import numpy as np
+import shapely
 from scipy.stats._distn_infrastructure import rv_frozen
-from shapely.geometry import Polygon, box
+from shapely.geometry import MultiPolygon, Point, Polygon, box
+
+if TYPE_CHECKING:
+    # visibility imports utils, which imports this module
+    from .visibility import VisibilitySurface
 
 
 class Area:
@@ -13,25 +20,50 @@ class Area:
     ----------
     name : str
         Unique name for the area
-    shape : Polygon
+    shape : Union[Polygon, MultiPolygon]
         Geographic specification
-    vis : Union[float, rv_frozen], optional
-        Surface visibility (the default is 1.0, which means perfect surface
-        visibility)
+    vis : Union[float, rv_frozen, VisibilitySurface], optional
+        Surface visibility, which can vary across space if given as a
+        `VisibilitySurface` (the default is 1.0, which means perfect surface
+        visibility). Features outside the area have no visibility, so a
+        `Survey` never discovers them, even where the coverage extends past
+        the area.
 
     Attributes
     ----------
     name : str
         Name of the area
-    shape : Polygon
+    shape : Union[Polygon, MultiPolygon]
         Geographic specification
-    vis : Union[float, rv_frozen]
-        Surface visibility
+    vis : Union[float, rv_frozen, VisibilitySurface, List[Union[float, rv_frozen]]]
+        Surface visibility, or one value per polygon for areas created with
+        `from_polygons`
     df : geopandas GeoDataFrame
-        GeoDataFrame with one row that summarizes the area's attributes
+        GeoDataFrame with a row that summarizes the attributes of each
+        polygon of the area
+    prepared_shape : Polygon
+        `shape`, prepared for fast repeated spatial predicates
+    bounds : Tuple[float, float, float, float]
+        Bounding box of `shape` as (minx, miny, maxx, maxy)
+    area : float
+        Area of `shape`
+    minimum_rotated_rectangle : Polygon
+        Minimum rotated rectangle of `shape`
+    centroid : Point
+        Centroid of `shape`
+
+    Notes
+    -----
+    The derived geometry attributes are computed on first access and then
+    reused, so `shape` should not be modified after the `Area` is created.
     """
 
-    def __init__(self, name: str, shape: Polygon, vis: Union[float, rv_frozen] = 1.0):
+    def __init__(
+        self,
+        name: str,
+        shape: Union[Polygon, MultiPolygon],
+        vis: Union[float, rv_frozen, "VisibilitySurface"] = 1.0,
+    ):
         """Create an `Area` instance"""
 
         self.name = name
@@ -41,6 +73,80 @@ class Area:
             {"name": [self.name], "shape": self.shape, "vis": [self.vis]},
             geometry="shape",
         )
+        self._cache = {}
+
+    def _cached(self, key: str, func: Callable[[], Any]) -> Any:
+        """Compute a value derived from `shape` once and reuse it."""
+
+        if key not in self._cache:
+            self._cache[key] = func()
+        return self._cache[key]
+
+    @property
+    def prepared_shape(self) -> Polygon:
+        """`shape`, prepared for fast repeated spatial predicates."""
+
+        def prepare() -> Polygon:
+            shapely.prepare(self.shape)
+            return self.shape
+
+        return self._cached("prepared_shape", prepare)
+
+    @property
+    def bounds(self) -> Tuple[float, float, float, float]:
+        """Bounding box of `shape` as (minx, miny, maxx, maxy)."""
+
+        return self._cached("bounds", lambda: self.shape.bounds)
+
+    @property
+    def area(self) -> float:
+        """Area of `shape`."""
+
+        return self._cached("area", lambda: self.shape.area)
+
+    @property
+    def minimum_rotated_rectangle(self) -> Polygon:
+        """Minimum rotated rectangle of `shape`."""
+
+        return self._cached(
+            "minimum_rotated_rectangle", lambda: self.shape.minimum_rotated_rectangle
+        )
+
+    @property
+    def centroid(self) -> Point:
+        """Centroid of `shape`."""
+
+        return self._cached("centroid", lambda: self.shape.centroid)
+
+    def locate(self, geoms: Sequence) -> np.ndarray:
+        """Find the polygon of the area that each geometry lies in.
+
+        All geometries are looked up with one query of an `STRtree` of the
+        polygons in `df`, which is built on first use.
+
+        Parameters
+        ----------
+        geoms : Sequence
+            Shapely geometries, e.g. `Assemblage.df.geometry`
+
+        Returns
+        -------
+        numpy ndarray
+            Positional index into `df` of the polygon each geometry
+            intersects (the first one if several), or -1 if it is outside the
+            area
+        """
+
+        tree = self._cached(
+            "strtree", lambda: shapely.STRtree(self.df.geometry.to_numpy())
+        )
+        geom_idx, poly_idx = tree.query(np.asarray(geoms), predicate="intersects")
+
+        n_polys = self.df.shape[0]
+        idx = np.full(len(geoms), n_polys)
+        np.minimum.at(idx, geom_idx, poly_idx)
+        idx[idx == n_polys] = -1
+        return idx
 
     def __repr__(self):
         return f"Area(name={repr(self.name)}, shape={repr(self.shape)}, \
@@ -51,7 +157,13 @@ class Area:
 
     @classmethod
     def from_shapefile(
-        cls, name: str, path: str, vis: Union[float, rv_frozen] = 1.0, **kwargs
+        cls,
+        name: str,
+        path: str,
+        vis: Union[float, rv_frozen] = 1.0,
+        all_features: bool = False,
+        vis_column: Optional[str] = None,
+        **kwargs,
     ) -> "Area":
         """Create an `Area` object from a shapefile
 
@@ -63,6 +175,13 @@ class Area:
             File path to the shapefile
         vis : Union[float, rv_frozen]
             Surface visibility
+        all_features : bool, optional
+            Keep every feature of the shapefile as a polygon of the area, and
+            the shapefile's coordinate reference system in `df` (the default
+            is False, which only uses the first feature)
+        vis_column : str, optional
+            Column holding the surface visibility of each feature, used
+            instead of `vis` when `all_features` is True (the default is None)
 
         Returns
         -------
@@ -71,11 +190,67 @@ class Area:
 
         tmp_gdf = gpd.read_file(path, **kwargs)
 
+        if all_features:
+            if vis_column is not None:
+                vis = tmp_gdf.loc[:, vis_column].tolist()
+            return cls.from_polygons(
+                name=name, shapes=tmp_gdf.geometry, vis=vis, crs=tmp_gdf.crs
+            )
+
         if tmp_gdf.shape[0] > 1:
             warnings.warn("Shapefile has more than one feature. Using only the first.")
 
         return cls(name=name, shape=tmp_gdf.geometry.iloc[0], vis=vis)
 
+    @classmethod
+    def from_polygons(
+        cls,
+        name: str,
+        shapes: Sequence[Polygon],
+        vis: Union[float, rv_frozen, Sequence[Union[float, rv_frozen]]] = 1.0,
+        crs: Optional[Any] = None,
+    ) -> "Area":
+        """Create an `Area` object made of several polygons, like the fields
+        or tracts of a survey region
+
+        Parameters
+        ----------
+        name : str
+            Unique name for the area
+        shapes : Sequence[Polygon]
+            Polygons that make up the area. They should not overlap.
+        vis : Union[float, rv_frozen, Sequence[Union[float, rv_frozen]]]
+            Surface visibility of all polygons, or one value per polygon
+        crs : Any, optional
+            Coordinate reference system of `df`, in any form accepted by
+            geopandas (the default is None, which uses the CRS of `shapes`
+            if it is a `GeoSeries`)
+
+        Returns
+        -------
+        Area
+        """
+
+        if crs is None:
+            crs = getattr(shapes, "crs", None)
+        shapes = list(shapes)
+        if isinstance(vis, (numbers.Number, rv_frozen)):
+            vis = [vis] * len(shapes)
+        vis = list(vis)
+        assert len(vis) == len(shapes), "Need one vis value per polygon"
+
+        area = cls(name=name, shape=shapely.union_all(shapes), vis=vis)
+        area.df = gpd.GeoDataFrame(
+            {
+                "name": [f"{name}_{i}" for i in range(len(shapes))],
+                "shape": shapes,
+                "vis": vis,
+            },
+            geometry="shape",
+            crs=crs,
+        )
+        return area
+
     @classmethod
     def from_area_value(
         cls,
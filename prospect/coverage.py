@@ -1,14 +1,15 @@
-from typing import Dict, List, Optional, Union
+from typing import Callable, List, Optional, Tuple, Union
 
 import geopandas as gpd
 import numpy as np
 import pandas as pd
+import shapely
 from scipy.stats._distn_infrastructure import rv_frozen
-from shapely.geometry import LineString, Point, Polygon
+from shapely.geometry import Point, Polygon
 
 from .area import Area
 from .surveyunit import SurveyUnit
-from .utils import clip_lines_polys
+from .utils import _clip_by_polygon, clip_lines_polys
 
 
 class Coverage:
@@ -64,14 +65,14 @@ class Coverage:
         """Create a `Coverage` instance."""
 
         self.name = name
-        self.surveyunit_list = surveyunit_list
+        self._surveyunit_list = surveyunit_list
         self.orientation = orientation
         self.spacing = spacing
         self.sweep_width = sweep_width
         self.radius = radius
 
         self.df = gpd.GeoDataFrame(
-            [surveyunit.to_dict() for surveyunit in self.surveyunit_list],
+            [surveyunit.to_dict() for surveyunit in surveyunit_list],
             geometry="shape",
         )
 
@@ -85,6 +86,69 @@ class Coverage:
         # elif all(self.df['surveyunit_type'] == 'radial'):
         #     self.df['search_time_base'] = self.min_time_per_unit
 
+    @property
+    def surveyunit_list(self) -> List[SurveyUnit]:
+        """List of survey units that make up the coverage.
+
+        Coverages built from arrays only create the `SurveyUnit` objects when
+        this is first accessed.
+        """
+
+        if self._surveyunit_list is None:
+            self._surveyunit_list = [
+                SurveyUnit(
+                    name=row.surveyunit_name,
+                    coverage_name=row.coverage_name,
+                    shape=row.shape,
+                    surveyunit_type=row.surveyunit_type,
+                    length=row.length,
+                    radius=row.radius,
+                    min_time_per_unit=row.min_time_per_unit,
+                )
+                for row in self.df.itertuples(index=False)
+            ]
+        return self._surveyunit_list
+
+    @classmethod
+    def _from_shapes(
+        cls,
+        shapes: np.ndarray,
+        name: str,
+        surveyunit_type: str,
+        orientation: Optional[float],
+        spacing: Optional[float],
+        sweep_width: Optional[float] = None,
+        radius: Optional[float] = None,
+        length: Optional[np.ndarray] = None,
+        min_time_per_unit: Union[float, rv_frozen] = 0.0,
+    ) -> "Coverage":
+        """Build `df` directly from an array of survey unit geometries,
+        deferring the creation of `SurveyUnit` objects until `surveyunit_list`
+        is accessed."""
+
+        n = len(shapes)
+        coverage = cls.__new__(cls)
+        coverage.name = name
+        coverage._surveyunit_list = None
+        coverage.orientation = orientation
+        coverage.spacing = spacing
+        coverage.sweep_width = sweep_width
+        coverage.radius = radius
+        coverage.df = gpd.GeoDataFrame(
+            {
+                "surveyunit_name": [f"{name}_{i}" for i in range(n)],
+                "coverage_name": name,
+                "shape": shapes,
+                "surveyunit_type": surveyunit_type,
+                "surveyunit_area": shapely.area(shapes),
+                "length": [None] * n if length is None else length,
+                "radius": [radius] * n,
+                "min_time_per_unit": [min_time_per_unit] * n,
+            },
+            geometry="shape",
+        )
+        return coverage
+
     @classmethod
     def from_shapefile(
         cls,
@@ -222,7 +286,8 @@ class Coverage:
             None, in which case the `orientation` parameter is used directly.
         orient_increment : float, optional
             Step size (in degrees) to use when testing different orientations.
-            (the default is 5.0)
+            The best of these is then refined to within 0.01 degrees. (the
+            default is 5.0)
         orient_axis : {'long', 'short'}, optional
             Axis of the area along which to orient the survey units (the
             default is 'long', which creates rows parallel to the longest axis
@@ -247,7 +312,7 @@ class Coverage:
         ), "sweep_width * 2 must be less than or equal to spacing to prevent overlap"
 
         tmp_area = area
-        min_rot_rect = tmp_area.df.geometry[0].minimum_rotated_rectangle
+        min_rot_rect = tmp_area.minimum_rotated_rectangle
         centroid = min_rot_rect.centroid
 
         lines_gs = cls._make_unit_bases(
@@ -271,51 +336,27 @@ class Coverage:
                 min_rect=min_rot_rect, axis=orient_axis
             )
 
-        lines_gs = lines_gs.rotate(orientation, origin=centroid)  # rotate
-        lines_gdf = gpd.GeoDataFrame({"geometry": lines_gs}, geometry="geometry")
+        lines_gs = cls._rotate(lines_gs, orientation, origin=centroid)  # rotate
+        lines_gdf = cls._index_order(
+            gpd.GeoDataFrame({"geometry": lines_gs}, geometry="geometry"), tmp_area
+        )
 
         # clip lines by area
-        lines_clipped = clip_lines_polys(lines_gdf, tmp_area.df)
+        lines_clipped = clip_lines_polys(lines_gdf, tmp_area)
 
-        # buffer transects
+        # buffer transects and clip the buffers by area
         transects_buffer = lines_clipped.buffer(sweep_width)
-        buffer_gdf = gpd.GeoDataFrame(
-            {
-                "orientation": [orientation] * transects_buffer.shape[0],
-                "length": lines_clipped.length,
-                "sweep_width": [sweep_width] * transects_buffer.shape[0],
-                "geometry": transects_buffer,
-            },
-            geometry="geometry",
-        )
-
-        transects = gpd.overlay(buffer_gdf, tmp_area.df, how="intersection")
-        transects = transects.loc[
-            :, ["orientation", "length", "sweep_width", "geometry"]
-        ]
-
-        transects = transects.reset_index()
-        geom_name = transects.geometry.name
-
-        surveyunit_list = transects.apply(
-            lambda row: SurveyUnit(
-                name=f"{name}_{row['index']}",
-                coverage_name=name,
-                shape=row[geom_name],
-                surveyunit_type="transect",
-                length=row["length"],
-                min_time_per_unit=min_time_per_unit,
-            ),
-            axis=1,
-        ).tolist()
+        transects, keep = cls._clip_units(transects_buffer, tmp_area)
 
-        return cls(
+        return cls._from_shapes(
+            transects,
             name=name,
-            surveyunit_list=surveyunit_list,
+            surveyunit_type="transect",
             orientation=orientation,
             spacing=spacing,
             sweep_width=sweep_width,
-            radius=None,
+            length=lines_clipped.length.to_numpy()[keep],
+            min_time_per_unit=min_time_per_unit,
         )
 
     @classmethod
@@ -355,7 +396,8 @@ class Coverage:
             None, in which case the `orientation` parameter is used directly.
         orient_increment : float, optional
             Step size (in degrees) to use when testing different orientations.
-            (the default is 5.0)
+            The best of these is then refined to within 0.01 degrees. (the
+            default is 5.0)
         orient_axis : {'long', 'short'}, optional
             Axis of the area along which to orient the survey units (the
             default is 'long', which creates rows parallel to the longest axis
@@ -379,7 +421,7 @@ class Coverage:
 
         tmp_area = area
 
-        min_rot_rect = tmp_area.df.geometry[0].minimum_rotated_rectangle
+        min_rot_rect = tmp_area.minimum_rotated_rectangle
         centroid = min_rot_rect.centroid
 
         points_gs = cls._make_unit_bases(
@@ -403,51 +445,64 @@ class Coverage:
                 min_rect=min_rot_rect, axis=orient_axis
             )
 
-        points_gs = points_gs.rotate(orientation, origin=centroid)  # rotate
-        points_gdf = gpd.GeoDataFrame({"geometry": points_gs}, geometry="geometry")
-
-        points_clipped = clip_lines_polys(
-            points_gdf, tmp_area.df
-        )  # clip points by area
-
-        points_buffer = points_clipped.buffer(radius)  # buffer points
-        buffer_gdf = gpd.GeoDataFrame(
-            {
-                "orientation": [orientation] * points_buffer.shape[0],
-                "radius": [radius] * points_buffer.shape[0],
-                "geometry": points_buffer,
-            },
-            geometry="geometry",
+        points_gs = cls._rotate(points_gs, orientation, origin=centroid)  # rotate
+        points_gdf = cls._index_order(
+            gpd.GeoDataFrame({"geometry": points_gs}, geometry="geometry"), tmp_area
         )
 
-        radials = gpd.overlay(buffer_gdf, tmp_area.df, how="intersection")
-        radials = radials.loc[:, ["orientation", "radius", "geometry"]]
+        points_clipped = clip_lines_polys(points_gdf, tmp_area)  # clip points by area
 
-        radials = radials.reset_index()
-
-        geom_name = radials.geometry.name
-
-        surveyunit_list = radials.apply(
-            lambda row: SurveyUnit(
-                name=f"{name}_{row.index}",
-                coverage_name=name,
-                shape=row[geom_name],
-                surveyunit_type="radial",
-                radius=radius,
-                min_time_per_unit=min_time_per_unit,
-            ),
-            axis=1,
-        ).tolist()
+        points_buffer = points_clipped.buffer(radius)  # buffer points
+        radials, __ = cls._clip_units(points_buffer, tmp_area)
 
-        return cls(
+        return cls._from_shapes(
+            radials,
             name=name,
-            surveyunit_list=surveyunit_list,
+            surveyunit_type="radial",
             orientation=orientation,
             spacing=spacing,
-            sweep_width=None,
             radius=radius,
+            min_time_per_unit=min_time_per_unit,
         )
 
+    @staticmethod
+    def _index_order(bases: gpd.GeoDataFrame, area: Area) -> gpd.GeoDataFrame:
+        """Subset the unit bases to those overlapping the area's bounding box,
+        in the order of a spatial index query.
+
+        This is the order, and so the naming, of the survey units of coverages
+        built by earlier versions, which is kept so that stored results keep
+        matching.
+        """
+
+        return bases.iloc[bases.sindex.intersection(area.bounds)]
+
+    @staticmethod
+    def _clip_units(
+        buffers: gpd.GeoSeries, area: Area
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Clip buffered survey units by the area.
+
+        Parameters
+        ----------
+        buffers : geopandas GeoSeries
+            Buffered survey units
+        area : Area
+            Containing area
+
+        Returns
+        -------
+        shapes : numpy ndarray
+            Clipped survey unit polygons
+        keep : numpy ndarray
+            Positions of the `buffers` that remain as survey units
+        """
+
+        overlaps, shapes = _clip_by_polygon(buffers.values, area.prepared_shape)
+        # like gpd.overlay, drop units that only touch the area
+        polygonal = shapely.area(shapes) > 0
+        return shapes[polygonal], np.flatnonzero(overlaps)[polygonal]
+
     @staticmethod
     def _gdf_to_surveyunit_list(
         gdf, name, surveyunit_type, min_time_per_unit
@@ -496,9 +551,9 @@ class Coverage:
         # use diagonal distance for transect length
         # use centroid of minimum_rotated_rectangle
 
-        bounds = area.df.bounds
-        width = bounds.maxx.max() - bounds.minx.min()
-        height = bounds.maxy.max() - bounds.miny.max()
+        minx, miny, maxx, maxy = area.bounds
+        width = maxx - minx
+        height = maxy - miny
         diag_dist = sqrt(width ** 2 + height ** 2)
 
         n_transects = int(diag_dist // spacing)
@@ -514,14 +569,11 @@ class Coverage:
             y_max = centroid.y + diag_dist / 2
             y_min = centroid.y - diag_dist / 2
             # make ends of lines
-            top_coords = list(zip(xs, np.full_like(xs, fill_value=y_max)))
-            bottom_coords = list(zip(xs, np.full_like(xs, fill_value=y_min)))
+            top_coords = np.column_stack((xs, np.full_like(xs, fill_value=y_max)))
+            bottom_coords = np.column_stack((xs, np.full_like(xs, fill_value=y_min)))
             # return LineStrings
             gs = gpd.GeoSeries(
-                [
-                    LineString(coord_pair)
-                    for coord_pair in zip(top_coords, bottom_coords)
-                ]
+                shapely.linestrings(np.stack((top_coords, bottom_coords), axis=1))
             )
 
         elif surveyunit_type == "radial":
@@ -530,7 +582,7 @@ class Coverage:
             )
             coord_pairs = np.array(np.meshgrid(xs, ys)).T.reshape(-1, 2)
             # return Points
-            gs = gpd.GeoSeries([Point(xy) for xy in coord_pairs])
+            gs = gpd.GeoSeries(shapely.points(coord_pairs))
 
         return gs
 
@@ -578,10 +630,15 @@ class Coverage:
         area: Area,
         buffer: float = 0.0,
         increment: float = 5.0,
+        tolerance: float = 0.01,
     ) -> float:
         """Find the orientation value that allows maximum coverage of the area
         by survey units.
 
+        All angles in `np.arange(0, 180, increment)` are evaluated at once,
+        then the best of them is refined with a golden-section search within
+        one `increment` on either side.
+
         Parameters
         ----------
         survey_units : geopandas GeoSeries
@@ -597,28 +654,162 @@ class Coverage:
         increment : float, optional
             Step size (in degrees) to use when testing different orientations.
             (the default is 5.0)
+        tolerance : float, optional
+            Width (in degrees) of the bracket at which the golden-section
+            refinement stops (the default is 0.01)
 
         Returns
         -------
         float
         """
 
-        deg_val: Dict[int, float] = {}
-        for deg in np.arange(0, 180, increment):
-            # rotate
-            survey_units_gs = survey_units.rotate(deg, origin=rotation_pt)
-            survey_units_gdf = gpd.GeoDataFrame(
-                {"geometry": survey_units_gs}, geometry="geometry"
-            )
+        coverage_area = Coverage._area_coverage_function(
+            survey_units, rotation_pt, area=area, buffer=buffer
+        )
+
+        degs = np.arange(0, 180, increment)
+        best = degs[np.argmax(coverage_area(degs))]
+        best_val = coverage_area(best)[0]
+
+        # golden-section search for the maximum around the best coarse angle
+        inv_phi = (np.sqrt(5) - 1) / 2
+        a, b = best - increment, best + increment
+        c = b - inv_phi * (b - a)
+        d = a + inv_phi * (b - a)
+        c_val, d_val = coverage_area(np.array([c, d]))
+        while b - a > tolerance:
+            if c_val > d_val:
+                b, d, d_val = d, c, c_val
+                c = b - inv_phi * (b - a)
+                c_val = coverage_area(c)[0]
+            else:
+                a, c, c_val = c, d, d_val
+                d = a + inv_phi * (b - a)
+                d_val = coverage_area(d)[0]
+
+        refined = (a + b) / 2
+        if coverage_area(refined)[0] > best_val:
+            return refined % 180
+        return best
+
+    @staticmethod
+    def _area_coverage_function(
+        survey_units: gpd.GeoSeries,
+        rotation_pt: Point,
+        area: Area,
+        buffer: float = 0.0,
+        max_coords: int = 1_000_000,
+    ) -> Callable[[np.ndarray], np.ndarray]:
+        """Build a function that gives the area covered by the buffered
+        survey units, clipped by the area, for an array of angles.
+
+        Parameters
+        ----------
+        survey_units : geopandas GeoSeries
+            Points or two-point LineStrings to rotate
+        rotation_pt : Point
+            Point around which to pivot the survey unit axis
+        area : Area
+            Containing area
+        buffer : float, optional
+            Buffer around survey unit used to determine the area value (the
+            default is 0.0)
+        max_coords : int, optional
+            Maximum number of rotated coordinates held in memory at once (the
+            default is 1,000,000)
 
-            # clip survey_units by area
-            survey_units_clipped = clip_lines_polys(survey_units_gdf, area.df)
-            survey_units_buffer = survey_units_clipped.buffer(
-                buffer
-            )  # buffer survey_units
-            deg_val[deg] = survey_units_buffer.area.sum()
+        Returns
+        -------
+        Callable[[np.ndarray], np.ndarray]
+            Function of angles (in degrees) returning one area value per angle
+        """
+
+        poly = area.prepared_shape
+
+        n_units = survey_units.shape[0]
+        coords = shapely.get_coordinates(survey_units.values)
+        n_verts = coords.shape[0] // n_units
+
+        is_point = all(survey_units.geom_type == "Point")
+        if is_point:
+            # every buffered point has the same area
+            unit_area = shapely.buffer(Point(0, 0), buffer, quad_segs=16).area
+
+        def coverage_area(degs: np.ndarray) -> np.ndarray:
+            degs = np.atleast_1d(degs)
+            chunk = max(1, max_coords // coords.shape[0])
+            vals = []
+            for i in range(0, degs.shape[0], chunk):
+                xs, ys = Coverage._rotate_xy(
+                    coords[:, 0],
+                    coords[:, 1],
+                    degs[i : i + chunk, np.newaxis],
+                    origin=rotation_pt,
+                )
+                if is_point:
+                    inside = shapely.intersects_xy(poly, xs, ys)
+                    vals.append(inside.sum(axis=1) * unit_area)
+                else:
+                    lines = shapely.linestrings(
+                        np.stack([xs, ys], axis=-1).reshape(-1, n_verts, 2)
+                    )
+                    # only lines that reach the area contribute
+                    hits = shapely.intersects(poly, lines)
+                    clipped = shapely.intersection(lines[hits], poly)
+                    areas = np.zeros(lines.shape[0])
+                    areas[hits] = shapely.area(
+                        shapely.buffer(clipped, buffer, quad_segs=16)
+                    )
+                    vals.append(areas.reshape(-1, n_units).sum(axis=1))
+            return np.concatenate(vals)
+
+        return coverage_area
 
-        return max(deg_val, key=lambda k: deg_val[k])
+    @staticmethod
+    def _rotate_xy(
+        x: np.ndarray, y: np.ndarray, angle: Union[float, np.ndarray], origin: Point
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Rotate coordinates counter-clockwise around a point.
+
+        Parameters
+        ----------
+        x, y : numpy ndarray
+            Coordinates to rotate
+        angle : Union[float, numpy ndarray]
+            Rotation angle(s) in degrees, broadcast against `x` and `y`
+        origin : Point
+            Point around which to rotate
+
+        Returns
+        -------
+        Tuple[numpy ndarray, numpy ndarray]
+            Rotated x and y coordinates
+        """
+
+        rad = np.asarray(angle, dtype=float) * np.pi / 180.0
+        cos, sin = np.atleast_1d(np.cos(rad)), np.atleast_1d(np.sin(rad))
+        # snap like shapely.affinity.rotate so that multiples of 90 degrees
+        # rotate exactly
+        cos[np.abs(cos) < 2.5e-16] = 0.0
+        sin[np.abs(sin) < 2.5e-16] = 0.0
+        # same operation order as shapely.affinity.rotate
+        x0, y0 = origin.x, origin.y
+        xoff = x0 - x0 * cos + y0 * sin
+        yoff = y0 - x0 * sin - y0 * cos
+        return cos * x + -sin * y + xoff, sin * x + cos * y + yoff
+
+    @staticmethod
+    def _rotate(gs: gpd.GeoSeries, angle: float, origin: Point) -> gpd.GeoSeries:
+        """Rotate all geometries of a `GeoSeries` at once."""
+
+        def rotate_coords(coords: np.ndarray) -> np.ndarray:
+            return np.column_stack(
+                Coverage._rotate_xy(coords[:, 0], coords[:, 1], angle, origin)
+            )
+
+        return gpd.GeoSeries(
+            shapely.transform(gs.values, rotate_coords), index=gs.index, crs=gs.crs
+        )
 
     @staticmethod
     def _optimize_orientation_by_area_orient(
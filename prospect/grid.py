@@ -0,0 +1,297 @@
+import collections
+import itertools
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .area import Area
+from .assemblage import Assemblage
+from .coverage import Coverage
+from .layer import Layer
+from .survey import _BUILDING_BLOCKS, Survey, _fingerprint, _resolve
+from .team import Team
+
+_BLOCK_TYPES = {
+    "area": Area,
+    "assemblage": Assemblage,
+    "coverage": Coverage,
+    "team": Team,
+}
+
+
+class SurveyGrid:
+    """Sweep of `Survey` configurations over building block parameters
+
+    Each building block is either fixed, or created by a factory for every
+    combination of a set of parameter values (see `vary()`). The grid runs one
+    `Survey` per combination of blocks. Every configuration uses the same seed,
+    so differences between configurations are not blurred by different random
+    draws.
+
+    Parameters
+    ----------
+    name : str
+        Unique name for the grid
+    area : Area, optional
+    assemblage : Assemblage, optional
+    coverage : Coverage, optional
+    team : Team, optional
+        Fixed building blocks, used by every configuration
+    seed : int, optional
+        Root seed for the random draws of every run (the default is None, which
+        draws fresh entropy from the operating system)
+
+    Attributes
+    ----------
+    name : str
+        Name of the grid
+    seed : int
+        Root seed for the random draws, shared by all configurations
+    """
+
+    def __init__(
+        self,
+        name: str,
+        area: Area = None,
+        assemblage: Assemblage = None,
+        coverage: Coverage = None,
+        team: Team = None,
+        seed: Optional[int] = None,
+    ):
+        """Create a `SurveyGrid` instance"""
+
+        self.name = name
+        self.seed = np.random.SeedSequence(seed).entropy
+
+        # (parameters, block) options of each building block
+        self._options: Dict[str, List[Tuple[Dict[str, Any], Any]]] = {
+            "area": [({}, area)],
+            "assemblage": [({}, assemblage)],
+            "coverage": [({}, coverage)],
+            "team": [({}, team)],
+        }
+        self._factories: Dict[str, Callable[..., Any]] = {}
+
+    def __repr__(self):
+        return f"SurveyGrid(name={repr(self.name)}, n_configs={self.configs.shape[0]})"
+
+    def __str__(self):
+        return f"SurveyGrid object '{self.name}'"
+
+    def vary(self, block: str, factory: Callable[..., Any], **values: List[Any]):
+        """Create a building block for every combination of parameter values.
+
+        Each combination is passed to `factory` as keyword arguments, once.
+        Blocks are shared by all configurations that use them, so a grid over
+        3 coverages and 4 assemblages creates 7 blocks for its 12
+        configurations.
+
+        Parameters
+        ----------
+        block : {'area', 'assemblage', 'coverage', 'team'}
+            Type of building block created by `factory`
+        factory : Callable[..., Any]
+            Function that creates the block, like a `functools.partial` of
+            `Coverage.from_transects`. An assemblage factory may also return a
+            `Layer`, which becomes an `Assemblage` of that layer.
+        **values : List[Any]
+            Values of each parameter of `factory` to sweep over
+        """
+
+        assert block in _BUILDING_BLOCKS, f"`block` must be one of {_BUILDING_BLOCKS}"
+        assert len(values) > 0, "Give the values of at least one parameter"
+        taken = {
+            param
+            for kind in _BUILDING_BLOCKS
+            if kind != block
+            for param in self._options[kind][0][0]
+        }
+        assert taken.isdisjoint(values), "Parameter names must be unique in the grid"
+
+        self._factories[block] = factory
+        self._options[block] = [
+            (dict(zip(values, combination)), None)
+            for combination in itertools.product(*values.values())
+        ]
+
+    @property
+    def configs(self) -> pd.DataFrame:
+        """Parameter values of each configuration, indexed by configuration"""
+
+        combinations = itertools.product(
+            *(self._options[kind] for kind in _BUILDING_BLOCKS)
+        )
+        rows = [
+            {
+                param: value
+                for params, _ in combination
+                for param, value in params.items()
+            }
+            for combination in combinations
+        ]
+        return pd.DataFrame(rows, index=pd.RangeIndex(len(rows), name="config"))
+
+    def surveys(self) -> List[Survey]:
+        """Create the `Survey` of each configuration, in `configs` order.
+
+        Returns
+        -------
+        List[Survey]
+        """
+
+        options = {kind: self._build(kind) for kind in _BUILDING_BLOCKS}
+        return [
+            Survey(
+                name=f"{self.name}_{config}",
+                seed=self.seed,
+                **{kind: block for kind, (_, block) in zip(_BUILDING_BLOCKS, blocks)},
+            )
+            for config, blocks in enumerate(
+                itertools.product(*(options[kind] for kind in _BUILDING_BLOCKS))
+            )
+        ]
+
+    def run(
+        self,
+        n_runs: int,
+        discovery_threshold: float = 0.0,
+        walking_speed: Optional[float] = None,
+        batch_size: int = 100,
+        n_jobs: int = 1,
+        executor: Optional[Executor] = None,
+    ) -> pd.DataFrame:
+        """Resolve `n_runs` runs of every configuration.
+
+        The work that only depends on the building blocks, like finding the
+        survey unit of each feature, is done once per block (or pair of
+        blocks) in the current process and shared by the configurations that
+        use them. The runs of each configuration are then resolved as one
+        task, and tasks are spread over the worker processes.
+
+        Parameters
+        ----------
+        n_runs : int
+            Number of runs per configuration
+        discovery_threshold : float, optional
+            Minimum discovery probability for a feature to be discovered (the
+            default is 0.0). See `Survey.run()`.
+        walking_speed : float, optional
+            Distance covered per unit of time when walking between survey
+            units (the default is None, which ignores walking time). See
+            `Survey.run()`.
+        batch_size : int, optional
+            Maximum number of runs of a configuration resolved together (the
+            default is 100)
+        n_jobs : int, optional
+            Number of worker processes resolving configurations at the same
+            time (the default is 1, which resolves all configurations in the
+            current process)
+        executor : concurrent.futures.Executor, optional
+            Executor to submit the configurations to, instead of creating a
+            new process pool (the default is None)
+
+        Returns
+        -------
+        pandas DataFrame
+            One row per configuration, run and layer, with the parameter
+            values of the configuration, the number of features and of
+            discovered features, and the time totals of the run
+        """
+
+        run_ids = np.arange(n_runs)
+        surveys = self._prepare(self.surveys())
+        args = (run_ids, batch_size, discovery_threshold, walking_speed)
+
+        if executor is None and n_jobs == 1:
+            summaries = [_run_config(survey, *args) for survey in surveys]
+        elif executor is None:
+            with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+                summaries = list(
+                    pool.map(_run_config, surveys, *map(itertools.repeat, args))
+                )
+        else:
+            summaries = list(
+                executor.map(_run_config, surveys, *map(itertools.repeat, args))
+            )
+
+        configs = self.configs
+        for config, summary in enumerate(summaries):
+            summary.insert(0, "config", config)
+            for position, (param, value) in enumerate(
+                configs.iloc[config].items(), start=1
+            ):
+                summary.insert(position, param, value)
+        return pd.concat(summaries, ignore_index=True)
+
+    def _build(self, block: str) -> List[Tuple[Dict[str, Any], Any]]:
+        """Create the blocks of a varied building block, once"""
+
+        options = self._options[block]
+        if block in self._factories:
+            options = [
+                (params, made if made is not None else self._make(block, params))
+                for params, made in options
+            ]
+            self._options[block] = options
+
+        for _, made in options:
+            assert made is not None, f"The grid has no {block}"
+        return options
+
+    def _make(self, block: str, params: Dict[str, Any]) -> Any:
+        """Call the factory of a building block"""
+
+        made = self._factories[block](**params)
+        if block == "assemblage" and isinstance(made, Layer):
+            made = Assemblage(name=made.name, layer_list=[made])
+        assert isinstance(
+            made, _BLOCK_TYPES[block]
+        ), f"The {block} factory must return a {_BLOCK_TYPES[block].__name__}"
+        return made
+
+    @staticmethod
+    def _prepare(surveys: List[Survey]) -> List[Survey]:
+        """Compute the intermediate products of each survey, sharing them
+        between surveys with the same building blocks
+        """
+
+        fingerprints: Dict[int, str] = {}
+        cache: collections.OrderedDict = collections.OrderedDict()
+        prepared = []
+        for survey in surveys:
+            survey._fingerprints = {}
+            for kind in _BUILDING_BLOCKS:
+                block = getattr(survey, kind)
+                if id(block) not in fingerprints:
+                    fingerprints[id(block)] = _fingerprint(block)
+                survey._fingerprints[kind] = fingerprints[id(block)]
+            survey._cache = cache
+            prepared.append(survey._blocks_only())
+        return prepared
+
+
+def _run_config(
+    survey: Survey,
+    run_ids: np.ndarray,
+    batch_size: int,
+    discovery_threshold: float,
+    walking_speed: Optional[float],
+) -> pd.DataFrame:
+    """Resolve the runs of one configuration and summarize them by run and
+    layer
+    """
+
+    summaries = []
+    for start in range(0, run_ids.shape[0], batch_size):
+        resolved = _resolve(
+            survey,
+            run_ids[start : start + batch_size],
+            discovery_threshold=discovery_threshold,
+            walking_speed=walking_speed,
+        )
+        summaries.append(
+            resolved.discovery_counts.merge(resolved.time_team, on="run", how="left")
+        )
+    return pd.concat(summaries, ignore_index=True)
@@ -1,14 +1,15 @@
-from typing import List, Tuple, Union
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
 
 import geopandas as gpd
 import numpy as np
-from scipy.stats import norm, poisson, uniform
+import pandas as pd
+import shapely
 from scipy.stats._distn_infrastructure import rv_frozen
-from shapely.geometry import Point
 
 from .area import Area
 from .feature import Feature
-from .utils import clip_points
+from .utils import _get_rng, clip_points
 
 
 class Layer:
@@ -44,17 +45,296 @@ class Layer:
         """Create a `Layer` instance."""
 
         self.name = name
-        self.input_features = input_features
+        self._input_features = input_features
+        self._input_df = None
 
         self.df = gpd.GeoDataFrame(
-            [feature.to_dict() for feature in self.input_features],
+            [feature.to_dict() for feature in input_features],
             geometry="shape",
         )
+        self._clip(area)
 
-        # clip by area
-        if all(self.df.geom_type == "Point"):
+    def _clip(self, area: Area):
+        """Clip point layers by the area bounds."""
+
+        if (self.df.geom_type == "Point").all():
             tmp_area = area
-            self.df = clip_points(self.df, tmp_area.df)
+            self.df = clip_points(self.df, tmp_area)
+
+    @property
+    def input_features(self) -> List[Feature]:
+        """List of features that originally made up the Layer (before clipping).
+
+        Layers built from arrays only create the `Feature` objects when this
+        is first accessed.
+        """
+
+        if self._input_features is None:
+            self._input_features = [
+                Feature(
+                    name=row.feature_name,
+                    layer_name=row.layer_name,
+                    shape=row.shape,
+                    time_penalty=row.time_penalty,
+                    ideal_obs_rate=row.ideal_obs_rate,
+                )
+                for row in self._input_df.itertuples(index=False)
+            ]
+        return self._input_features
+
+    @classmethod
+    def _from_shapes(
+        cls,
+        shapes: np.ndarray,
+        name: str,
+        area: Area,
+        time_penalty: Union[float, rv_frozen, np.ndarray] = 0.0,
+        ideal_obs_rate: Union[float, rv_frozen, np.ndarray] = 1.0,
+        feature_names: Optional[np.ndarray] = None,
+        crs=None,
+    ) -> "Layer":
+        """Build `df` directly from an array of geometries, deferring the
+        creation of `Feature` objects until `input_features` is accessed.
+
+        `time_penalty` and `ideal_obs_rate` may also be arrays with one value
+        per geometry."""
+
+        n = len(shapes)
+        if feature_names is None:
+            feature_names = [f"{name}_{i}" for i in range(n)]
+
+        layer = cls.__new__(cls)
+        layer.name = name
+        layer._input_features = None
+        layer._input_df = gpd.GeoDataFrame(
+            {
+                "feature_name": feature_names,
+                "layer_name": name,
+                "shape": shapes,
+                "time_penalty": _per_feature(time_penalty, n),
+                "ideal_obs_rate": _per_feature(ideal_obs_rate, n),
+            },
+            geometry="shape",
+            crs=crs,
+        )
+        layer.df = layer._input_df
+        layer._clip(area)
+        return layer
+
+    @classmethod
+    def from_coordinates(
+        cls,
+        xy: np.ndarray,
+        name: str,
+        area: Area,
+        time_penalty: Union[float, rv_frozen] = 0.0,
+        ideal_obs_rate: Union[float, rv_frozen] = 1.0,
+    ) -> "Layer":
+        """Create a `Layer` instance of points from an array of coordinates.
+
+        Parameters
+        ----------
+        xy : np.ndarray
+            Array of shape (n, 2) with the x and y coordinates of each point
+        name : str
+            Unique name for the layer
+        area : Area
+            Containing area
+        time_penalty : Union[float, rv_frozen], optional
+            Minimum amount of time it takes to record a feature (the default is 0.0, which indicates no time cost for feature recording)
+        ideal_obs_rate : Union[float, rv_frozen], optional
+            Ideal observation rate: the frequency with which an artifact or feature will be recorded, assuming the following ideal conditions:
+
+            - It lies inside or intersects the Coverage
+            - Surface visibility is 100%
+            - The surveyor is highly skilled
+
+            The default is 1.0, which indicates that when visibility and surveyor skill allow, the feature will always be recorded.
+
+        Returns
+        -------
+        Layer
+
+        Notes
+        -----
+        The points are clipped by the area bounds, which can result in fewer points in `df` than coordinates given. All points will remain in the `input_features`.
+        """
+
+        xy = np.asarray(xy, dtype=float)
+        assert xy.ndim == 2 and xy.shape[1] == 2, "xy must have shape (n, 2)"
+
+        return cls._from_shapes(
+            gpd.points_from_xy(xy[:, 0], xy[:, 1]),
+            name=name,
+            area=area,
+            time_penalty=time_penalty,
+            ideal_obs_rate=ideal_obs_rate,
+        )
+
+    @classmethod
+    def from_dataframe(
+        cls,
+        df: pd.DataFrame,
+        name: str,
+        area: Area,
+        x: str = "x",
+        y: str = "y",
+        time_penalty: Union[float, rv_frozen, str] = 0.0,
+        ideal_obs_rate: Union[float, rv_frozen, str] = 1.0,
+        feature_name: Optional[str] = None,
+        crs=None,
+    ) -> "Layer":
+        """Create a `Layer` instance of points from coordinate columns of a
+        `DataFrame`, like a table of finds from field walking.
+
+        Points and `df` are built from whole columns at once, so `Feature`
+        objects are only created if `input_features` is accessed.
+
+        Parameters
+        ----------
+        df : pandas DataFrame
+            Table with a row for each feature
+        name : str
+            Unique name for the layer
+        area : Area
+            Containing area
+        x, y : str, optional
+            Columns holding the coordinates of each feature (the defaults are
+            'x' and 'y')
+        time_penalty : Union[float, rv_frozen, str], optional
+            Minimum amount of time it takes to record a feature, or the name
+            of the column that holds it for each feature (the default is 0.0,
+            which indicates no time cost for feature recording)
+        ideal_obs_rate : Union[float, rv_frozen, str], optional
+            Ideal observation rate, or the name of the column that holds it
+            for each feature (the default is 1.0). See `from_coordinates()`.
+        feature_name : str, optional
+            Column holding a unique name for each feature, like a find id
+            (the default is None, which names the features after the layer)
+        crs : optional
+            Coordinate reference system of the coordinates (the default is
+            None)
+
+        Returns
+        -------
+        Layer
+
+        Notes
+        -----
+        The points are clipped by the area bounds, and rows without
+        coordinates are dropped from `df`. All rows will remain in the
+        `input_features`.
+        """
+
+        def _column_or_value(value):
+            if isinstance(value, str):
+                return df[value].to_numpy(dtype=float)
+            return value
+
+        return cls._from_shapes(
+            gpd.points_from_xy(
+                df[x].to_numpy(dtype=float), df[y].to_numpy(dtype=float)
+            ),
+            name=name,
+            area=area,
+            time_penalty=_column_or_value(time_penalty),
+            ideal_obs_rate=_column_or_value(ideal_obs_rate),
+            feature_names=(
+                None if feature_name is None else df[feature_name].to_numpy()
+            ),
+            crs=crs,
+        )
+
+    @classmethod
+    def from_csv(
+        cls,
+        path: Union[str, Path],
+        name: str,
+        area: Area,
+        x: str = "x",
+        y: str = "y",
+        time_penalty: Union[float, rv_frozen, str] = 0.0,
+        ideal_obs_rate: Union[float, rv_frozen, str] = 1.0,
+        feature_name: Optional[str] = None,
+        crs=None,
+        chunksize: int = 1_000_000,
+        **kwargs,
+    ) -> "Layer":
+        """Create a `Layer` instance of points from coordinate columns of a
+        CSV file, like `pottery.csv` of a field-walking survey.
+
+        Only the columns that are used are read, in chunks of `chunksize`
+        rows. Each chunk is reduced to the coordinates and attributes of its
+        features before the next one is read, so the table itself is never
+        held in memory as a whole.
+
+        Parameters
+        ----------
+        path : Union[str, Path]
+            Path to the CSV file
+        name : str
+            Unique name for the layer
+        area : Area
+            Containing area
+        x, y : str, optional
+            Columns holding the coordinates of each feature (the defaults are
+            'x' and 'y')
+        time_penalty : Union[float, rv_frozen, str], optional
+            Minimum amount of time it takes to record a feature, or the name
+            of the column that holds it (the default is 0.0)
+        ideal_obs_rate : Union[float, rv_frozen, str], optional
+            Ideal observation rate, or the name of the column that holds it
+            (the default is 1.0)
+        feature_name : str, optional
+            Column holding a unique name for each feature (the default is
+            None, which names the features after the layer)
+        crs : optional
+            Coordinate reference system of the coordinates (the default is
+            None)
+        chunksize : int, optional
+            Number of rows read at a time (the default is 1,000,000)
+        **kwargs : dict, optional
+            Keyword arguments for `pandas.read_csv()`
+
+        Returns
+        -------
+        Layer
+        """
+
+        # columns to read, keyed on the values they hold
+        columns = {
+            key: col
+            for key, col in [
+                ("x", x),
+                ("y", y),
+                ("time_penalty", time_penalty),
+                ("ideal_obs_rate", ideal_obs_rate),
+                ("feature_name", feature_name),
+            ]
+            if isinstance(col, str)
+        }
+        parts: Dict[str, List[np.ndarray]] = {key: [] for key in columns}
+        for chunk in pd.read_csv(
+            path, usecols=set(columns.values()), chunksize=chunksize, **kwargs
+        ):
+            for key, col in columns.items():
+                parts[key].append(
+                    chunk[col].to_numpy(dtype=None if key == "feature_name" else float)
+                )
+        values = {
+            key: np.concatenate(arrays) if arrays else np.empty(0)
+            for key, arrays in parts.items()
+        }
+
+        return cls._from_shapes(
+            gpd.points_from_xy(values["x"], values["y"]),
+            name=name,
+            area=area,
+            time_penalty=values.get("time_penalty", time_penalty),
+            ideal_obs_rate=values.get("ideal_obs_rate", ideal_obs_rate),
+            feature_names=values.get("feature_name"),
+            crs=crs,
+        )
 
     @classmethod
     def from_shapefile(
@@ -93,22 +373,13 @@ class Layer:
         """
 
         tmp_gdf = gpd.read_file(path, **kwargs)
-        shape_list = tmp_gdf.geometry.tolist()
-        feature_list = [
-            Feature(
-                name=f"{name}_{i}",
-                layer_name=name,
-                shape=shape_list[i],
-                time_penalty=time_penalty,
-                ideal_obs_rate=ideal_obs_rate,
-            )
-            for i in range(len(shape_list))
-        ]
-
-        return cls(
+
+        return cls._from_shapes(
+            tmp_gdf.geometry.values,
             name=name,
             area=area,
-            input_features=feature_list,
+            time_penalty=time_penalty,
+            ideal_obs_rate=ideal_obs_rate,
         )
 
     @classmethod
@@ -119,6 +390,7 @@ class Layer:
         area: Area,
         time_penalty: Union[float, rv_frozen] = 0.0,
         ideal_obs_rate: Union[float, rv_frozen] = 1.0,
+        rng: Optional[Union[np.random.Generator, int]] = None,
     ) -> "Layer":
         """Create a `Layer` instance of pseudorandom points
 
@@ -140,6 +412,9 @@ class Layer:
             - The surveyor is highly skilled
 
             The default is 1.0, which indicates that when visibility and surveyor skill allow, the feature will always be recorded.
+        rng : Union[numpy.random.Generator, int], optional
+            Random number generator, or seed for a new one (the default is
+            None, which uses numpy's global random state)
 
         Returns
         -------
@@ -152,36 +427,31 @@ class Layer:
         from_matern_points : good for clusters with centers from Poisson points
         """
 
+        rng = _get_rng(rng)
         tmp_area = area
-        bounds = tmp_area.df.total_bounds
-
-        n_pts: int = 0
-        feature_list: List[Feature] = []
-        while n_pts < n:
-            xs = (np.random.random(1) * (bounds[2] - bounds[0])) + bounds[0]
-            ys = (np.random.random(1) * (bounds[3] - bounds[1])) + bounds[1]
-            points_gds = gpd.GeoSeries([Point(xy) for xy in zip(xs, ys)])
-            shape_list = points_gds.geometry.tolist()
-            feature = Feature(
-                name=f"{name}_{n_pts}",
-                layer_name=name,
-                shape=shape_list[0],
-                time_penalty=time_penalty,
-                ideal_obs_rate=ideal_obs_rate,
-            )
-
-            tmp_df = gpd.GeoDataFrame([feature.to_dict()], geometry="shape")
-
-            # clip by area
-            clipped_df = clip_points(tmp_df, tmp_area.df)
-            if clipped_df.shape[0] > 0:
-                feature_list.append(feature)
-                n_pts += 1
-
-        return cls(
+        bounds = tmp_area.bounds
+        poly = tmp_area.prepared_shape
+
+        # oversample by the bounding box to area ratio so that one batch
+        # usually suffices, then draw again only for the shortfall
+        bbox_ratio = (bounds[2] - bounds[0]) * (bounds[3] - bounds[1]) / tmp_area.area
+
+        xs = np.empty(0)
+        ys = np.empty(0)
+        while xs.size < n:
+            n_draw = int(np.ceil((n - xs.size) * bbox_ratio * 1.1)) + 10
+            cand_xs = rng.uniform(bounds[0], bounds[2], n_draw)
+            cand_ys = rng.uniform(bounds[1], bounds[3], n_draw)
+            inside = shapely.intersects_xy(poly, cand_xs, cand_ys)
+            xs = np.concatenate([xs, cand_xs[inside]])
+            ys = np.concatenate([ys, cand_ys[inside]])
+
+        return cls.from_coordinates(
+            np.column_stack((xs[:n], ys[:n])),
             name=name,
             area=area,
-            input_features=feature_list,
+            time_penalty=time_penalty,
+            ideal_obs_rate=ideal_obs_rate,
         )
 
     @classmethod
@@ -192,6 +462,7 @@ class Layer:
         area: Area,
         time_penalty: Union[float, rv_frozen] = 0.0,
         ideal_obs_rate: Union[float, rv_frozen] = 1.0,
+        rng: Optional[Union[np.random.Generator, int]] = None,
     ) -> "Layer":
         """Create a `Layer` instance of points with a Poisson point process
 
@@ -213,6 +484,9 @@ class Layer:
             - The surveyor is highly skilled
 
             The default is 1.0, which indicates that when visibility and surveyor skill allow, the feature will always be recorded.
+        rng : Union[numpy.random.Generator, int], optional
+            Random number generator, or seed for a new one (the default is
+            None, which uses numpy's global random state)
 
         Returns
         -------
@@ -231,27 +505,16 @@ class Layer:
         """
 
         tmp_area = area
-        points = cls.poisson_points(tmp_area, rate)
-        points_gds = gpd.GeoSeries([Point(xy) for xy in points])
-        shape_list = points_gds.geometry.tolist()
+        points = cls.poisson_points(tmp_area, rate, rng=rng)
         # check to see that some points were created
-        assert len(shape_list) > 0, "Parameters resulted in zero points"
-
-        feature_list = [
-            Feature(
-                name=f"{name}_{i}",
-                layer_name=name,
-                shape=shape_list[i],
-                time_penalty=time_penalty,
-                ideal_obs_rate=ideal_obs_rate,
-            )
-            for i in range(len(shape_list))
-        ]
-
-        return cls(
+        assert points.shape[0] > 0, "Parameters resulted in zero points"
+
+        return cls.from_coordinates(
+            points,
             name=name,
             area=area,
-            input_features=feature_list,
+            time_penalty=time_penalty,
+            ideal_obs_rate=ideal_obs_rate,
         )
 
     @classmethod
@@ -264,6 +527,7 @@ class Layer:
         area: Area,
         time_penalty: Union[float, rv_frozen] = 0.0,
         ideal_obs_rate: Union[float, rv_frozen] = 1.0,
+        rng: Optional[Union[np.random.Generator, int]] = None,
     ) -> "Layer":
         """Create a `Layer` instance with a Thomas point process.
 
@@ -291,6 +555,9 @@ class Layer:
             - The surveyor is highly skilled
 
             The default is 1.0, which indicates that when visibility and surveyor skill allow, the feature will always be recorded.
+        rng : Union[numpy.random.Generator, int], optional
+            Random number generator, or seed for a new one (the default is
+            None, which uses numpy's global random state)
 
         Returns
         -------
@@ -310,38 +577,25 @@ class Layer:
         2. The generated point coordinates are not guaranteed to fall within the given area, only within its bounding box. The generated GeoDataFrame, `df`, is clipped by the actual area bounds *after* they are generated, which can result in fewer points than expected. All points will remain in the `input_features`.
         """
 
+        rng = _get_rng(rng)
         tmp_area = area
-        parents = cls.poisson_points(tmp_area, parent_rate)
+        parents = cls.poisson_points(tmp_area, parent_rate, rng=rng)
         M = parents.shape[0]
 
-        points = list()
-        for i in range(M):
-            N = poisson(child_rate).rvs()
-            for __ in range(N):
-                pdf = norm(loc=parents[i, :2], scale=(gauss_var, gauss_var))
-                points.append(list(pdf.rvs(2)))
-        points = np.array(points)
-        points_gds = gpd.GeoSeries([Point(xy) for xy in points])
-        shape_list = points_gds.geometry.tolist()
+        # draw all child counts at once, then offset every child from its parent
+        N = rng.poisson(child_rate, size=M)
+        centers = np.repeat(parents, N, axis=0)
+        points = centers + rng.normal(0.0, gauss_var, size=centers.shape)
 
         # check to see that some points were created
-        assert len(shape_list) > 0, "Parameters resulted in zero points"
-
-        feature_list = [
-            Feature(
-                name=f"{name}_{i}",
-                layer_name=name,
-                shape=shape_list[i],
-                time_penalty=time_penalty,
-                ideal_obs_rate=ideal_obs_rate,
-            )
-            for i in range(len(shape_list))
-        ]
-
-        return cls(
+        assert points.shape[0] > 0, "Parameters resulted in zero points"
+
+        return cls.from_coordinates(
+            points,
             name=name,
             area=area,
-            input_features=feature_list,
+            time_penalty=time_penalty,
+            ideal_obs_rate=ideal_obs_rate,
         )
 
     @classmethod
@@ -354,6 +608,7 @@ class Layer:
         area: Area,
         time_penalty: Union[float, rv_frozen] = 0.0,
         ideal_obs_rate: Union[float, rv_frozen] = 1.0,
+        rng: Optional[Union[np.random.Generator, int]] = None,
     ) -> "Layer":
         """Create a `Layer` instance with a Matérn point process.
 
@@ -381,6 +636,9 @@ class Layer:
             - The surveyor is highly skilled
 
             The default is 1.0, which indicates that when visibility and surveyor skill allow, the feature will always be recorded.
+        rng : Union[numpy.random.Generator, int], optional
+            Random number generator, or seed for a new one (the default is
+            None, which uses numpy's global random state)
 
         Returns
         -------
@@ -401,42 +659,33 @@ class Layer:
         2. The generated point coordinates are not guaranteed to fall within the given area, only within its bounding box. The generated GeoDataFrame, `df`, is clipped by the actual area bounds *after* they are generated, which can result in fewer points than expected. All points will remain in the `input_features`.
         """
 
+        rng = _get_rng(rng)
         tmp_area = area
-        parents = cls.poisson_points(tmp_area, parent_rate)
+        parents = cls.poisson_points(tmp_area, parent_rate, rng=rng)
         M = parents.shape[0]
 
-        points = list()
-        for i in range(M):
-            N = poisson(child_rate).rvs()
-            for __ in range(N):
-                x, y = cls.uniform_disk(parents[i, 0], parents[i, 1], radius)
-                points.append([x, y])
-        points = np.array(points)
-        points_gds = gpd.GeoSeries([Point(xy) for xy in points])
-        shape_list = points_gds.geometry.tolist()
+        # draw all child counts at once, then place every child in its parent's disk
+        N = rng.poisson(child_rate, size=M)
+        centers = np.repeat(parents, N, axis=0)
+        xs, ys = cls.uniform_disk(centers[:, 0], centers[:, 1], radius, rng=rng)
 
         # check to see that some points were created
-        assert len(shape_list) > 0, "Parameters resulted in zero points"
-
-        feature_list = [
-            Feature(
-                name=f"{name}_{i}",
-                layer_name=name,
-                shape=shape_list[i],
-                time_penalty=time_penalty,
-                ideal_obs_rate=ideal_obs_rate,
-            )
-            for i in range(len(shape_list))
-        ]
-
-        return cls(
+        assert xs.shape[0] > 0, "Parameters resulted in zero points"
+
+        return cls.from_coordinates(
+            np.column_stack((xs, ys)),
             name=name,
             area=area,
-            input_features=feature_list,
+            time_penalty=time_penalty,
+            ideal_obs_rate=ideal_obs_rate,
         )
 
     @staticmethod
-    def poisson_points(area: Area, rate: float) -> np.ndarray:
+    def poisson_points(
+        area: Area,
+        rate: float,
+        rng: Optional[Union[np.random.Generator, int]] = None,
+    ) -> np.ndarray:
         """Create point coordinates from a Poisson process.
 
         Parameters
@@ -445,6 +694,9 @@ class Layer:
             Bounding area
         rate : float
             Theoretical events per unit area across the whole space. See Notes for more details
+        rng : Union[numpy.random.Generator, int], optional
+            Random number generator, or seed for a new one (the default is
+            None, which uses numpy's global random state)
 
         Returns
         -------
@@ -464,34 +716,46 @@ class Layer:
         2. The rate (usually called "lambda") of the Poisson point process represents the number of events per unit of area per unit of time across some theoretical space of which our `Area` is some subset. In this case, we only have one unit of time, so the rate really represents a theoretical number of events per unit area. For example, if the specified rate is 5, in any 1x1 square, the number of points observed will be drawn randomly from a Poisson distribution with a shape parameter of 5. In practical terms, this means that over many 1x1 areas (or many observations of the same area), the mean number of points observed in that area will approximate 5.
         """
 
-        bounds = area.df.total_bounds
+        bounds = area.bounds
         dx = bounds[2] - bounds[0]
         dy = bounds[3] - bounds[1]
 
-        N = poisson(rate * dx * dy).rvs()
-        xs = uniform.rvs(0, dx, ((N, 1))) + bounds[0]
-        ys = uniform.rvs(0, dy, ((N, 1))) + bounds[1]
+        rng = _get_rng(rng)
+        N = rng.poisson(rate * dx * dy)
+        xs = rng.uniform(0, dx, size=(N, 1)) + bounds[0]
+        ys = rng.uniform(0, dy, size=(N, 1)) + bounds[1]
         return np.hstack((xs, ys))
 
     @staticmethod
-    def uniform_disk(x: float, y: float, r: float) -> Tuple[float, float]:
+    def uniform_disk(
+        x: Union[float, np.ndarray],
+        y: Union[float, np.ndarray],
+        r: float,
+        rng: Optional[Union[np.random.Generator, int]] = None,
+    ) -> Tuple[Union[float, np.ndarray], Union[float, np.ndarray]]:
         """Randomly locate a point within a disk of specified radius
 
         Parameters
         ----------
-        x, y : float
-            Coordinates of disk center
+        x, y : Union[float, np.ndarray]
+            Coordinates of disk center, or arrays of coordinates to locate one
+            point in each of many disks at once
         r : float
             Radius of the disk
+        rng : Union[numpy.random.Generator, int], optional
+            Random number generator, or seed for a new one (the default is
+            None, which uses numpy's global random state)
 
         Returns
         -------
-        Tuple[float, float]
-            Random point within the disk
+        Tuple[Union[float, np.ndarray], Union[float, np.ndarray]]
+            Random point within the disk (or arrays of points, one per disk)
         """
 
-        r = uniform(0, r ** 2.0).rvs()
-        theta = uniform(0, 2 * np.pi).rvs()
+        rng = _get_rng(rng)
+        size = np.shape(x) or None
+        r = rng.uniform(0, r ** 2.0, size=size)
+        theta = rng.uniform(0, 2 * np.pi, size=size)
         xt = np.sqrt(r) * np.cos(theta)
         yt = np.sqrt(r) * np.sin(theta)
         return x + xt, y + yt
@@ -513,3 +777,14 @@ class Layer:
         raise NotImplementedError(
             "`from_rectangles()` will be available in a future version of prospect"
         )
+
+
+def _per_feature(
+    value: Union[float, rv_frozen, np.ndarray], n: int
+) -> Union[list, np.ndarray]:
+    """Column of `n` values from one value, or from an array of values"""
+
+    if isinstance(value, np.ndarray):
+        assert value.shape == (n,), "Need one value per feature"
+        return value
+    return [value] * n
@@ -0,0 +1,339 @@
+import json
+from numbers import Number
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import geopandas as gpd
+import pandas as pd
+from pandas.api.types import is_object_dtype
+
+
+class SurveyResults:
+    """Lazy handle on `Survey` results stored on disk
+
+    Results are stored as a directory with one subdirectory per table
+    (`discovery`, `discovery_counts`, `time_surveyunit`, `time_surveyor`, and
+    `time_team`). Each subdirectory holds one Parquet file per chunk of runs
+    and configuration, named after the range of runs it contains and the id
+    of the configuration it was resolved with. Nothing is read until a table
+    is requested, and only the files that hold the requested runs are opened,
+    memory-mapped. The static tables of the building blocks (`area`,
+    `features`, `surveyunits`, and `surveyors`) are stored in a `blocks`
+    subdirectory, and the survey's name, seed and configurations in
+    `survey.json`. Reading and writing requires the
+    `pyarrow` package.
+
+    Parameters
+    ----------
+    path : Union[str, Path]
+        Directory where the results are stored
+
+    Attributes
+    ----------
+    path : Path
+        Directory where the results are stored
+    """
+
+    TABLES = (
+        "discovery",
+        "discovery_counts",
+        "time_surveyunit",
+        "time_surveyor",
+        "time_team",
+    )
+
+    BLOCKS = ("area", "features", "surveyunits", "surveyors")
+
+    def __init__(self, path: Union[str, Path]):
+        """Create a `SurveyResults` instance"""
+
+        self.path = Path(path)
+
+    def __repr__(self):
+        return f"SurveyResults(path={repr(str(self.path))})"
+
+    def __str__(self):
+        return f"SurveyResults stored in '{self.path}'"
+
+    @property
+    def discovery(self) -> pd.DataFrame:
+        """All rows of the `discovery` table"""
+        return self.read("discovery")
+
+    @property
+    def discovery_counts(self) -> pd.DataFrame:
+        """All rows of the `discovery_counts` table"""
+        return self.read("discovery_counts")
+
+    @property
+    def time_surveyunit(self) -> pd.DataFrame:
+        """All rows of the `time_surveyunit` table"""
+        return self.read("time_surveyunit")
+
+    @property
+    def time_surveyor(self) -> pd.DataFrame:
+        """All rows of the `time_surveyor` table"""
+        return self.read("time_surveyor")
+
+    @property
+    def time_team(self) -> pd.DataFrame:
+        """All rows of the `time_team` table"""
+        return self.read("time_team")
+
+    @property
+    def total_time(self) -> float:
+        """Sum of `total_time_per_surveyunit` over all stored runs"""
+        return self.read("time_surveyunit", columns=["total_time_per_surveyunit"])[
+            "total_time_per_surveyunit"
+        ].sum()
+
+    @property
+    def area(self) -> gpd.GeoDataFrame:
+        """Static table of the `Area`"""
+        return self.read_block("area")
+
+    @property
+    def features(self) -> gpd.GeoDataFrame:
+        """Static table of the features, like `Survey.features`"""
+        return self.read_block("features")
+
+    @property
+    def surveyunits(self) -> gpd.GeoDataFrame:
+        """Static table of the survey units, like `Survey.surveyunits`"""
+        return self.read_block("surveyunits")
+
+    @property
+    def surveyors(self) -> pd.DataFrame:
+        """Static table of the surveyors, like `Survey.surveyors`"""
+        return self.read_block("surveyors")
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Name, seed and configurations of the survey (empty if not stored)"""
+
+        path = self.path / "survey.json"
+        if not path.exists():
+            return {}
+        return json.loads(path.read_text())
+
+    @property
+    def runs(self) -> List[Tuple[int, int]]:
+        """First and last run id of the stored chunks"""
+        return sorted({run_range for run_range, _ in self._parts("time_surveyor")})
+
+    def next_run_id(self, config: Optional[str] = None) -> int:
+        """One past the largest run id stored for a configuration.
+
+        Parameters
+        ----------
+        config : str, optional
+            Id of the configuration (the default is None, for chunks stored
+            without a `config` column)
+
+        Returns
+        -------
+        int
+            0 if no runs of `config` are stored
+        """
+
+        lasts = [
+            last
+            for table in self.TABLES
+            for (_, last), part in self._parts(table)
+            if _part_config(part) == config
+        ]
+        return max(lasts, default=-1) + 1
+
+    def append(self, **tables: pd.DataFrame):
+        """Write one chunk of runs.
+
+        Each configuration in the chunk is written to its own file. Runs are
+        never replaced: chunks whose run range overlaps the stored runs of the
+        same configuration are refused, and nothing is written.
+
+        Parameters
+        ----------
+        **tables : pandas DataFrame
+            Tables to write, by name. Each must have a `run` column, and may
+            have a `config` column.
+
+        Raises
+        ------
+        FileExistsError
+            If runs of a configuration in `tables` are already stored
+        """
+
+        parts = []
+        for table, df in tables.items():
+            if table not in self.TABLES:
+                raise ValueError(
+                    f"Unknown table '{table}'. Expected one of {self.TABLES}."
+                )
+            if "config" in df.columns:
+                by_config = df.groupby("config", observed=True, sort=False)
+            else:
+                by_config = [(None, df)]
+            for config, chunk in by_config:
+                if chunk.shape[0] == 0:
+                    continue
+                first, last = int(chunk["run"].min()), int(chunk["run"].max())
+                self._check_free(table, config, first, last)
+                name = f"runs_{first:08d}_{last:08d}"
+                if config is not None:
+                    name = f"{name}_{config}"
+                parts.append((self.path / table / f"{name}.parquet", chunk))
+
+        for part, chunk in parts:
+            part.parent.mkdir(parents=True, exist_ok=True)
+            chunk.to_parquet(part, index=False)
+
+    def write_blocks(self, metadata: Dict[str, Any], **blocks: pd.DataFrame):
+        """Write the static tables of the building blocks, replacing any
+        stored ones.
+
+        Columns that hold distributions or other objects are stored as their
+        text representation.
+
+        Parameters
+        ----------
+        metadata : Dict[str, Any]
+            JSON-serializable description of the survey
+        **blocks : pandas DataFrame
+            Tables to write, by name
+        """
+
+        for block, df in blocks.items():
+            if block not in self.BLOCKS:
+                raise ValueError(
+                    f"Unknown block '{block}'. Expected one of {self.BLOCKS}."
+                )
+            block_dir = self.path / "blocks"
+            block_dir.mkdir(parents=True, exist_ok=True)
+            _storable(df).to_parquet(block_dir / f"{block}.parquet", index=False)
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        (self.path / "survey.json").write_text(json.dumps(metadata, indent=2))
+
+    def read_block(self, block: str, columns: Optional[List[str]] = None):
+        """Read the static table of a building block.
+
+        Parameters
+        ----------
+        block : {'area', 'features', 'surveyunits', 'surveyors'}
+            Name of the table
+        columns : List[str], optional
+            Columns to read (the default is None, which reads all columns)
+
+        Returns
+        -------
+        pandas DataFrame or geopandas GeoDataFrame
+        """
+
+        if block not in self.BLOCKS:
+            raise ValueError(f"Unknown block '{block}'. Expected one of {self.BLOCKS}.")
+        return self._read_part(self.path / "blocks" / f"{block}.parquet", columns)
+
+    def read(
+        self,
+        table: str,
+        columns: Optional[List[str]] = None,
+        runs: Optional[Iterable[int]] = None,
+    ) -> pd.DataFrame:
+        """Read a table, or selected columns and runs of it.
+
+        Parameters
+        ----------
+        table : {'discovery', 'discovery_counts', 'time_surveyunit', 'time_surveyor', 'time_team'}
+            Name of the table
+        columns : List[str], optional
+            Columns to read (the default is None, which reads all columns)
+        runs : Iterable[int], optional
+            Run ids to read (the default is None, which reads all runs)
+
+        Returns
+        -------
+        pandas DataFrame or geopandas GeoDataFrame
+            A `GeoDataFrame` if the table is stored with its geometry column
+            and that column is read
+        """
+
+        if table not in self.TABLES:
+            raise ValueError(f"Unknown table '{table}'. Expected one of {self.TABLES}.")
+
+        parts = self._parts(table)
+        kwargs = {}
+        if runs is not None:
+            runs = sorted(int(run) for run in runs)
+            parts = [
+                (run_range, part)
+                for run_range, part in parts
+                if any(run_range[0] <= run <= run_range[1] for run in runs)
+            ]
+            kwargs["filters"] = [("run", "in", runs)]
+
+        if len(parts) == 0:
+            return pd.DataFrame(columns=columns)
+
+        frames = [self._read_part(part, columns, **kwargs) for _, part in parts]
+        return pd.concat(frames, ignore_index=True)
+
+    @staticmethod
+    def _read_part(
+        part: Path, columns: Optional[List[str]] = None, **kwargs
+    ) -> pd.DataFrame:
+        """Read one Parquet file, as a `GeoDataFrame` if it has geometries"""
+
+        import pyarrow.parquet as pq
+
+        geo = (pq.read_schema(part).metadata or {}).get(b"geo")
+        if geo is not None and (
+            columns is None or any(col in columns for col in json.loads(geo)["columns"])
+        ):
+            return gpd.read_parquet(part, columns=columns, memory_map=True, **kwargs)
+        return pd.read_parquet(part, columns=columns, memory_map=True, **kwargs)
+
+    def _check_free(self, table: str, config: Optional[str], first: int, last: int):
+        """Raise `FileExistsError` if any of runs `first` to `last` of
+        `config` are stored in `table`
+        """
+
+        for (stored_first, stored_last), part in self._parts(table):
+            if (
+                _part_config(part) == config
+                and stored_first <= last
+                and first <= stored_last
+            ):
+                raise FileExistsError(
+                    f"Runs {first} to {last} overlap the runs stored in '{part}'."
+                )
+
+    def _parts(self, table: str) -> List[Tuple[Tuple[int, int], Path]]:
+        """Find the stored chunks of a table, sorted by run"""
+
+        parts = []
+        for part in (self.path / table).glob("runs_*.parquet"):
+            _, first, last = part.stem.split("_")[:3]
+            parts.append(((int(first), int(last)), part))
+        return sorted(parts)
+
+
+def _storable(df: pd.DataFrame) -> pd.DataFrame:
+    """Copy of `df` where object columns hold only numbers or only text"""
+
+    df = df.copy()
+    geometry = df.geometry.name if isinstance(df, gpd.GeoDataFrame) else None
+    for col in df.columns:
+        if col == geometry or not is_object_dtype(df[col]):
+            continue
+        if all(value is None or isinstance(value, Number) for value in df[col]):
+            df[col] = df[col].astype(float)
+        else:
+            df[col] = [None if value is None else str(value) for value in df[col]]
+    return df
+
+
+def _part_config(part: Path) -> Optional[str]:
+    """Id of the configuration of a stored chunk, from its file name"""
+
+    fields = part.stem.split("_")
+    return fields[3] if len(fields) > 3 else None
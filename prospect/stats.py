@@ -0,0 +1,389 @@
+from typing import List, Sequence, Union
+
+import numpy as np
+import pandas as pd
+import scipy.stats
+
+
+class RunningMoments:
+    """Streaming mean and variance of one or more quantities
+
+    Observations are added in batches with Welford's algorithm, in the
+    parallel form of Chan et al., so the estimates are updated without keeping
+    the observations.
+
+    Parameters
+    ----------
+    n_stats : int, optional
+        Number of quantities observed together (the default is 1)
+
+    Attributes
+    ----------
+    n : int
+        Number of observations so far
+    mean : numpy ndarray
+        Mean of each quantity
+    """
+
+    def __init__(self, n_stats: int = 1):
+        """Create a `RunningMoments` instance"""
+
+        self.n = 0
+        self.mean = np.zeros(n_stats)
+        self._m2 = np.zeros(n_stats)
+
+    def __repr__(self):
+        return f"RunningMoments(n={self.n}, n_stats={self.mean.shape[0]})"
+
+    def update(self, values: Union[np.ndarray, float]):
+        """Add a batch of observations.
+
+        Parameters
+        ----------
+        values : numpy ndarray
+            Array of shape `(n_observations, n_stats)`, or `(n_observations,)`
+            for a single quantity
+        """
+
+        values = np.asarray(values, dtype=float).reshape(-1, self.mean.shape[0])
+        n_batch = values.shape[0]
+        if n_batch == 0:
+            return
+
+        batch_mean = values.mean(axis=0)
+        batch_m2 = ((values - batch_mean) ** 2).sum(axis=0)
+
+        n = self.n + n_batch
+        delta = batch_mean - self.mean
+        self.mean = self.mean + delta * n_batch / n
+        self._m2 = self._m2 + batch_m2 + delta**2 * self.n * n_batch / n
+        self.n = n
+
+    @property
+    def var(self) -> np.ndarray:
+        """Sample variance of each quantity (NaN before two observations)"""
+
+        if self.n < 2:
+            return np.full(self.mean.shape[0], np.nan)
+        return self._m2 / (self.n - 1)
+
+    def half_width(self, confidence: float = 0.95) -> np.ndarray:
+        """Half-width of the confidence interval of each mean.
+
+        Parameters
+        ----------
+        confidence : float, optional
+            Confidence level of the interval, from Student's t distribution
+            (the default is 0.95)
+
+        Returns
+        -------
+        numpy ndarray
+            Half-width for each quantity (NaN before two observations)
+        """
+
+        if self.n < 2:
+            return np.full(self.mean.shape[0], np.nan)
+        t = scipy.stats.t.ppf((1 + confidence) / 2, df=self.n - 1)
+        return t * np.sqrt(self.var / self.n)
+
+
+class P2Quantile:
+    """Streaming estimate of a quantile of one or more quantities
+
+    Uses the P² algorithm of Jain and Chlamtac (1985), which tracks five
+    markers per quantity instead of keeping the observations. The first five
+    observations are kept and give the exact quantile.
+
+    Parameters
+    ----------
+    p : float
+        Quantile to estimate, between 0 and 1
+    n_stats : int, optional
+        Number of quantities observed together (the default is 1)
+
+    Attributes
+    ----------
+    p : float
+        Quantile to estimate
+    n : int
+        Number of observations so far
+    """
+
+    def __init__(self, p: float, n_stats: int = 1):
+        """Create a `P2Quantile` instance"""
+
+        assert 0 < p < 1, "`p` must be between 0 and 1"
+
+        self.p = p
+        self.n = 0
+        self._n_stats = n_stats
+        self._first: List[np.ndarray] = []
+        # marker heights, positions and desired positions of each quantity
+        self._heights: List[List[float]] = []
+        self._positions: List[List[float]] = []
+        self._desired: List[List[float]] = []
+        self._increments = [0.0, p / 2, p, (1 + p) / 2, 1.0]
+
+    def __repr__(self):
+        return f"P2Quantile(p={self.p}, n={self.n})"
+
+    def update(self, values: Union[np.ndarray, float]):
+        """Add a batch of observations.
+
+        Parameters
+        ----------
+        values : numpy ndarray
+            Array of shape `(n_observations, n_stats)`, or `(n_observations,)`
+            for a single quantity
+        """
+
+        values = np.asarray(values, dtype=float).reshape(-1, self._n_stats)
+        n_first = min(max(5 - self.n, 0), values.shape[0])
+        self._first.extend(values[:n_first])
+        self.n += n_first
+        if n_first > 0 and self.n == 5:
+            p = self.p
+            self._heights = np.sort(self._first, axis=0).T.tolist()
+            self._positions = [[0.0, 1.0, 2.0, 3.0, 4.0] for _ in range(self._n_stats)]
+            self._desired = [
+                [0.0, 2 * p, 4 * p, 2 + 2 * p, 4.0] for _ in range(self._n_stats)
+            ]
+
+        # the markers are only a handful of floats, which plain Python
+        # updates faster than numpy
+        rest = values[n_first:]
+        for stat, column in enumerate(rest.T.tolist() if rest.shape[0] else []):
+            q = self._heights[stat]
+            pos = self._positions[stat]
+            desired = self._desired[stat]
+            for x in column:
+                _p2_add(q, pos, desired, self._increments, x)
+        self.n += values.shape[0] - n_first
+
+    @property
+    def value(self) -> np.ndarray:
+        """Estimated quantile of each quantity (NaN before any observation)"""
+
+        if self.n == 0:
+            return np.full(self._n_stats, np.nan)
+        if self.n < 5:
+            return np.quantile(self._first, self.p, axis=0)
+        return np.array([q[2] for q in self._heights])
+
+
+def _p2_add(
+    q: List[float],
+    pos: List[float],
+    desired: List[float],
+    increments: List[float],
+    x: float,
+):
+    """Add one observation to the P² markers of one quantity, in place"""
+
+    # find the cell of the observation, extending the extreme markers
+    if x < q[0]:
+        q[0] = x
+        cell = 0
+    elif x >= q[4]:
+        q[4] = x
+        cell = 3
+    else:
+        cell = 0
+        while x >= q[cell + 1]:
+            cell += 1
+    for i in range(cell + 1, 5):
+        pos[i] += 1
+    for i in range(5):
+        desired[i] += increments[i]
+
+    # move the middle markers that are off their desired position
+    for i in (1, 2, 3):
+        d = desired[i] - pos[i]
+        if (d >= 1 and pos[i + 1] - pos[i] > 1) or (
+            d <= -1 and pos[i - 1] - pos[i] < -1
+        ):
+            d = 1 if d > 0 else -1
+            parabolic = q[i] + d / (pos[i + 1] - pos[i - 1]) * (
+                (pos[i] - pos[i - 1] + d) * (q[i + 1] - q[i]) / (pos[i + 1] - pos[i])
+                + (pos[i + 1] - pos[i] - d) * (q[i] - q[i - 1]) / (pos[i] - pos[i - 1])
+            )
+            if q[i - 1] < parabolic < q[i + 1]:
+                q[i] = parabolic
+            else:
+                q[i] = q[i] + d * (q[i + d] - q[i]) / (pos[i + d] - pos[i])
+            pos[i] += d
+
+
+class SurveySummary:
+    """Running aggregates of the results of a `Survey`
+
+    The aggregates are updated as each batch of runs is resolved, so they do
+    not require the per-run result tables to be kept. They are usually
+    accessed through `Survey.summary`.
+
+    Parameters
+    ----------
+    quantiles : Sequence[float], optional
+        Quantiles of the time metrics to estimate (the default is
+        (0.05, 0.5, 0.95))
+
+    Attributes
+    ----------
+    n_runs : int
+        Number of runs summarized
+    total_time : float
+        Sum of the `total_time` of the runs summarized
+    quantiles : Tuple[float]
+        Quantiles of the time metrics
+    """
+
+    TIME_METRICS = ("total_time", "walk_time", "makespan")
+
+    def __init__(self, quantiles: Sequence[float] = (0.05, 0.5, 0.95)):
+        """Create a `SurveySummary` instance"""
+
+        self.n_runs = 0
+        self.total_time = 0.0
+        self.quantiles = tuple(quantiles)
+
+        # sums per feature and per layer, indexed by name
+        self._feature_sums = _empty_sums(
+            "feature_name", ["n_runs", "n_prob", "sum_discovery_prob", "n_discovered"]
+        )
+        self._layer_sums = _empty_sums(
+            "layer_name", ["n_runs", "n_features", "n_discovered"]
+        )
+
+        n_metrics = len(self.TIME_METRICS)
+        self._time_moments = RunningMoments(n_stats=n_metrics)
+        self._time_min = np.full(n_metrics, np.inf)
+        self._time_max = np.full(n_metrics, -np.inf)
+        self._time_quantiles = [P2Quantile(p, n_stats=n_metrics) for p in quantiles]
+
+    def __repr__(self):
+        return f"SurveySummary(n_runs={self.n_runs})"
+
+    def update(
+        self,
+        discovery: pd.DataFrame,
+        discovery_counts: pd.DataFrame,
+        time_team: pd.DataFrame,
+    ):
+        """Add a batch of resolved runs.
+
+        Parameters
+        ----------
+        discovery : pandas DataFrame
+            `discovery` table of the runs, with categorical feature names
+        discovery_counts : pandas DataFrame
+            `discovery_counts` table of the runs
+        time_team : pandas DataFrame
+            `time_team` table of the runs, with one row per run
+        """
+
+        # sum by feature with the categorical codes of the names
+        names = discovery["feature_name"].array
+        codes = names.codes
+        n_names = names.categories.shape[0]
+        prob = discovery["discovery_prob"].to_numpy(dtype=float)
+        has_prob = ~np.isnan(prob)
+        feature_sums = pd.DataFrame(
+            {
+                "n_runs": np.bincount(codes, minlength=n_names),
+                "n_prob": np.bincount(codes, weights=has_prob, minlength=n_names),
+                "sum_discovery_prob": np.bincount(
+                    codes[has_prob], weights=prob[has_prob], minlength=n_names
+                ),
+                "n_discovered": np.bincount(
+                    codes,
+                    weights=discovery["discovered"].to_numpy(dtype=float),
+                    minlength=n_names,
+                ),
+            },
+            index=pd.Index(names.categories, name="feature_name"),
+        )
+        self._feature_sums = _add_sums(self._feature_sums, feature_sums)
+
+        layer_sums = (
+            discovery_counts.assign(n_runs=1)
+            .groupby("layer_name")[["n_runs", "n_features", "n_discovered"]]
+            .sum()
+        )
+        self._layer_sums = _add_sums(self._layer_sums, layer_sums)
+
+        times = time_team.loc[:, list(self.TIME_METRICS)].to_numpy(dtype=float)
+        if times.shape[0] > 0:
+            self._time_moments.update(times)
+            self._time_min = np.minimum(self._time_min, times.min(axis=0))
+            self._time_max = np.maximum(self._time_max, times.max(axis=0))
+            for quantile in self._time_quantiles:
+                quantile.update(times)
+
+        self.n_runs += time_team.shape[0]
+        self.total_time += float(time_team["total_time"].sum())
+
+    @property
+    def features(self) -> pd.DataFrame:
+        """Number of runs, mean discovery probability (over the runs where it
+        is defined), and fraction of runs discovered of each feature
+        """
+
+        sums = self._feature_sums
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return pd.DataFrame(
+                {
+                    "n_runs": sums["n_runs"].astype(int),
+                    "mean_discovery_prob": sums["sum_discovery_prob"] / sums["n_prob"],
+                    "discovery_rate": sums["n_discovered"] / sums["n_runs"],
+                }
+            )
+
+    @property
+    def layers(self) -> pd.DataFrame:
+        """Number of runs, mean number of features and of discovered features,
+        and fraction of features discovered of each layer
+        """
+
+        sums = self._layer_sums
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return pd.DataFrame(
+                {
+                    "n_runs": sums["n_runs"].astype(int),
+                    "mean_n_features": sums["n_features"] / sums["n_runs"],
+                    "mean_n_discovered": sums["n_discovered"] / sums["n_runs"],
+                    "discovery_rate": sums["n_discovered"] / sums["n_features"],
+                }
+            )
+
+    @property
+    def time(self) -> pd.DataFrame:
+        """Mean, standard deviation, minimum, estimated quantiles and maximum
+        of each time metric over runs
+        """
+
+        empty = self._time_moments.n == 0
+        stats = {
+            "n_runs": self._time_moments.n,
+            "mean": np.nan if empty else self._time_moments.mean,
+            "std": np.sqrt(self._time_moments.var),
+            "min": np.nan if empty else self._time_min,
+        }
+        for quantile in self._time_quantiles:
+            stats[f"q{quantile.p:g}"] = quantile.value
+        stats["max"] = np.nan if empty else self._time_max
+        return pd.DataFrame(stats, index=pd.Index(self.TIME_METRICS, name="metric"))
+
+
+def _empty_sums(index_name: str, columns: Sequence[str]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {column: pd.Series(dtype=float) for column in columns},
+        index=pd.Index([], dtype=object, name=index_name),
+    )
+
+
+def _add_sums(total: pd.DataFrame, sums: pd.DataFrame) -> pd.DataFrame:
+    """Add sums indexed by name, keeping names in order of first appearance"""
+
+    index = total.index.append(sums.index.difference(total.index, sort=False))
+    return total.reindex(index, fill_value=0) + sums.reindex(index, fill_value=0)
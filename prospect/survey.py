@@ -1,18 +1,37 @@
 import collections
-from itertools import cycle
-from typing import List, Tuple, Union
+import hashlib
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import geopandas as gpd
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+import shapely
 from matplotlib.figure import Figure
+from pandas.api.types import is_numeric_dtype
 from scipy.stats._distn_infrastructure import rv_frozen
 
 from .area import Area
 from .assemblage import Assemblage
 from .coverage import Coverage
+from .results import SurveyResults
+from .stats import RunningMoments, SurveySummary
 from .team import Team
+from .utils import _frame_hash, _geometry_hash
+from .visibility import VisibilitySurface
 
 
 class Survey:
@@ -22,13 +41,41 @@ class Survey:
     ----------
     name : str
         Unique name for the survey
+    seed : int, optional
+        Root seed for the random draws of every run (the default is None, which
+        draws fresh entropy from the operating system)
 
     Attributes
     ----------
     name : str
         Name of the survey
+    seed : int
+        Root seed for the random draws. A run's draws depend only on this
+        value and the run id.
+    discovery_counts : pandas DataFrame
+        Number of features and of discovered features per layer per run
+    time_team : pandas DataFrame
+        Total search time, walking time and makespan (elapsed time of the team
+        working in parallel) per run
+    total_time : float
+        Sum of `total_time_per_surveyunit` over all runs resolved, whatever
+        their configuration
+    configs : Dict[str, dict]
+        Building blocks and run parameters of each configuration that results
+        were resolved with, keyed on the id in the `config` column of the
+        result tables
+    summaries : Dict[str, SurveySummary]
+        Running aggregates of the runs of each configuration, keyed like
+        `configs`
     """
 
+    # intermediate products of `run` kept for reuse, keyed on the fingerprints
+    # of the building blocks they were derived from
+    CACHE_SIZE = 32
+
+    # largest batch of runs resolved at once when only the summary is kept
+    BATCH_SIZE = 100
+
     def __init__(
         self,
         name: str,
@@ -36,6 +83,7 @@ class Survey:
         assemblage: Assemblage = None,
         coverage: Coverage = None,
         team: Team = None,
+        seed: Optional[int] = None,
     ):
         """Create `Survey` instance"""
 
@@ -44,17 +92,44 @@ class Survey:
         self.assemblage = assemblage
         self.coverage = coverage
         self.team = team
+        self.seed = np.random.SeedSequence(seed).entropy
 
         # initialize empty outputs
         self.raw = None
         self.discovery = None
+        self.discovery_counts = None
         self.time_surveyunit = None
         self.time_surveyor = None
+        self.time_team = None
         self.total_time = 0
+        self.configs: Dict[str, dict] = {}
+        self.summaries: Dict[str, SurveySummary] = {}
+        # configuration of the last runs resolved
+        self._config: Optional[str] = None
+        # one past the largest run id resolved with each configuration
+        self._next_run_ids: Dict[str, int] = {}
+
+        self._fingerprints: Optional[Dict[str, str]] = None
+        self._cache: collections.OrderedDict = collections.OrderedDict()
+
+    def _cached(self, key: tuple, func: Callable[[], Any]) -> Any:
+        """Compute an intermediate product of `run` once and reuse it."""
+
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        self._cache[key] = func()
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return self._cache[key]
 
     def add_bb(self, bb: List[Union[Area, Assemblage, Coverage, Team]]):
         """Attach building blocks to survey.
 
+        A block replaces the survey's current block of the same type. The next
+        `run` only redoes the work that depends on the replaced blocks.
+
         Parameters
         ----------
         bb : List[Union[Area, Assemblage, Coverage, Team]]
@@ -75,50 +150,613 @@ class Survey:
     def run(
         self,
         n_runs: int,
-        start_run_id: int = 0,
+        start_run_id: Optional[int] = None,
         discovery_threshold: float = 0.0,
         overwrite: bool = False,
+        n_jobs: int = 1,
+        executor: Optional[Executor] = None,
+        walking_speed: Optional[float] = None,
+        keep_tables: bool = True,
     ):
+        """Resolve `n_runs` simulated runs of the survey.
+
+        Runs are resolved in batches: the spatial join of the `Assemblage` and
+        the `Coverage` is done once per batch and every random input is drawn
+        for all runs of the batch at once. Each run draws from its own random
+        number generator, derived from `Survey.seed` and the run id, so results
+        are identical however the runs are split across workers.
+
+        Intermediate products, like the survey unit of each feature, are kept
+        for the building blocks they were derived from, so after swapping one
+        block with `add_bb()` only the work that depends on it is redone. Every
+        result row is tagged with the id of its configuration in the `config`
+        column, and the configuration is described in `Survey.configs`.
 
-        stop_run_id = start_run_id + n_runs
+        The surface visibility of each feature is drawn from the `Area`
+        polygon it lies in, or looked up on the area's `VisibilitySurface`.
+        Features outside the area have a NaN visibility and are never
+        discovered, even if a survey unit covers them.
+
+        Parameters
+        ----------
+        n_runs : int
+            Number of runs to resolve
+        start_run_id : int, optional
+            Id of the first run (the default is None, which continues after
+            the last run resolved with the same configuration, or starts at 0).
+            Runs with the same id and configuration draw the same values, so
+            repeating ids counts the same run twice.
+        discovery_threshold : float, optional
+            Minimum discovery probability for a feature to be discovered. Each
+            feature at or above it is discovered with probability
+            `discovery_prob` (the default is 0.0, which lets any feature with a
+            positive `discovery_prob` be discovered)
+        overwrite : bool, optional
+            Discard the results of previous runs before resolving (the default
+            is False, which appends the new runs to the existing results)
+        n_jobs : int, optional
+            Number of batches to split the runs into, each resolved by its own
+            worker process (the default is 1, which resolves all runs in the
+            current process)
+        executor : concurrent.futures.Executor, optional
+            Executor to submit the `n_jobs` batches to, instead of creating a
+            new process pool (the default is None)
+        walking_speed : float, optional
+            Distance covered per unit of time when walking between survey
+            units. Each surveyor walks between the centroids of their
+            consecutive survey units, and the walking time is added to the
+            `makespan` in `time_team`. (the default is None, which ignores
+            walking time)
+        keep_tables : bool, optional
+            Append the runs to the result tables (the default is True). If
+            False, the runs are resolved in batches of at most `BATCH_SIZE`
+            runs, and each batch only updates `Survey.summaries` and
+            `total_time` before it is discarded, so memory use does not grow
+            with `n_runs`.
+        """
 
         if overwrite:
-            self.raw = None
-            self.discovery = None
-            self.time_surveyunit = None
-            self.time_surveyor = None
-            self.total_time = 0
-
-        resolved_runs = [
-            _resolve(self, run_id=run_id) for run_id in range(start_run_id, stop_run_id)
-        ]
+            self._clear()
+
+        config = self._configure(discovery_threshold, walking_speed)
+        if start_run_id is None:
+            start_run_id = self._next_run_ids.get(config, 0)
+
+        run_ids = np.arange(start_run_id, start_run_id + n_runs)
+        batch_size = max(1, -(-n_runs // max(1, n_jobs)))  # ceiling division
+        if not keep_tables:
+            batch_size = min(batch_size, self.BATCH_SIZE)
+        batches = self._resolve_batches(
+            run_ids,
+            batch_size=batch_size,
+            config=config,
+            discovery_threshold=discovery_threshold,
+            n_jobs=n_jobs,
+            executor=executor,
+            walking_speed=walking_speed,
+        )
 
-        # first concat outputs, then concat those with class attributes
-        # From pandas.concat() docs: Any None objects will be dropped silently unless they are all None in which case a ValueError will be raised
-        raws = pd.concat([run.raw for run in resolved_runs], ignore_index=True)
-        self.raw = pd.concat([self.raw, raws], ignore_index=True)
+        if keep_tables:
+            self._store(_concat_resolved(batches), config)
+        else:
+            for resolved in batches:
+                self._store(resolved, config, keep_tables=False)
+
+    def run_until(
+        self,
+        tolerance: float = 0.01,
+        confidence: float = 0.95,
+        batch_size: int = 100,
+        max_runs: int = 10000,
+        start_run_id: Optional[int] = None,
+        discovery_threshold: float = 0.0,
+        overwrite: bool = False,
+        n_jobs: int = 1,
+        executor: Optional[Executor] = None,
+        walking_speed: Optional[float] = None,
+        keep_tables: bool = True,
+    ) -> pd.DataFrame:
+        """Resolve batches of runs until the estimates of the survey converge.
+
+        After each batch, the mean and variance of the per-run number of
+        discovered features, discovery rate of each layer, and `total_time`
+        are updated with Welford's algorithm. Runs stop when the confidence
+        interval of every mean is narrower than `tolerance` relative to the
+        mean, or after `max_runs` runs. The runs are added to the results like
+        with `run()`.
 
-        discoveries = pd.concat(
-            [run.discovery for run in resolved_runs], ignore_index=True
+        Parameters
+        ----------
+        tolerance : float, optional
+            Largest accepted half-width of the confidence intervals, as a
+            fraction of the mean (the default is 0.01)
+        confidence : float, optional
+            Confidence level of the intervals (the default is 0.95)
+        batch_size : int, optional
+            Number of runs resolved between convergence checks (the default is
+            100)
+        max_runs : int, optional
+            Maximum number of runs to resolve (the default is 10000)
+        start_run_id : int, optional
+            Id of the first run (the default is None, which continues after
+            the last run resolved with the same configuration). See `run()`.
+        discovery_threshold : float, optional
+            Minimum discovery probability for a feature to be discovered (the
+            default is 0.0). See `run()`.
+        overwrite : bool, optional
+            Discard the results of previous runs before resolving (the default
+            is False)
+        n_jobs : int, optional
+            Number of worker processes that each batch is split across (the
+            default is 1)
+        executor : concurrent.futures.Executor, optional
+            Executor to submit the parts of each batch to, instead of creating
+            a new process pool (the default is None)
+        walking_speed : float, optional
+            Distance covered per unit of time when walking between survey
+            units (the default is None, which ignores walking time). See
+            `run()`.
+        keep_tables : bool, optional
+            Append the runs to the result tables (the default is True). If
+            False, memory use is bounded by `batch_size` instead of the
+            number of runs.
+
+        Returns
+        -------
+        pandas DataFrame
+            One row per estimate, with the `layer_name` (for discovery
+            rates), number of runs, mean, standard deviation, confidence
+            interval half-width, and whether it converged
+        """
+
+        assert batch_size >= 2, "`batch_size` must be at least 2"
+        assert max_runs >= 1, "`max_runs` must be at least 1"
+
+        if overwrite:
+            self._clear()
+
+        config = self._configure(discovery_threshold, walking_speed)
+        if start_run_id is None:
+            start_run_id = self._next_run_ids.get(config, 0)
+
+        moments = None
+        n_done = 0
+        while n_done < max_runs:
+            n_runs = min(batch_size, max_runs - n_done)
+            resolved = _concat_resolved(
+                self._resolve_batches(
+                    np.arange(start_run_id + n_done, start_run_id + n_done + n_runs),
+                    batch_size=max(1, -(-n_runs // max(1, n_jobs))),
+                    config=config,
+                    discovery_threshold=discovery_threshold,
+                    n_jobs=n_jobs,
+                    executor=executor,
+                    walking_speed=walking_speed,
+                )
+            )
+            self._store(resolved, config, keep_tables=keep_tables)
+            n_done += n_runs
+
+            layers, values = _run_estimates(resolved)
+            if moments is None:
+                moments = RunningMoments(n_stats=values.shape[1])
+            moments.update(values)
+
+            half_width = moments.half_width(confidence)
+            # a layer without features has no discovery rate to estimate
+            converged = (half_width <= tolerance * np.abs(moments.mean)) | np.isnan(
+                moments.mean
+            )
+            if converged.all():
+                break
+
+        return pd.DataFrame(
+            {
+                "estimate": ["n_discovered"]
+                + ["discovery_rate"] * layers.shape[0]
+                + ["total_time"],
+                "layer_name": np.concatenate([[None], layers, [None]]),
+                "n_runs": moments.n,
+                "mean": moments.mean,
+                "std": np.sqrt(moments.var),
+                "half_width": half_width,
+                "converged": converged,
+            }
         )
-        self.discovery = pd.concat([self.discovery, discoveries], ignore_index=True)
 
-        time_surveyunits = pd.concat(
-            [run.time_surveyunit for run in resolved_runs], ignore_index=True
+    @property
+    def summary(self) -> SurveySummary:
+        """Running aggregates of the runs resolved with `run()` or
+        `run_until()` in the configuration of the last runs: per-feature and
+        per-layer discovery, and the distribution of the time metrics of
+        `time_team`. They are kept up to date as runs are resolved, even when
+        the result tables are not kept. Runs of other configurations are
+        summarized separately in `Survey.summaries`.
+        """
+        if self._config not in self.summaries:
+            return SurveySummary()
+        return self.summaries[self._config]
+
+    def _clear(self):
+        """Discard the results of previous runs"""
+
+        for table in _RESULT_TABLES:
+            setattr(self, table, None)
+        self.total_time = 0
+        self.summaries = {}
+        self._config = None
+        self._next_run_ids = {}
+
+    def _store(self, resolved: "ResolvedRuns", config: str, keep_tables: bool = True):
+        """Add runs resolved with `config` to its summary, and to the result
+        tables if `keep_tables`
+        """
+
+        self._config = config
+        self.summaries.setdefault(config, SurveySummary()).update(
+            resolved.discovery, resolved.discovery_counts, resolved.time_team
         )
-        self.time_surveyunit = pd.concat(
-            [self.time_surveyunit, time_surveyunits], ignore_index=True
+        self.total_time += resolved.total_time
+        if resolved.time_team.shape[0] > 0:
+            self._next_run_ids[config] = max(
+                self._next_run_ids.get(config, 0),
+                int(resolved.time_team["run"].max()) + 1,
+            )
+        if not keep_tables:
+            return
+
+        # concat outputs with class attributes
+        # From pandas.concat() docs: Any None objects will be dropped silently unless they are all None in which case a ValueError will be raised
+        for table in _RESULT_TABLES:
+            setattr(
+                self,
+                table,
+                pd.concat(
+                    [getattr(self, table), getattr(resolved, table)],
+                    ignore_index=True,
+                ),
+            )
+
+    def run_to_disk(
+        self,
+        path: Union[str, Path],
+        n_runs: int,
+        start_run_id: Optional[int] = None,
+        discovery_threshold: float = 0.0,
+        chunk_size: int = 100,
+        n_jobs: int = 1,
+        executor: Optional[Executor] = None,
+        walking_speed: Optional[float] = None,
+    ) -> SurveyResults:
+        """Resolve runs in chunks and write each chunk's results to disk.
+
+        Only one chunk of runs per worker is held in memory at a time, so
+        memory use is bounded by `chunk_size` instead of `n_runs`. The
+        `discovery`, `discovery_counts`, `time_surveyunit`, `time_surveyor`
+        and `time_team` tables of each chunk are appended to a directory of
+        Parquet files (one file per table per chunk), which requires the
+        `pyarrow` package. The `Survey` attributes are left unchanged. The
+        building block tables are written too, so `Survey.load()` can open the
+        directory.
+
+        Parameters
+        ----------
+        path : Union[str, Path]
+            Directory to write the results to. Chunks are added to any results
+            already stored there.
+        n_runs : int
+            Number of runs to resolve
+        start_run_id : int, optional
+            Id of the first run (the default is None, which continues after
+            the last run of the same configuration stored in `path`)
+        discovery_threshold : float, optional
+            Minimum discovery probability for a feature to be discovered (the
+            default is 0.0). See `run()`.
+        chunk_size : int, optional
+            Maximum number of runs resolved and written together (the default
+            is 100)
+        n_jobs : int, optional
+            Number of worker processes resolving chunks at the same time (the
+            default is 1, which resolves all chunks in the current process)
+        executor : concurrent.futures.Executor, optional
+            Executor to submit the chunks to, instead of creating a new process
+            pool (the default is None)
+        walking_speed : float, optional
+            Distance covered per unit of time when walking between survey
+            units (the default is None, which ignores walking time). See
+            `run()`.
+
+        Returns
+        -------
+        SurveyResults
+            Lazy handle on the results stored in `path`
+
+        Raises
+        ------
+        FileExistsError
+            If runs with the same ids and configuration are already stored in
+            `path`
+        """
+
+        results = SurveyResults(path)
+        config = self._configure(discovery_threshold, walking_speed)
+        if start_run_id is None:
+            start_run_id = results.next_run_id(config)
+        for table in results.TABLES:
+            results._check_free(table, config, start_run_id, start_run_id + n_runs - 1)
+        run_ids = np.arange(start_run_id, start_run_id + n_runs)
+        for resolved in self._resolve_batches(
+            run_ids,
+            batch_size=chunk_size,
+            config=config,
+            discovery_threshold=discovery_threshold,
+            n_jobs=n_jobs,
+            executor=executor,
+            walking_speed=walking_speed,
+        ):
+            results.append(
+                discovery=resolved.discovery,
+                discovery_counts=resolved.discovery_counts,
+                time_surveyunit=resolved.time_surveyunit,
+                time_surveyor=resolved.time_surveyor,
+                time_team=resolved.time_team,
+            )
+        self._write_blocks(results)
+
+        return results
+
+    def save(
+        self, path: Union[str, Path], chunk_size: int = 100, overwrite: bool = False
+    ) -> SurveyResults:
+        """Write the results and the building block tables to disk.
+
+        The `discovery`, `discovery_counts`, `time_surveyunit`,
+        `time_surveyor` and `time_team` tables are written to a directory of
+        Parquet files, one file per table per chunk of runs, and the `area`,
+        `features`, `surveyunits` and `surveyors` tables to (Geo)Parquet
+        files. Names are stored dictionary-encoded. The `raw` table is not
+        saved. Writing requires the `pyarrow` package.
+
+        Parameters
+        ----------
+        path : Union[str, Path]
+            Directory to write to
+        chunk_size : int, optional
+            Number of runs per file (the default is 100)
+        overwrite : bool, optional
+            Replace results already stored in `path` (the default is False,
+            which raises an error if there are any)
+
+        Returns
+        -------
+        SurveyResults
+            Lazy handle on the saved results, like `Survey.load()` returns
+        """
+
+        results = SurveyResults(path)
+        if any(results._parts(table) for table in results.TABLES):
+            if not overwrite:
+                raise FileExistsError(
+                    f"'{path}' already holds results. Use `overwrite=True` to "
+                    "replace them."
+                )
+            for table in results.TABLES:
+                for _, part in results._parts(table):
+                    part.unlink()
+
+        if self.discovery is not None:
+            run_ids = np.unique(self.discovery["run"].to_numpy())
+            for start in range(0, run_ids.shape[0], chunk_size):
+                first, last = run_ids[start], run_ids[start : start + chunk_size][-1]
+                results.append(
+                    **{
+                        table: getattr(self, table).loc[
+                            getattr(self, table)["run"].between(first, last)
+                        ]
+                        for table in results.TABLES
+                    }
+                )
+        self._write_blocks(results)
+
+        return results
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> SurveyResults:
+        """Open results written by `save()` or `run_to_disk()`.
+
+        Nothing is read until a table is requested, so selected columns and
+        runs of large studies can be read without loading everything. See
+        `SurveyResults.read()`.
+
+        Parameters
+        ----------
+        path : Union[str, Path]
+            Directory the results were written to
+
+        Returns
+        -------
+        SurveyResults
+            Lazy handle on the stored results
+        """
+
+        return SurveyResults(path)
+
+    def _write_blocks(self, results: SurveyResults):
+        """Write the building block tables and the survey's description"""
+
+        configs = {**results.metadata.get("configs", {}), **self.configs}
+        blocks = {
+            "area": None if self.area is None else self.area.df,
+            "features": None if self.assemblage is None else self.assemblage.df,
+            "surveyunits": None if self.coverage is None else self.surveyunits,
+            "surveyors": None if self.team is None else self.surveyors,
+        }
+        if self.assemblage is not None and self.coverage is not None:
+            blocks["features"] = self.features
+        results.write_blocks(
+            metadata={"name": self.name, "seed": self.seed, "configs": configs},
+            **{block: df for block, df in blocks.items() if df is not None},
         )
 
-        time_surveyors = pd.concat(
-            [run.time_surveyor for run in resolved_runs], ignore_index=True
+    def _resolve_batches(
+        self,
+        run_ids: np.ndarray,
+        batch_size: int,
+        config: str,
+        discovery_threshold: float = 0.0,
+        n_jobs: int = 1,
+        executor: Optional[Executor] = None,
+        walking_speed: Optional[float] = None,
+    ) -> Iterator["ResolvedRuns"]:
+        """Resolve `run_ids` in consecutive batches of at most `batch_size` runs.
+
+        Batches are yielded in run order. When they are resolved by an
+        executor, at most `n_jobs` batches are in flight at a time. Each batch
+        is tagged with `config`, the id of the configuration returned by
+        `_configure()`.
+        """
+
+        batches = [
+            run_ids[i : i + batch_size] for i in range(0, len(run_ids), batch_size)
+        ]
+
+        if executor is None and n_jobs == 1:
+            for batch in batches:
+                yield _tag_config(
+                    _resolve(
+                        self,
+                        run_ids=batch,
+                        discovery_threshold=discovery_threshold,
+                        walking_speed=walking_speed,
+                    ),
+                    config,
+                )
+            return
+
+        # only ship the building blocks to the workers, not previous results
+        blocks = self._blocks_only()
+
+        def _in_order(pool):
+            pending: Deque[Future] = collections.deque()
+            for batch in batches:
+                pending.append(
+                    pool.submit(
+                        _resolve, blocks, batch, discovery_threshold, walking_speed
+                    )
+                )
+                if len(pending) >= n_jobs:
+                    yield _tag_config(pending.popleft().result(), config)
+            while pending:
+                yield _tag_config(pending.popleft().result(), config)
+
+        if executor is None:
+            with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+                yield from _in_order(pool)
+        else:
+            yield from _in_order(executor)
+
+    def _blocks_only(self) -> "Survey":
+        """Copy of the survey with its building blocks and the intermediate
+        products derived from them, but without results, to send to workers.
+        Requires `_fingerprints` to be up to date.
+        """
+
+        blocks = Survey(
+            name=self.name,
+            area=self.area,
+            assemblage=self.assemblage,
+            coverage=self.coverage,
+            team=self.team,
+            seed=self.seed,
+        )
+        _static_inputs(self)
+        current = set(self._fingerprints.values())
+        blocks._fingerprints = self._fingerprints
+        blocks._cache = collections.OrderedDict(
+            (key, value)
+            for key, value in self._cache.items()
+            if current.issuperset(key[1:])
         )
-        self.time_surveyor = pd.concat(
-            [self.time_surveyor, time_surveyors], ignore_index=True
+        return blocks
+
+    def _configure(
+        self, discovery_threshold: float, walking_speed: Optional[float]
+    ) -> str:
+        """Fingerprint the building blocks, record the current configuration
+        in `configs` and return its id
+        """
+
+        self._fingerprints = {
+            kind: _fingerprint(getattr(self, kind)) for kind in _BUILDING_BLOCKS
+        }
+        params = {
+            "discovery_threshold": discovery_threshold,
+            "walking_speed": walking_speed,
+        }
+        digest = hashlib.sha1()
+        for kind in _BUILDING_BLOCKS:
+            digest.update(self._fingerprints[kind].encode())
+        digest.update(repr(sorted(params.items())).encode())
+        config = digest.hexdigest()[:12]
+
+        self.configs[config] = {
+            **{kind: getattr(self, kind).name for kind in _BUILDING_BLOCKS},
+            **params,
+        }
+        return config
+
+    @property
+    def features(self) -> gpd.GeoDataFrame:
+        """Static attributes and geometry of each feature, with the name of the
+        survey unit it intersects (if any)"""
+        unit_idx = _feature_unit_index(self.assemblage, self.coverage)
+        features = self.assemblage.df.copy()
+        features.loc[:, "surveyunit_name"] = (
+            self.coverage.df.loc[:, "surveyunit_name"].reindex(unit_idx).to_numpy()
         )
+        return features
 
-        for i in range(len(resolved_runs)):
-            self.total_time += resolved_runs[i].total_time
+    @property
+    def surveyunits(self) -> gpd.GeoDataFrame:
+        """Static attributes and geometry of each survey unit"""
+        return self.coverage.df
+
+    @property
+    def surveyors(self) -> pd.DataFrame:
+        """Static attributes of each surveyor"""
+        return self.team.df
+
+    def with_geometry(self, df: pd.DataFrame) -> gpd.GeoDataFrame:
+        """Join geometries back onto a result table.
+
+        Parameters
+        ----------
+        df : pandas DataFrame
+            Result table, like `Survey.discovery` or `Survey.time_surveyunit`.
+            Feature geometries are joined on `feature_name` if it is a column,
+            otherwise survey unit geometries are joined on `surveyunit_name`.
+
+        Returns
+        -------
+        geopandas GeoDataFrame
+        """
+
+        if "feature_name" in df.columns:
+            key, static = "feature_name", self.assemblage.df
+        elif "surveyunit_name" in df.columns:
+            key, static = "surveyunit_name", self.coverage.df
+        else:
+            raise ValueError(
+                "`df` needs a 'feature_name' or 'surveyunit_name' column to join "
+                "geometries on"
+            )
+
+        geom_name = static.geometry.name
+        geoms = static.loc[:, [key, geom_name]].drop_duplicates(subset=key)
+        merged = df.merge(
+            pd.DataFrame(geoms).astype({key: df[key].dtype}), on=key, how="left"
+        )
+        return gpd.GeoDataFrame(merged, geometry=geom_name, crs=static.crs)
 
     def discovery_plot(
         self,
@@ -134,7 +772,7 @@ class Survey:
 
         fig, axarr = plt.subplots(1, 1, figsize=figsize)
 
-        self.discovery.plot(
+        self.with_geometry(self.discovery).plot(
             ax=_make_outline(self.area.df, axarr),
             column="discovery_prob",
             legend=False,
@@ -149,155 +787,554 @@ class Survey:
         return fig
 
 
-def _resolve(survey, run_id: int):
-    """Determine input parameters, resolve discovery probabilities, and calculate search times"""
+# feature-to-surveyunit indexes, keyed on the geometries they were computed from
+_FEATURE_UNIT_INDEX_CACHE: collections.OrderedDict = collections.OrderedDict()
+_FEATURE_UNIT_INDEX_CACHE_SIZE = 32
 
-    def _get_floats_or_distr_vals(item):
-        """Duplicate value or randomly select value from distribution,
-        depending on type
-        """
-        if isinstance(item, rv_frozen):
-            return item.rvs(size=1)[0]
-        elif isinstance(float(item), float):
-            return item
-        else:
-            return np.nan
 
-    def _extract_values(df, input_col):
-        return df.loc[:, input_col].apply(_get_floats_or_distr_vals)
+def _feature_unit_index(assemblage: Assemblage, coverage: Coverage) -> np.ndarray:
+    """Find the row of the survey unit that each feature intersects.
+
+    The result only depends on the geometries of `Assemblage.df` and
+    `Coverage.df`, so it is cached on their content and shared by every
+    `Survey` that uses the same building blocks.
+
+    Parameters
+    ----------
+    assemblage : Assemblage
+    coverage : Coverage
+
+    Returns
+    -------
+    numpy ndarray
+        Positional index into `Coverage.df` for each row of `Assemblage.df`,
+        or -1 where the feature does not intersect the coverage
+    """
+
+    key = (_geometry_hash(assemblage.df), _geometry_hash(coverage.df))
+    if key in _FEATURE_UNIT_INDEX_CACHE:
+        _FEATURE_UNIT_INDEX_CACHE.move_to_end(key)
+        return _FEATURE_UNIT_INDEX_CACHE[key]
+
+    features, units = coverage.df.sindex.query(
+        assemblage.df.geometry, predicate="intersects"
+    )
+    assert (
+        np.unique(features).shape[0] == features.shape[0]
+    ), "Problem with spatial join. Check for accidental spatial overlap in Coverage."
+
+    unit_idx = np.full(assemblage.df.shape[0], -1, dtype=int)
+    unit_idx[features] = units
+    unit_idx.setflags(write=False)
+
+    _FEATURE_UNIT_INDEX_CACHE[key] = unit_idx
+    if len(_FEATURE_UNIT_INDEX_CACHE) > _FEATURE_UNIT_INDEX_CACHE_SIZE:
+        _FEATURE_UNIT_INDEX_CACHE.popitem(last=False)
 
-    ResolvedRun = collections.namedtuple(
-        "ResolvedRun",
-        "raw discovery time_surveyunit time_surveyor total_time",
+    return unit_idx
+
+
+_BUILDING_BLOCKS = ("area", "assemblage", "coverage", "team")
+
+
+def _fingerprint(block: Union[Area, Assemblage, Coverage, Team]) -> str:
+    """Content hash of a building block, used to tell when it has changed"""
+
+    digest = hashlib.sha1(type(block).__name__.encode())
+    digest.update(_frame_hash(block.df).encode())
+    if isinstance(block, Team):
+        digest.update(block.assignment.encode())
+    return digest.hexdigest()
+
+
+# per-run output tables, in the order they are stored on `Survey`
+_RESULT_TABLES = (
+    "raw",
+    "discovery",
+    "discovery_counts",
+    "time_surveyunit",
+    "time_surveyor",
+    "time_team",
+)
+
+ResolvedRuns = collections.namedtuple(
+    "ResolvedRuns",
+    _RESULT_TABLES + ("total_time",),
+)
+
+
+def _run_estimates(resolved: ResolvedRuns) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-run quantities that `Survey.run_until` tracks
+
+    Returns
+    -------
+    Tuple[numpy ndarray, numpy ndarray]
+        The layer names, and an array of shape `(n_runs, n_layers + 2)` with
+        the number of discovered features, the discovery rate of each layer,
+        and the total time of each run
+    """
+
+    counts = resolved.discovery_counts
+    n_runs = resolved.time_team.shape[0]
+    layers = counts["layer_name"].to_numpy()[: counts.shape[0] // n_runs]
+    n_discovered = counts["n_discovered"].to_numpy(dtype=float).reshape(n_runs, -1)
+    n_features = counts["n_features"].to_numpy(dtype=float).reshape(n_runs, -1)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rates = n_discovered / n_features
+    return layers, np.column_stack(
+        [
+            n_discovered.sum(axis=1),
+            rates,
+            resolved.time_team["total_time"].to_numpy(dtype=float),
+        ]
     )
 
-    # Create inputs df of features from assemblage
-    assemblage_inputs = survey.assemblage.df.copy()
 
-    # Extract obs_rate values
-    assemblage_inputs.loc[:, "obs_rate"] = _extract_values(
-        assemblage_inputs, "ideal_obs_rate"
+def _tag_config(resolved: ResolvedRuns, config: str) -> ResolvedRuns:
+    """Add a `config` column after the `run` column of each table"""
+
+    for table in _RESULT_TABLES:
+        df = getattr(resolved, table)
+        df.insert(
+            1,
+            "config",
+            pd.Categorical.from_codes(
+                np.zeros(df.shape[0], dtype=int), dtype=pd.CategoricalDtype([config])
+            ),
+        )
+    return resolved
+
+
+def _concat_resolved(resolved_batches: Iterable[ResolvedRuns]) -> ResolvedRuns:
+    """Combine the outputs of several batches of runs, in order"""
+    resolved_batches = list(resolved_batches)
+    return ResolvedRuns(
+        **{
+            table: pd.concat(
+                [getattr(r, table) for r in resolved_batches], ignore_index=True
+            )
+            for table in _RESULT_TABLES
+        },
+        total_time=sum(r.total_time for r in resolved_batches),
     )
 
-    # Extract feature time_penalty values
-    assemblage_inputs.loc[:, "time_penalty_obs"] = _extract_values(
-        assemblage_inputs, "time_penalty"
+
+def _run_rngs(seed: int, run_ids: np.ndarray) -> List[np.random.Generator]:
+    """Create an independent random number generator for each run.
+
+    Each generator is derived from the root `seed` and the run id only, so the
+    draws of a run do not depend on which other runs are resolved with it.
+    """
+    return [
+        np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(int(run_id),)))
+        for run_id in run_ids
+    ]
+
+
+def _draw_values(values: pd.Series, rngs: List[np.random.Generator]) -> np.ndarray:
+    """Draw every item of `values` once per run
+
+    Rows that share the same frozen distribution object are drawn together
+    with a single `rvs()` call per run, and constant values are broadcast.
+
+    Returns
+    -------
+    numpy ndarray
+        Array of shape `(len(rngs), len(values))`
+    """
+    n_runs = len(rngs)
+    if is_numeric_dtype(values):
+        return np.broadcast_to(values.to_numpy(dtype=float), (n_runs, values.shape[0]))
+
+    # group rows by value (frozen distributions are grouped by identity)
+    codes, uniques = pd.factorize(values.to_numpy(dtype=object))
+    is_distr = [isinstance(item, rv_frozen) for item in uniques]
+
+    # missing values (code -1) take the trailing NaN
+    constants = np.array(
+        [np.nan if distr else float(item) for item, distr in zip(uniques, is_distr)]
+        + [np.nan]
     )
+    out = np.empty((n_runs, values.shape[0]))
+    out[:] = constants[codes]
 
-    # Extract surface visibility values
-    # TODO: if raster, extract value from raster
-    assemblage_inputs.loc[:, "vis_obs"] = [
-        _get_floats_or_distr_vals(survey.area.vis)
-        for i in range(assemblage_inputs.shape[0])
+    groups = [
+        (uniques[code], np.flatnonzero(codes == code))
+        for code, distr in enumerate(is_distr)
+        if distr
     ]
+    for r, rng in enumerate(rngs):
+        for distr, rows in groups:
+            out[r, rows] = distr.rvs(size=rows.shape[0], random_state=rng)
+    return out
 
-    # get survey units
-    coverage_inputs = survey.coverage.df.copy()
 
-    # extract min_time_per_unit
-    coverage_inputs.loc[:, "min_time_per_unit_obs"] = _extract_values(
-        coverage_inputs, "min_time_per_unit"
+def _draw_assigned(
+    values: pd.Series, assigned: np.ndarray, rngs: List[np.random.Generator]
+) -> np.ndarray:
+    """Draw the item of `values` at each position of `assigned`, per run
+
+    Like `_draw_values`, rows of a run that share the same frozen
+    distribution object are drawn together with a single `rvs()` call.
+
+    Parameters
+    ----------
+    values : pandas Series
+        One value or distribution per row, e.g. per surveyor
+    assigned : numpy ndarray
+        Positional index into `values` with shape `(n_runs, n)`, or -1 for
+        NaN
+
+    Returns
+    -------
+    numpy ndarray
+        Array of shape `assigned.shape`
+    """
+    if is_numeric_dtype(values):
+        return np.append(values.to_numpy(dtype=float), np.nan)[assigned]
+
+    codes, uniques = pd.factorize(values.to_numpy(dtype=object))
+    n_uniques = uniques.shape[0]
+    is_distr = [isinstance(item, rv_frozen) for item in uniques] + [False]
+    constants = np.array(
+        [np.nan if distr else float(item) for item, distr in zip(uniques, is_distr)]
+        + [np.nan]
     )
 
-    # calculate search_time
-    coverage_inputs.loc[:, "base_search_time"] = np.where(
-        coverage_inputs.loc[:, "surveyunit_type"] == "transect",
-        coverage_inputs.loc[:, "min_time_per_unit"] * coverage_inputs.loc[:, "length"],
-        coverage_inputs.loc[:, "min_time_per_unit"],
+    # missing values and unassigned positions take the trailing NaN
+    codes = np.append(np.where(codes < 0, n_uniques, codes), n_uniques)
+    assigned_codes = codes[assigned]
+    out = constants[assigned_codes]
+
+    for r, rng in enumerate(rngs):
+        for code in pd.unique(assigned_codes[r]):
+            if is_distr[code]:
+                rows = np.flatnonzero(assigned_codes[r] == code)
+                out[r, rows] = uniques[code].rvs(size=rows.shape[0], random_state=rng)
+    return out
+
+
+def _per_feature(unit_vals: np.ndarray, unit_idx: np.ndarray) -> np.ndarray:
+    """Broadcast `(n_runs, n_units)` values to `(n_runs, n_features)`, with NaN
+    for features outside of the coverage
+    """
+    padded = np.concatenate(
+        [unit_vals, np.full((unit_vals.shape[0], 1), np.nan)], axis=1
     )
+    return padded[:, unit_idx]
+
+
+def _tile_names(
+    names: Iterable[str], dtype: pd.CategoricalDtype, n_runs: int
+) -> pd.Categorical:
+    """Repeat `names` once per run as a categorical of the given `dtype`"""
+    codes = dtype.categories.get_indexer(pd.Index(names))
+    return pd.Categorical.from_codes(np.tile(codes, n_runs), dtype=dtype)
+
+
+_StaticInputs = collections.namedtuple(
+    "_StaticInputs",
+    [
+        "unit_idx",
+        "area_vis",
+        "feature_names",
+        "layer_codes",
+        "layers",
+        "surveyunit_names",
+        "is_transect",
+        "length",
+        "centroids",
+        "surveyor_names",
+        "surveyor_codes",
+    ],
+)
+
+
+def _static_inputs(survey) -> _StaticInputs:
+    """Intermediate products of `_resolve` that are the same for every run
+
+    Each one is cached on the `Survey` under the fingerprints of the building
+    blocks it is derived from, so it is only recomputed when one of those
+    blocks changes. Distributions are always read from the blocks themselves.
+    """
 
-    # Allocate surveyors to survey units based on method
-    # def _assign_surveyors(team, coverage):
-    if survey.team.assignment == "naive":
-        people = cycle(survey.team.df.loc[:, "surveyor_name"])
-        coverage_inputs["surveyor_name"] = [
-            next(people) for i in range(coverage_inputs.shape[0])
-        ]
-    elif survey.team.assignment == "speed":
-        # minimize total team time
-        # TODO: figure out how to optimize assignment
-        # Can calculate:
-        # - total search time,
-        # - individual surveyor's fraction of the total team time
-        pass
-    elif survey.team.assignment == "random":
-        pass
-
-    # Map surveyors to inputs df based on survey units
-    coverage_team = coverage_inputs.merge(
-        survey.team.df, how="left", on="surveyor_name"
+    if survey._fingerprints is None:
+        survey._fingerprints = {
+            kind: _fingerprint(getattr(survey, kind)) for kind in _BUILDING_BLOCKS
+        }
+    fp = survey._fingerprints
+    assemblage_df = survey.assemblage.df
+    coverage_df = survey.coverage.df
+
+    def _area_vis():
+        # the visibility looked up on the surface, or else the area polygon
+        # that each feature is in (-1, or NaN on a surface, outside the area)
+        polygon_idx = survey.area.locate(assemblage_df.geometry.to_numpy())
+        if isinstance(survey.area.vis, VisibilitySurface):
+            return np.where(
+                polygon_idx < 0, np.nan, survey.area.vis.sample(assemblage_df)
+            )
+        return polygon_idx
+
+    def _layers():
+        codes, layers = pd.factorize(assemblage_df.loc[:, "layer_name"])
+        return codes, np.asarray(layers)
+
+    def _units():
+        return (
+            (coverage_df.loc[:, "surveyunit_type"] == "transect").to_numpy(),
+            coverage_df.loc[:, "length"].to_numpy(dtype=float),
+        )
+
+    def _centroids():
+        centroids = shapely.centroid(coverage_df.geometry.to_numpy())
+        return shapely.get_x(centroids), shapely.get_y(centroids)
+
+    def _surveyors():
+        names = survey.team.df.loc[:, "surveyor_name"]
+        dtype = pd.CategoricalDtype(pd.unique(names))
+        # categorical code of each surveyor, with -1 for no surveyor
+        return dtype, np.append(dtype.categories.get_indexer(names), -1)
+
+    layer_codes, layers = survey._cached(("layers", fp["assemblage"]), _layers)
+    is_transect, length = survey._cached(("units", fp["coverage"]), _units)
+    surveyor_names, surveyor_codes = survey._cached(
+        ("surveyors", fp["team"]), _surveyors
     )
 
-    # Extract surveyor speed penalty values
-    coverage_team.loc[:, "speed_penalty_obs"] = _extract_values(
-        coverage_team, "speed_penalty"
+    return _StaticInputs(
+        unit_idx=survey._cached(
+            ("unit_idx", fp["assemblage"], fp["coverage"]),
+            lambda: _feature_unit_index(survey.assemblage, survey.coverage),
+        ),
+        area_vis=survey._cached(("area_vis", fp["area"], fp["assemblage"]), _area_vis),
+        feature_names=survey._cached(
+            ("feature_names", fp["assemblage"]),
+            lambda: pd.CategoricalDtype(
+                pd.unique(assemblage_df.loc[:, "feature_name"])
+            ),
+        ),
+        layer_codes=layer_codes,
+        layers=layers,
+        surveyunit_names=survey._cached(
+            ("surveyunit_names", fp["coverage"]),
+            lambda: pd.CategoricalDtype(
+                pd.unique(coverage_df.loc[:, "surveyunit_name"])
+            ),
+        ),
+        is_transect=is_transect,
+        length=length,
+        centroids=survey._cached(("centroids", fp["coverage"]), _centroids),
+        surveyor_names=surveyor_names,
+        surveyor_codes=surveyor_codes,
     )
 
-    # self.coverage_team = coverage_team
+
+def _walking_distance(
+    unit_surveyor: np.ndarray, xs: np.ndarray, ys: np.ndarray, n_team: int
+) -> np.ndarray:
+    """Distance walked by each surveyor between their consecutive survey units
+
+    Each surveyor visits their survey units in `Coverage.df` order and walks
+    in a straight line between the unit centroids.
+
+    Parameters
+    ----------
+    unit_surveyor : numpy ndarray
+        Positional index of the surveyor of each survey unit, with shape
+        `(n_runs, n_units)`
+    xs, ys : numpy ndarray
+        Centroid coordinates of each survey unit
+    n_team : int
+        Number of surveyors
+
+    Returns
+    -------
+    numpy ndarray
+        Array of shape `(n_runs, n_team)`
+    """
+    n_runs = unit_surveyor.shape[0]
+
+    # group each run's units by surveyor, keeping their order within a group
+    order = np.argsort(unit_surveyor, axis=1, kind="stable")
+    surveyors = np.take_along_axis(unit_surveyor, order, axis=1)
+    steps = np.hypot(np.diff(xs[order], axis=1), np.diff(ys[order], axis=1))
+
+    # only count steps between two units of the same surveyor
+    same = surveyors[:, 1:] == surveyors[:, :-1]
+    bins = np.arange(n_runs)[:, None] * n_team + surveyors[:, 1:]
+    return np.bincount(
+        bins[same], weights=steps[same], minlength=n_runs * n_team
+    ).reshape(n_runs, n_team)
+
+
+def _resolve(
+    survey,
+    run_ids: np.ndarray,
+    discovery_threshold: float = 0.0,
+    walking_speed: Optional[float] = None,
+) -> ResolvedRuns:
+    """Determine input parameters, resolve discovery probabilities, and calculate
+    search times for a batch of runs
+
+    The spatial work is done once for the whole batch. Only the random draws
+    vary between runs, so every input parameter is drawn as an array of shape
+    `(n_runs, n_rows)` and the outputs are computed with array operations.
+    """
+
+    run_ids = np.asarray(run_ids)
+    n_runs = run_ids.shape[0]
+    rngs = _run_rngs(survey.seed, run_ids)
+    static = _static_inputs(survey)
+
+    assemblage_inputs = survey.assemblage.df
+    n_features = assemblage_inputs.shape[0]
+
+    # get survey units (without their geometry)
+    coverage_inputs = pd.DataFrame(
+        survey.coverage.df.drop(columns=survey.coverage.df.geometry.name)
+    )
+
+    n_units = coverage_inputs.shape[0]
+    team_inputs = survey.team.df.reset_index(drop=True)
 
     # Find features that intersect coverage
-    assem_cov_team = gpd.sjoin(assemblage_inputs, coverage_team, how="left")
-    assert (
-        assem_cov_team.shape[0] == assemblage_inputs.shape[0]
-    ), "Problem with spatial join. Check for accidental spatial overlap in Coverage."
+    # record which survey unit it intersects (-1 if none)
+    unit_idx = static.unit_idx
+    covered = unit_idx >= 0
 
-    # record which survey unit it intersects (or NaN)
     # if intersects, set proximity to 1.0
     # else set proximity to 0.0
-    assem_cov_team.loc[:, "proximity_obs"] = np.where(
-        ~assem_cov_team.loc[:, "surveyunit_name"].isna(), 1.0, 0.0
+    proximity_obs = np.where(covered, 1.0, 0.0)
+
+    # Draw feature values
+    obs_rate = _draw_values(assemblage_inputs.loc[:, "ideal_obs_rate"], rngs)
+    time_penalty_obs = _draw_values(assemblage_inputs.loc[:, "time_penalty"], rngs)
+
+    # Draw surface visibility values from the visibility surface, or else
+    # from the area polygon each feature is in (NaN for features outside the
+    # area, which are never discovered)
+    if isinstance(survey.area.vis, VisibilitySurface):
+        vis_obs = survey.area.vis.draw(static.area_vis, rngs)
+    else:
+        vis_obs = _draw_values(
+            survey.area.df.loc[:, "vis"]
+            .reset_index(drop=True)
+            .reindex(static.area_vis),
+            rngs,
+        )
+
+    # Draw survey unit values and calculate search time
+    min_time_per_unit_obs = _draw_values(
+        coverage_inputs.loc[:, "min_time_per_unit"], rngs
+    )
+    base_search_time = np.where(
+        static.is_transect, min_time_per_unit_obs * static.length, min_time_per_unit_obs
     )
 
-    # Extract surveyor skill values
-    assem_cov_team.loc[:, "skill_obs"] = _extract_values(assem_cov_team, "skill")
+    # Allocate surveyors to survey units based on method
+    # (positional index into `team_inputs`, per run and survey unit)
+    unit_surveyor = survey.team.assign(base_search_time, rngs)
+    feature_surveyor = np.where(covered, unit_surveyor[:, unit_idx], -1)
 
-    # Calculate final probability of discovery
-    assem_cov_team.loc[:, "discovery_prob"] = (
-        assem_cov_team.loc[:, "obs_rate"]
-        * assem_cov_team.loc[:, "vis_obs"]
-        * assem_cov_team.loc[:, "proximity_obs"]
-        * assem_cov_team.loc[:, "skill_obs"]
+    # Draw surveyor speed penalty values (one per survey unit)
+    speed_penalty_obs = _draw_assigned(
+        team_inputs.loc[:, "speed_penalty"], unit_surveyor, rngs
     )
 
-    assem_cov_team.loc[:, "run"] = run_id
+    # Draw surveyor skill values (one per feature)
+    skill_obs = _draw_assigned(team_inputs.loc[:, "skill"], feature_surveyor, rngs)
 
-    discovery_df = assem_cov_team.loc[
+    # Calculate final probability of discovery
+    discovery_prob = obs_rate * vis_obs * proximity_obs * skill_obs
+
+    # Decide which features are discovered
+    # (features outside the coverage have a NaN probability and are never found)
+    draws = np.array([rng.random(n_features) for rng in rngs]).reshape(
+        n_runs, n_features
+    )
+    with np.errstate(invalid="ignore"):
+        discovered = (discovery_prob >= discovery_threshold) & (draws < discovery_prob)
+
+    # Names are stored as categoricals (integer codes) that share their
+    # categories across batches. Static attributes and geometries stay in
+    # `Survey.features`, `Survey.surveyunits`, and `Survey.surveyors`.
+    feature_names = static.feature_names
+    surveyunit_names = static.surveyunit_names
+    surveyor_names = static.surveyor_names
+    # categorical code of each row of `team_inputs`, with -1 for no surveyor
+    surveyor_codes = static.surveyor_codes
+
+    # One row per feature per run
+    raw = pd.DataFrame(
+        {
+            "run": np.repeat(run_ids, n_features),
+            "feature_name": _tile_names(
+                assemblage_inputs.loc[:, "feature_name"], feature_names, n_runs
+            ),
+            "surveyunit_name": _tile_names(
+                coverage_inputs.loc[:, "surveyunit_name"].reindex(unit_idx),
+                surveyunit_names,
+                n_runs,
+            ),
+            "surveyor_name": pd.Categorical.from_codes(
+                surveyor_codes[feature_surveyor].ravel(), dtype=surveyor_names
+            ),
+            "obs_rate": obs_rate.ravel(),
+            "time_penalty_obs": time_penalty_obs.ravel(),
+            "vis_obs": vis_obs.ravel(),
+            "min_time_per_unit_obs": _per_feature(
+                min_time_per_unit_obs, unit_idx
+            ).ravel(),
+            "base_search_time": _per_feature(base_search_time, unit_idx).ravel(),
+            "speed_penalty_obs": _per_feature(speed_penalty_obs, unit_idx).ravel(),
+            "proximity_obs": np.tile(proximity_obs, n_runs),
+            "skill_obs": skill_obs.ravel(),
+            "discovery_prob": discovery_prob.ravel(),
+            "discovered": discovered.ravel(),
+        }
+    )
+
+    discovery_df = raw.loc[
         :,
         [
             "run",
             "feature_name",
-            "shape",
             "obs_rate",
             "vis_obs",
             "proximity_obs",
             "skill_obs",
             "discovery_prob",
+            "discovered",
         ],
     ]
 
+    # Count features and discoveries by layer
+    layer_codes, layers = static.layer_codes, static.layers
+    n_layers = layers.shape[0]
+    layer_bins = (np.arange(n_runs)[:, None] * n_layers + layer_codes).ravel()
+    discovery_counts = pd.DataFrame(
+        {
+            "run": np.repeat(run_ids, n_layers),
+            "layer_name": np.tile(layers, n_runs),
+            "n_features": np.tile(np.bincount(layer_codes, minlength=n_layers), n_runs),
+            "n_discovered": np.bincount(
+                layer_bins, weights=discovered.ravel(), minlength=n_runs * n_layers
+            ).astype(int),
+        }
+    )
+
     # Calculate time stats
     # TODO: Duplicate calculations for threshold and no threshold
 
-    # def _total_time_calc(
-    #     df,
-    #     out_col="total",
-    #     base_col="base_search_time",
-    #     t_pen_col="time_penalty_obs",
-    #     speed_pen_col="speed_penalty_obs",
-    # ):
-    #     base_pen = df.loc[:, base_col] + df.loc[:, t_pen_col]
-    #     df.loc[:, out_col] = (base_pen) + (
-    #         base_pen * df.loc[:, speed_pen_col]
-    #     )
-    #     return df
-
-    # groupby survey unit
-    time_per_surveyunit = (
-        assem_cov_team.groupby(["surveyunit_name", "surveyor_name", "base_search_time"])
-        .agg({"time_penalty_obs": "sum", "speed_penalty_obs": "mean"})
-        .reset_index()
-        .rename(columns={"time_penalty_obs": "sum_time_penalty_obs"})
-    )
+    # sum feature time penalties by survey unit
+    run_offsets = np.arange(n_runs)[:, None] * n_units
+    sum_time_penalty_obs = np.bincount(
+        (run_offsets + unit_idx[covered]).ravel(),
+        weights=time_penalty_obs[:, covered].ravel(),
+        minlength=n_runs * n_units,
+    ).reshape(n_runs, n_units)
 
     # base penalty = base search time + sum(artifact penalties)
 
@@ -307,71 +1344,102 @@ def _resolve(survey, run_id: int):
     # total time =
     # base penalty + surveyor penalty
 
-    base_pen = (
-        time_per_surveyunit.loc[:, "base_search_time"]
-        + time_per_surveyunit.loc[:, "sum_time_penalty_obs"]
-    )
-
-    surveyor_pen = base_pen * time_per_surveyunit.loc[:, "speed_penalty_obs"]
-
-    # multiply above base
-    time_per_surveyunit.loc[:, "total_time_per_surveyunit"] = base_pen + surveyor_pen
+    base_pen = base_search_time + sum_time_penalty_obs
+    surveyor_pen = base_pen * speed_penalty_obs
+    total_time_per_surveyunit = base_pen + surveyor_pen
 
-    time_per_surveyunit.loc[:, "run"] = run_id
-
-    time_surveyunit = time_per_surveyunit.loc[
-        :,
-        [
-            "run",
-            "surveyunit_name",
-            "surveyor_name",
-            "base_search_time",
-            "sum_time_penalty_obs",
-            "speed_penalty_obs",
-            "total_time_per_surveyunit",
-        ],
+    # only survey units that contain features are reported, sorted by name
+    units = np.unique(unit_idx[covered])
+    units = units[
+        np.argsort(
+            coverage_inputs.loc[:, "surveyunit_name"].to_numpy()[units], kind="stable"
+        )
     ]
+    n_out_units = units.shape[0]
+    unit_surveyors = surveyor_codes[unit_surveyor[:, units]]
+
+    time_surveyunit = pd.DataFrame(
+        {
+            "run": np.repeat(run_ids, n_out_units),
+            "surveyunit_name": _tile_names(
+                coverage_inputs.loc[:, "surveyunit_name"].iloc[units],
+                surveyunit_names,
+                n_runs,
+            ),
+            "surveyor_name": pd.Categorical.from_codes(
+                unit_surveyors.ravel(), dtype=surveyor_names
+            ),
+            "base_search_time": base_search_time[:, units].ravel(),
+            "sum_time_penalty_obs": sum_time_penalty_obs[:, units].ravel(),
+            "speed_penalty_obs": speed_penalty_obs[:, units].ravel(),
+            "total_time_per_surveyunit": total_time_per_surveyunit[:, units].ravel(),
+        }
+    )
 
-    total_time = time_surveyunit.loc[:, "total_time_per_surveyunit"].sum()
-
-    # per surveyor
-    time_per_surveyor = (
-        time_surveyunit.groupby("surveyor_name")
-        .agg(
-            {
-                "base_search_time": "sum",
-                "sum_time_penalty_obs": "sum",
-                "speed_penalty_obs": "mean",
-                "total_time_per_surveyunit": "sum",
-            }
-        )
-        .reset_index()
-        .rename(
-            columns={
-                "base_search_time": "sum_base_search_time",
-                "total_time_per_surveyunit": "total_time_per_surveyor",
-            }
-        )
+    total_time = total_time_per_surveyunit[:, units].sum()
+
+    # per surveyor (that has reported survey units in the run), sorted by name
+    name_rank = np.argsort(np.argsort(surveyor_names.categories.to_numpy()))
+    n_surveyors = surveyor_names.categories.shape[0]
+    surveyor_bins = (
+        np.arange(n_runs)[:, None] * n_surveyors + name_rank[unit_surveyors]
+    ).ravel()
+    n_units_per_surveyor = np.bincount(surveyor_bins, minlength=n_runs * n_surveyors)
+    reported = n_units_per_surveyor > 0
+    name_order = np.argsort(name_rank)
+
+    def _sum_by_surveyor(vals):
+        return np.bincount(
+            surveyor_bins,
+            weights=vals[:, units].ravel(),
+            minlength=n_runs * n_surveyors,
+        )[reported]
+
+    time_surveyor = pd.DataFrame(
+        {
+            "run": np.repeat(run_ids, n_surveyors)[reported],
+            "surveyor_name": pd.Categorical.from_codes(
+                np.tile(name_order, n_runs)[reported], dtype=surveyor_names
+            ),
+            "sum_base_search_time": _sum_by_surveyor(base_search_time),
+            "sum_time_penalty_obs": _sum_by_surveyor(sum_time_penalty_obs),
+            "speed_penalty_obs": _sum_by_surveyor(speed_penalty_obs)
+            / n_units_per_surveyor[reported],
+            "total_time_per_surveyor": _sum_by_surveyor(total_time_per_surveyunit),
+        }
     )
 
-    time_per_surveyor.loc[:, "run"] = run_id
+    # Elapsed time of the team working in parallel: each surveyor's search
+    # time plus walking between their survey units, maximized over surveyors
+    n_team = team_inputs.shape[0]
+    search_time_per_member = np.bincount(
+        (np.arange(n_runs)[:, None] * n_team + unit_surveyor[:, units]).ravel(),
+        weights=total_time_per_surveyunit[:, units].ravel(),
+        minlength=n_runs * n_team,
+    ).reshape(n_runs, n_team)
+    if walking_speed is None:
+        walk_time_per_member = np.zeros((n_runs, n_team))
+    else:
+        xs, ys = static.centroids
+        walk_time_per_member = (
+            _walking_distance(unit_surveyor, xs, ys, n_team) / walking_speed
+        )
 
-    time_surveyor = time_per_surveyor.loc[
-        :,
-        [
-            "run",
-            "surveyor_name",
-            "sum_base_search_time",
-            "sum_time_penalty_obs",
-            "speed_penalty_obs",
-            "total_time_per_surveyor",
-        ],
-    ]
+    time_team = pd.DataFrame(
+        {
+            "run": run_ids,
+            "total_time": search_time_per_member.sum(axis=1),
+            "walk_time": walk_time_per_member.sum(axis=1),
+            "makespan": (search_time_per_member + walk_time_per_member).max(axis=1),
+        }
+    )
 
-    return ResolvedRun(
-        raw=assem_cov_team,
+    return ResolvedRuns(
+        raw=raw,
         discovery=discovery_df,
+        discovery_counts=discovery_counts,
         time_surveyunit=time_surveyunit,
         time_surveyor=time_surveyor,
+        time_team=time_team,
         total_time=total_time,
     )
@@ -1,6 +1,8 @@
-from typing import List
+from typing import List, Union
 
+import numpy as np
 import pandas as pd
+from scipy.stats._distn_infrastructure import rv_frozen
 
 from .surveyor import Surveyor
 
@@ -19,10 +21,12 @@ class Team:
         * 'naive' - cycle through `Team.df` in index order, assigning surveyors
           to survey units in `Coverage.df` in index order until all survey
           units have a surveyor.
-        * 'speed' - calculate the total base time required for the coverage and
-          allocate survey units proportional to surveyor speed.
-        * 'random' - for each survey unit, randomly select (with replacement)
-          a surveyor from the team
+        * 'speed' - in each run, balance the search time between surveyors:
+          survey units are taken from longest to shortest base search time
+          and each goes to the surveyor who would finish it first, given
+          their expected speed penalty (longest-processing-time heuristic).
+        * 'random' - in each run, randomly shuffle the 'naive' assignment, so
+          that every surveyor still gets an equal share of survey units.
 
     Attributes
     ----------
@@ -44,12 +48,97 @@ class Team:
     ):
         """Create a `Team` instance."""
 
+        assert assignment in (
+            "naive",
+            "speed",
+            "random",
+        ), "assignment must be 'naive', 'speed', or 'random'"
+
         self.name = name
         self.surveyor_list = surveyor_list
-        self.assignment = assignment  # TODO
+        self.assignment = assignment
 
         self.df = pd.DataFrame([surveyor.to_dict() for surveyor in self.surveyor_list])
 
+    @classmethod
+    def from_dataframe(
+        cls,
+        df: pd.DataFrame,
+        name: str,
+        surveyor_name: str = "surveyor_name",
+        surveyor_type: str = "surveyor",
+        skill: Union[float, rv_frozen, str] = 1.0,
+        speed_penalty: Union[float, rv_frozen, str] = 0.0,
+        assignment: str = "naive",
+    ) -> "Team":
+        """Create a `Team` instance from a table of surveyor records, like
+        `walkers.csv` of a field-walking survey.
+
+        Records may repeat a surveyor (e.g., one row per walker per tract);
+        each surveyor is created once, from their first record.
+
+        Parameters
+        ----------
+        df : pandas DataFrame
+            Table of surveyor records
+        name : str
+            Unique name for the team
+        surveyor_name : str, optional
+            Column identifying each surveyor (the default is 'surveyor_name')
+        surveyor_type : str, optional
+            Name of the column that holds the type of each surveyor, or else
+            the type of all surveyors (the default is 'surveyor')
+        skill : Union[float, rv_frozen, str], optional
+            Skill of all surveyors, or the name of the column that holds it
+            (the default is 1.0)
+        speed_penalty : Union[float, rv_frozen, str], optional
+            Speed penalty of all surveyors, or the name of the column that
+            holds it (the default is 0.0)
+        assignment : {'naive', 'speed', 'random'}, optional
+            Strategy for assigning team members to survey units (the default
+            is 'naive')
+
+        Returns
+        -------
+        Team
+
+        Raises
+        ------
+        KeyError
+            If `surveyor_name`, `skill` or `speed_penalty` names a column that
+            is not in `df`
+        """
+
+        records = df.drop_duplicates(subset=surveyor_name)
+
+        def _column_or_value(value, is_column):
+            if is_column:
+                return records[value].tolist()
+            return [value] * records.shape[0]
+
+        # a surveyor type may be a column or a value, but skill and speed
+        # penalty strings always name a column
+        surveyor_types = _column_or_value(
+            surveyor_type, surveyor_type in records.columns
+        )
+
+        surveyor_list = [
+            Surveyor(
+                name=str(surveyor),
+                team_name=name,
+                surveyor_type=kind,
+                skill=surveyor_skill,
+                speed_penalty=penalty,
+            )
+            for surveyor, kind, surveyor_skill, penalty in zip(
+                records[surveyor_name],
+                surveyor_types,
+                _column_or_value(skill, isinstance(skill, str)),
+                _column_or_value(speed_penalty, isinstance(speed_penalty, str)),
+            )
+        ]
+        return cls(name=name, surveyor_list=surveyor_list, assignment=assignment)
+
     def add_surveyors(self, surveyors: List[Surveyor]):
         """Update the Team with a new surveyor or surveyors
 
@@ -72,3 +161,57 @@ class Team:
         self.surveyor_list = [s for s in self.surveyor_list if s.name not in surveyors]
 
         self.df = self.df[~self.df["surveyor_name"].isin(surveyors)]
+
+    def assign(
+        self, base_search_time: np.ndarray, rngs: List[np.random.Generator]
+    ) -> np.ndarray:
+        """Assign a surveyor to each survey unit in each run, following
+        `Team.assignment`
+
+        Parameters
+        ----------
+        base_search_time : numpy ndarray
+            Base search time of each survey unit in each run, with shape
+            `(n_runs, n_units)`
+        rngs : List[numpy.random.Generator]
+            One random number generator per run
+
+        Returns
+        -------
+        numpy ndarray
+            Positional index into `Team.df` of the surveyor assigned to each
+            survey unit in each run, with shape `(n_runs, n_units)`
+        """
+
+        n_runs, n_units = base_search_time.shape
+        n_surveyors = self.df.shape[0]
+        naive = np.resize(np.arange(n_surveyors), n_units)
+
+        if self.assignment == "random":
+            return np.array([rng.permutation(naive) for rng in rngs]).reshape(
+                n_runs, n_units
+            )
+
+        if self.assignment == "speed":
+            # time factor of each surveyor, from their expected speed penalty
+            factor = 1.0 + np.array(
+                [
+                    penalty.mean() if isinstance(penalty, rv_frozen) else penalty
+                    for penalty in self.df.loc[:, "speed_penalty"]
+                ],
+                dtype=float,
+            )
+
+            # longest processing time first, for all runs at once
+            runs = np.arange(n_runs)
+            order = np.argsort(-base_search_time, axis=1, kind="stable")
+            load = np.zeros((n_runs, n_surveyors))
+            assigned = np.empty((n_runs, n_units), dtype=int)
+            for units in order.T:
+                unit_time = base_search_time[runs, units, np.newaxis] * factor
+                surveyors = np.argmin(load + unit_time, axis=1)
+                load[runs, surveyors] += unit_time[runs, surveyors]
+                assigned[runs, units] = surveyors
+            return assigned
+
+        return np.broadcast_to(naive, (n_runs, n_units))
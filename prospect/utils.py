@@ -1,19 +1,29 @@
-import warnings
+import hashlib
+from typing import Any, Optional, Tuple, Union
 
 import geopandas as gpd
+import numpy as np
+import pandas as pd
 import scipy.stats
+import shapely
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
 from scipy.stats._distn_infrastructure import rv_frozen
 
+from .area import Area
 
-def clip_points(points: gpd.GeoDataFrame, by: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+
+def clip_points(
+    points: gpd.GeoDataFrame, by: Union[Area, gpd.GeoDataFrame]
+) -> gpd.GeoDataFrame:
     """Subset a GeoDataFrame of points based on the boundaries of another GeoDataFrame.
 
     Parameters
     ----------
     points : geopandas GeoDataFrame
         Point features to be clipped
-    by : geopandas GeoDataFrame
-        Boundaries to use for clipping
+    by : Union[Area, geopandas GeoDataFrame]
+        Boundaries to use for clipping. An `Area` reuses its prepared shape
+        across calls.
 
     Returns
     -------
@@ -25,12 +35,19 @@ def clip_points(points: gpd.GeoDataFrame, by: gpd.GeoDataFrame) -> gpd.GeoDataFr
     Earth Analytics Python course, https://doi.org/10.5281/zenodo.2209415
     """
 
-    poly = by.geometry.unary_union
-    return points[points.geometry.intersects(poly)]
+    poly = _clipping_polygon(by)
+    geoms = points.geometry.values
+    xs, ys = shapely.get_x(geoms), shapely.get_y(geoms)
+
+    # only test the points inside the bounding box against the polygon
+    xmin, ymin, xmax, ymax = poly.bounds
+    keep = (xs >= xmin) & (xs <= xmax) & (ys >= ymin) & (ys <= ymax)
+    keep[keep] = shapely.intersects_xy(poly, xs[keep], ys[keep])
+    return points[keep]
 
 
 def clip_lines_polys(
-    lines_polys: gpd.GeoDataFrame, by: gpd.GeoDataFrame
+    lines_polys: gpd.GeoDataFrame, by: Union[Area, gpd.GeoDataFrame]
 ) -> gpd.GeoDataFrame:
     """Subset a GeoDataFrame of lines or polygons based on the boundaries of another GeoDataFrame.
 
@@ -38,8 +55,9 @@ def clip_lines_polys(
     ----------
     lines_polys : geopandas GeoDataFrame
         Features to be clipped
-    by : geopandas GeoDataFrame
-        Boundaries to use for clipping
+    by : Union[Area, geopandas GeoDataFrame]
+        Boundaries to use for clipping. An `Area` reuses its prepared shape
+        across calls.
 
     Returns
     -------
@@ -50,25 +68,55 @@ def clip_lines_polys(
     ----------
     Earth Analytics Python course, https://doi.org/10.5281/zenodo.2209415
     """
-    warnings.filterwarnings("ignore", "GeoSeries.notna", UserWarning)
-
     # Create a single polygon object for clipping
+    poly = _clipping_polygon(by)
+    keep, clipped_geoms = _clip_by_polygon(lines_polys.geometry.values, poly)
+
+    clipped = lines_polys[keep].copy()
+    clipped["geometry"] = gpd.GeoSeries(clipped_geoms, index=clipped.index)
+
+    # Return the clipped layer with no empty geometry values
+    return clipped[~clipped.geometry.is_empty]
+
+
+def _clipping_polygon(by: Union[Area, gpd.GeoDataFrame]):
+    """Single prepared (multi)polygon to clip by."""
+
+    if isinstance(by, Area):
+        return by.prepared_shape
     poly = by.geometry.unary_union
-    spatial_index = lines_polys.sindex
+    shapely.prepare(poly)
+    return poly
+
 
-    # Create a box for the initial intersection
-    bbox = poly.bounds
+def _clip_by_polygon(geoms: np.ndarray, poly) -> Tuple[np.ndarray, np.ndarray]:
+    """Clip an array of geometries by a single (multi)polygon.
 
-    # Get a list of id's for each object that overlaps the bounding box and subset the data to just those objects
-    sidx = list(spatial_index.intersection(bbox))
-    thing_sub = lines_polys.iloc[sidx]
+    The polygon is prepared so that the intersects and containment checks are
+    fast, and the actual intersection is only computed for the geometries that
+    cross its boundary.
+
+    Parameters
+    ----------
+    geoms : numpy ndarray
+        Array of shapely geometries to clip
+    poly : Union[Polygon, MultiPolygon]
+        Boundaries to use for clipping
 
-    # Clip the data - with these data
-    clipped = thing_sub.copy()
-    clipped["geometry"] = thing_sub.intersection(poly)
+    Returns
+    -------
+    keep : numpy ndarray
+        Boolean mask of the `geoms` that intersect `poly`
+    clipped : numpy ndarray
+        The kept geometries, clipped by `poly`
+    """
 
-    # Return the clipped layer with no null geometry values
-    return clipped[(~clipped.geometry.is_empty) & (clipped.geometry.notna())]
+    shapely.prepare(poly)
+    keep = shapely.intersects(poly, geoms)
+    clipped = np.array(geoms[keep], dtype=object)
+    crossing = ~shapely.contains_properly(poly, clipped)
+    clipped[crossing] = shapely.intersection(clipped[crossing], poly)
+    return keep, clipped
 
 
 def beta(a: float, b: float, **kwargs) -> rv_frozen:
@@ -111,3 +159,64 @@ def truncnorm(mean: float, sd: float, lower: float, upper: float) -> rv_frozen:
     return scipy.stats.truncnorm(
         (lower - mean) / sd, (upper - mean) / sd, loc=mean, scale=sd
     )
+
+
+def _geometry_hash(gdf: gpd.GeoDataFrame) -> str:
+    """Content hash of the geometries of a `GeoDataFrame`"""
+    return hashlib.sha1(b"".join(gdf.geometry.to_wkb())).hexdigest()
+
+
+def _frame_hash(df: pd.DataFrame) -> str:
+    """Content hash of all columns of a `DataFrame` or `GeoDataFrame`
+
+    Geometries are hashed on their WKB and distributions on their parameters.
+    Other objects, like a `VisibilitySurface`, are hashed on their identity.
+    """
+
+    digest = hashlib.sha1()
+    for col in df.columns:
+        values = df[col]
+        digest.update(str(col).encode())
+        if isinstance(values, gpd.GeoSeries):
+            digest.update(b"".join(wkb or b"" for wkb in values.to_wkb()))
+        elif is_numeric_dtype(values) or is_bool_dtype(values):
+            digest.update(str(values.dtype).encode())
+            digest.update(np.ascontiguousarray(values.to_numpy()).tobytes())
+        else:
+            codes, uniques = pd.factorize(values.to_numpy(dtype=object))
+            digest.update(codes.tobytes())
+            digest.update("\x1f".join(_token(item) for item in uniques).encode())
+    return digest.hexdigest()
+
+
+def _token(item: Any) -> str:
+    """String that identifies a value in `_frame_hash`"""
+
+    if isinstance(item, rv_frozen):
+        return f"{item.dist.name}{item.args}{sorted(item.kwds.items())}"
+    if item is None or isinstance(item, (str, int, float, bool, np.generic)):
+        return repr(item)
+    return f"{type(item).__name__}@{id(item)}"
+
+
+def _get_rng(rng: Optional[Union[np.random.Generator, int]] = None):
+    """Source of random numbers for the point generators.
+
+    Parameters
+    ----------
+    rng : Union[numpy.random.Generator, int], optional
+        Random number generator or seed for a new one (the default is None,
+        which uses the module-level functions of `numpy.random`, so that
+        seeding with `numpy.random.seed()` reproduces the points like before
+        generators could be passed)
+
+    Returns
+    -------
+    numpy.random.Generator or module
+        An object with `uniform()`, `poisson()` and `normal()` methods
+    """
+
+    # the module itself is passed on by generators that call each other
+    if rng is None or rng is np.random:
+        return np.random
+    return np.random.default_rng(rng)
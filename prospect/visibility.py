@@ -0,0 +1,251 @@
+import collections
+from typing import Optional, Sequence, Union
+
+import geopandas as gpd
+import numpy as np
+import shapely
+from scipy.stats._distn_infrastructure import rv_frozen
+from shapely.geometry import Polygon
+
+from .utils import _geometry_hash
+
+
+class VisibilitySurface:
+    """Surface visibility that varies across an `Area`
+
+    A `VisibilitySurface` can be used as the `vis` of an `Area`. It is either
+    a raster of visibility values with an affine transform, or a set of
+    polygons with a visibility value each. This class is not normally created
+    directly; use `from_raster` or `from_polygons`.
+
+    Parameters
+    ----------
+    name : str
+        Unique name for the surface
+    values : numpy ndarray
+        Visibility values: a 2-D array of raster cells, or a 1-D array with
+        one value per polygon in `shapes`
+    transform : Sequence[float], optional
+        Affine transform `(a, b, c, d, e, f)` of the raster, mapping cell
+        `(col, row)` to `x = a * col + b * row + c` and
+        `y = d * col + e * row + f` (the default is None, for polygon
+        surfaces)
+    shapes : Sequence[Polygon], optional
+        Polygons of a polygon surface (the default is None, for raster
+        surfaces)
+    noise : Union[float, rv_frozen], optional
+        Distribution of the noise added to each feature's visibility in each
+        run. The result is clipped to [0, 1]. (the default is None, which adds
+        no noise)
+
+    Attributes
+    ----------
+    name : str
+        Name of the surface
+    values : numpy ndarray
+        Visibility values
+    transform : Tuple[float, float, float, float, float, float]
+        Affine transform of the raster
+    shapes : numpy ndarray
+        Polygons of a polygon surface
+    noise : Union[float, rv_frozen]
+        Distribution of the per-run noise
+    """
+
+    # looked up visibility values, keyed on the feature geometries
+    CACHE_SIZE = 8
+
+    def __init__(
+        self,
+        name: str,
+        values: np.ndarray,
+        transform: Optional[Sequence[float]] = None,
+        shapes: Optional[Sequence[Polygon]] = None,
+        noise: Optional[Union[float, rv_frozen]] = None,
+    ):
+        """Create a `VisibilitySurface` instance"""
+
+        assert (transform is None) != (
+            shapes is None
+        ), "Specify either a raster transform or polygon shapes"
+
+        self.name = name
+        self.values = np.asarray(values, dtype=float)
+        self.transform = None if transform is None else tuple(transform)[:6]
+        self.shapes = None if shapes is None else np.asarray(shapes, dtype=object)
+        self.noise = noise
+
+        if self.shapes is None:
+            assert self.values.ndim == 2, "Raster values must be a 2-D array"
+        else:
+            assert self.values.shape == (
+                self.shapes.shape[0],
+            ), "Need one value per polygon"
+
+        self._tree = None
+        self._cache: collections.OrderedDict = collections.OrderedDict()
+
+    def __repr__(self):
+        kind = "raster" if self.shapes is None else "polygons"
+        return f"VisibilitySurface(name={repr(self.name)}, {kind}={self.values.shape})"
+
+    def __str__(self):
+        return f"VisibilitySurface object '{self.name}'"
+
+    @classmethod
+    def from_raster(
+        cls,
+        name: str,
+        values: np.ndarray,
+        transform: Sequence[float],
+        nodata: Optional[float] = None,
+        noise: Optional[Union[float, rv_frozen]] = None,
+    ) -> "VisibilitySurface":
+        """Create a `VisibilitySurface` from a raster array
+
+        Parameters
+        ----------
+        name : str
+            Unique name for the surface
+        values : numpy ndarray
+            2-D array of visibility values, indexed `[row, col]`
+        transform : Sequence[float]
+            Affine transform `(a, b, c, d, e, f)` of the raster, as used by
+            GDAL and rasterio. An `affine.Affine` object also works.
+        nodata : float, optional
+            Value of cells without data. Features in those cells, or outside
+            the raster, have no visibility and are never discovered. (the
+            default is None)
+        noise : Union[float, rv_frozen], optional
+            Distribution of the noise added to each feature's visibility in
+            each run (the default is None, which adds no noise)
+
+        Returns
+        -------
+        VisibilitySurface
+        """
+
+        values = np.array(values, dtype=float)
+        if nodata is not None:
+            values[values == nodata] = np.nan
+        return cls(name=name, values=values, transform=transform, noise=noise)
+
+    @classmethod
+    def from_polygons(
+        cls,
+        name: str,
+        shapes: Sequence[Polygon],
+        values: Sequence[float],
+        noise: Optional[Union[float, rv_frozen]] = None,
+    ) -> "VisibilitySurface":
+        """Create a `VisibilitySurface` from polygons of constant visibility
+
+        Parameters
+        ----------
+        name : str
+            Unique name for the surface
+        shapes : Sequence[Polygon]
+            Polygons of constant visibility. Features outside all of them
+            have no visibility and are never discovered.
+        values : Sequence[float]
+            Visibility value of each polygon
+        noise : Union[float, rv_frozen], optional
+            Distribution of the noise added to each feature's visibility in
+            each run (the default is None, which adds no noise)
+
+        Returns
+        -------
+        VisibilitySurface
+        """
+
+        return cls(name=name, values=values, shapes=shapes, noise=noise)
+
+    def sample(self, gdf: gpd.GeoDataFrame) -> np.ndarray:
+        """Look up the visibility at each geometry of `gdf`
+
+        Non-point geometries are looked up at a point on their surface. The
+        result is cached on the content of the geometries, so repeated runs
+        over the same `Assemblage` only look it up once.
+
+        Parameters
+        ----------
+        gdf : geopandas GeoDataFrame
+            Features to look up, e.g. `Assemblage.df`
+
+        Returns
+        -------
+        numpy ndarray
+            Visibility value of each row of `gdf` (NaN where there is none)
+        """
+
+        key = _geometry_hash(gdf)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        pts = shapely.point_on_surface(gdf.geometry.to_numpy())
+        if self.shapes is None:
+            vals = self._sample_raster(shapely.get_x(pts), shapely.get_y(pts))
+        else:
+            vals = self._sample_polygons(pts)
+        vals.setflags(write=False)
+
+        self._cache[key] = vals
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return vals
+
+    def draw(self, vals: np.ndarray, rngs: Sequence[np.random.Generator]) -> np.ndarray:
+        """Add per-run noise to looked up visibility values
+
+        Parameters
+        ----------
+        vals : numpy ndarray
+            Visibility value of each feature, from `sample`
+        rngs : Sequence[numpy.random.Generator]
+            One random number generator per run
+
+        Returns
+        -------
+        numpy ndarray
+            Array of shape `(len(rngs), len(vals))`
+        """
+
+        n_runs = len(rngs)
+        if self.noise is None:
+            return np.broadcast_to(vals, (n_runs, vals.shape[0]))
+
+        if isinstance(self.noise, rv_frozen):
+            noise = np.array(
+                [self.noise.rvs(size=vals.shape[0], random_state=rng) for rng in rngs]
+            ).reshape(n_runs, vals.shape[0])
+        else:
+            noise = float(self.noise)
+        return np.clip(vals + noise, 0.0, 1.0)
+
+    def _sample_raster(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Index raster cells by inverting the affine transform"""
+
+        a, b, c, d, e, f = self.transform
+        det = a * e - b * d
+        cols = np.floor((e * (xs - c) - b * (ys - f)) / det)
+        rows = np.floor((a * (ys - f) - d * (xs - c)) / det)
+
+        n_rows, n_cols = self.values.shape
+        inside = (rows >= 0) & (rows < n_rows) & (cols >= 0) & (cols < n_cols)
+        vals = np.full(xs.shape[0], np.nan)
+        vals[inside] = self.values[rows[inside].astype(int), cols[inside].astype(int)]
+        return vals
+
+    def _sample_polygons(self, pts: np.ndarray) -> np.ndarray:
+        """Find the polygon of each point with one bulk `STRtree` query"""
+
+        if self._tree is None:
+            self._tree = shapely.STRtree(self.shapes)
+        pt_idx, poly_idx = self._tree.query(pts, predicate="intersects")
+
+        # the first polygon wins where polygons overlap
+        n_polys = self.shapes.shape[0]
+        idx = np.full(pts.shape[0], n_polys)
+        np.minimum.at(idx, pt_idx, poly_idx)
+        return np.append(self.values, np.nan)[idx]
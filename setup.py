@@ -98,6 +98,9 @@ setup(
     #   py_modules=["my_module"],
     #
     packages=find_packages(exclude=["docs", "tests"]),  # Required
+    # Specify which Python versions you support. 'pip install' will refuse to
+    # install the project on other versions.
+    python_requires=">=3.8",
     # This field lists other packages that your project depends on to run.
     # Any package you put here will be installed by pip when your project is
     # installed, so they must be valid existing projects.
@@ -108,6 +111,7 @@ setup(
         "pandas",
         "numpy",
         "geopandas",
+        "shapely>=2.0",
         "scipy",
         "matplotlib",
     ],  # Optional
@@ -15,6 +15,50 @@ def a_survey():
     return prospect.Survey(name="test_survey")
 
 
+@pytest.fixture(scope="module")
+def a_full_survey():
+    area = prospect.Area.from_area_value(
+        name="test_area", value=10000, vis=prospect.utils.beta(9, 1)
+    )
+    layer = prospect.Layer.from_pseudorandom_points(
+        n=50,
+        name="test_layer",
+        area=area,
+        time_penalty=prospect.utils.truncnorm(10, 2, 0, 20),
+        ideal_obs_rate=0.8,
+    )
+    assemblage = prospect.Assemblage(name="test_assemblage", layer_list=[layer])
+    coverage = prospect.Coverage.from_transects(
+        name="test_coverage", area=area, min_time_per_unit=0.5
+    )
+    team = prospect.Team(
+        name="test_team",
+        surveyor_list=[
+            prospect.Surveyor(
+                name="surveyor_a",
+                team_name="test_team",
+                surveyor_type="expert",
+                skill=prospect.utils.beta(8, 2),
+                speed_penalty=0.1,
+            ),
+            prospect.Surveyor(
+                name="surveyor_b",
+                team_name="test_team",
+                surveyor_type="novice",
+                skill=0.6,
+                speed_penalty=prospect.utils.truncnorm(0.3, 0.1, 0, 1),
+            ),
+        ],
+    )
+    return prospect.Survey(
+        name="test_full_survey",
+        area=area,
+        assemblage=assemblage,
+        coverage=coverage,
+        team=team,
+    )
+
+
 # `Area` FIXTURES
 
 
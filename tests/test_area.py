@@ -1,7 +1,10 @@
+import geopandas as gpd
+import numpy as np
 import pytest
+import shapely
 from geopandas import GeoDataFrame
 from scipy.stats._distn_infrastructure import rv_frozen
-from shapely.geometry import Polygon
+from shapely.geometry import Point, Polygon, box
 
 import prospect
 
@@ -15,6 +18,56 @@ def test_has_desired_attributes(an_area):
         assert hasattr(an_area, a)
 
 
+def test_prepared_shape_is_prepared_and_reused(an_area):
+    assert shapely.is_prepared(an_area.prepared_shape)
+    assert an_area.prepared_shape is an_area.prepared_shape
+    assert an_area.prepared_shape.equals(an_area.shape)
+
+
+def test_derived_geometry_matches_shape_and_is_reused(an_area):
+    assert an_area.bounds == an_area.shape.bounds
+    assert an_area.area == an_area.shape.area
+    assert an_area.minimum_rotated_rectangle.equals(
+        an_area.shape.minimum_rotated_rectangle
+    )
+    assert an_area.centroid.equals(an_area.shape.centroid)
+    assert an_area.minimum_rotated_rectangle is an_area.minimum_rotated_rectangle
+
+
+def test_from_polygons_has_row_and_vis_per_polygon():
+    shapes = [box(0, 0, 10, 10), box(10, 0, 20, 10), box(30, 0, 40, 10)]
+    area = prospect.Area.from_polygons(
+        name="test_area", shapes=shapes, vis=[0.2, 0.5, prospect.utils.beta(9, 1)]
+    )
+
+    assert area.df.shape[0] == 3
+    assert area.df["vis"].tolist()[:2] == [0.2, 0.5]
+    assert area.area == 300
+    assert area.shape.geom_type == "MultiPolygon"
+
+
+@pytest.mark.parametrize("vis", [0.8, 1, np.float32(0.8), np.int64(1)])
+def test_from_polygons_repeats_scalar_vis(vis):
+    shapes = [box(0, 0, 10, 10), box(10, 0, 20, 10)]
+    area = prospect.Area.from_polygons(name="test_area", shapes=shapes, vis=vis)
+    assert area.df["vis"].tolist() == [vis, vis]
+
+
+def test_from_shapefile_all_features_keeps_crs():
+    path = "./tests/test_data/shapefiles/areas/leiap_field1.shp"
+    area = prospect.Area.from_shapefile(name="test_area", path=path, all_features=True)
+    assert area.df.crs is not None
+    assert area.df.crs == gpd.read_file(path).crs
+
+
+def test_locate_returns_polygon_of_each_geometry():
+    area = prospect.Area.from_polygons(
+        name="test_area", shapes=[box(0, 0, 10, 10), box(10, 0, 20, 10)]
+    )
+    points = [Point(5, 5), Point(15, 5), Point(50, 50), Point(10, 5)]
+    assert area.locate(points).tolist() == [0, 1, -1, 0]
+
+
 def test_name_attribute_str(an_area):
     assert isinstance(an_area.name, str)
 
@@ -1,4 +1,9 @@
+import geopandas as gpd
+import numpy as np
+import pytest
+
 import prospect
+from prospect.utils import clip_lines_polys
 
 
 def test_returns_Coverage(a_coverage):
@@ -76,3 +81,121 @@ def test_from_transects_optimize_area_coverage_short_creates_expected(
     assert coverage.sweep_width == 2
     assert coverage.radius is None
     assert coverage.df.shape == (101, 8)
+
+
+@pytest.mark.parametrize("surveyunit_type", ["transect", "radial"])
+def test_area_coverage_function_matches_clipped_buffer_area(
+    an_area_from_shapefile, surveyunit_type
+):
+    centroid = an_area_from_shapefile.df.geometry[0].minimum_rotated_rectangle.centroid
+    units = prospect.Coverage._make_unit_bases(
+        surveyunit_type=surveyunit_type,
+        area=an_area_from_shapefile,
+        centroid=centroid,
+        spacing=10.0,
+    )
+    coverage_area = prospect.Coverage._area_coverage_function(
+        units, centroid, area=an_area_from_shapefile, buffer=2.0
+    )
+
+    degs = np.array([0.0, 37.5, 90.0])
+    expected = [
+        clip_lines_polys(
+            gpd.GeoDataFrame({"geometry": units.rotate(deg, origin=centroid)}),
+            an_area_from_shapefile.df,
+        )
+        .buffer(2.0)
+        .area.sum()
+        for deg in degs
+    ]
+    np.testing.assert_allclose(coverage_area(degs), expected)
+
+
+def test_optimize_area_coverage_beats_every_grid_angle(an_area_from_shapefile):
+    centroid = an_area_from_shapefile.df.geometry[0].minimum_rotated_rectangle.centroid
+    units = prospect.Coverage._make_unit_bases(
+        surveyunit_type="transect",
+        area=an_area_from_shapefile,
+        centroid=centroid,
+        spacing=10.0,
+    )
+    coverage_area = prospect.Coverage._area_coverage_function(
+        units, centroid, area=an_area_from_shapefile, buffer=2.0
+    )
+
+    orientation = prospect.Coverage._optimize_orientation_by_area_coverage(
+        units, centroid, area=an_area_from_shapefile, buffer=2.0, increment=10.0
+    )
+    assert 0 <= orientation < 180
+    assert coverage_area(orientation)[0] >= coverage_area(np.arange(0, 180, 10.0)).max()
+
+
+def test_from_radials_builds_surveyunits_lazily(a_rectangular_area):
+    coverage = prospect.Coverage.from_radials(
+        name="test_Coverage_from_radials", area=a_rectangular_area, spacing=50
+    )
+
+    assert coverage._surveyunit_list is None
+    assert coverage.df["surveyunit_name"].is_unique
+    assert [su.name for su in coverage.surveyunit_list] == list(
+        coverage.df["surveyunit_name"]
+    )
+    assert all(su.surveyunit_type == "radial" for su in coverage.surveyunit_list)
+
+
+def _overlay_units(area, coverage, buffer):
+    """Survey units of `coverage` built like before prepared clipping: clip
+    the unit bases in spatial index order, buffer them, and intersect the
+    buffers with the area using `gpd.overlay`"""
+    centroid = area.minimum_rotated_rectangle.centroid
+    bases = prospect.Coverage._make_unit_bases(
+        surveyunit_type=coverage.df["surveyunit_type"].iloc[0],
+        area=area,
+        centroid=centroid,
+        spacing=coverage.spacing,
+    ).rotate(coverage.orientation, origin=centroid)
+    bases = gpd.GeoDataFrame({"geometry": bases}, geometry="geometry")
+
+    bases = bases.iloc[bases.sindex.intersection(area.bounds)]
+    clipped = bases.intersection(area.shape)
+    clipped = clipped[~clipped.is_empty]
+    buffers = gpd.GeoDataFrame({"geometry": clipped.buffer(buffer)})
+    return gpd.overlay(buffers, area.df, how="intersection").geometry
+
+
+@pytest.mark.parametrize(
+    "field", ["leiap_field1.shp", "leiap_field2.shp", "leiap_field6.shp"]
+)
+@pytest.mark.parametrize("optimize_orient_by", [None, "area_orient"])
+def test_from_transects_keeps_overlay_order(field, optimize_orient_by):
+    area = prospect.Area.from_shapefile(
+        name="test_area", path=f"./tests/test_data/shapefiles/areas/{field}"
+    )
+    coverage = prospect.Coverage.from_transects(
+        name="ordered", area=area, optimize_orient_by=optimize_orient_by
+    )
+
+    expected = _overlay_units(area, coverage, buffer=2.0)
+    assert coverage.df.shape[0] == expected.shape[0]
+    assert coverage.df.geometry.centroid.distance(
+        expected.centroid.set_axis(coverage.df.index)
+    ).max() == pytest.approx(0.0, abs=1e-6)
+    assert coverage.df["surveyunit_name"].to_list() == [
+        f"ordered_{i}" for i in range(coverage.df.shape[0])
+    ]
+
+
+@pytest.mark.parametrize("field", ["leiap_field1.shp", "leiap_field6.shp"])
+def test_from_radials_keeps_overlay_order(field):
+    area = prospect.Area.from_shapefile(
+        name="test_area", path=f"./tests/test_data/shapefiles/areas/{field}"
+    )
+    coverage = prospect.Coverage.from_radials(
+        name="ordered", area=area, optimize_orient_by="area_orient"
+    )
+
+    expected = _overlay_units(area, coverage, buffer=coverage.radius)
+    assert coverage.df.shape[0] == expected.shape[0]
+    assert coverage.df.geometry.centroid.distance(
+        expected.centroid.set_axis(coverage.df.index)
+    ).max() == pytest.approx(0.0, abs=1e-6)
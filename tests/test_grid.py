@@ -0,0 +1,106 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+import prospect
+
+
+@pytest.fixture(scope="module")
+def a_grid(a_full_survey):
+    grid = prospect.SurveyGrid(
+        name="test_grid",
+        area=a_full_survey.area,
+        team=a_full_survey.team,
+        seed=7,
+    )
+    grid.vary(
+        "coverage",
+        partial(
+            prospect.Coverage.from_transects,
+            name="grid_coverage",
+            area=a_full_survey.area,
+            min_time_per_unit=0.5,
+        ),
+        spacing=[10.0, 20.0],
+        sweep_width=[2.0, 4.0],
+    )
+    grid.vary(
+        "assemblage",
+        partial(
+            prospect.Layer.from_pseudorandom_points,
+            name="grid_layer",
+            area=a_full_survey.area,
+            ideal_obs_rate=0.9,
+            rng=3,
+        ),
+        n=[20, 80],
+    )
+    return grid
+
+
+def test_configs_are_cartesian_product(a_grid):
+    configs = a_grid.configs
+    assert configs.shape == (8, 3)
+    assert configs.index.name == "config"
+    assert configs.drop_duplicates().shape[0] == 8
+
+
+def test_factories_called_once_per_block(a_full_survey):
+    factory = partial(
+        prospect.Coverage.from_transects,
+        name="counted_coverage",
+        area=a_full_survey.area,
+        min_time_per_unit=0.5,
+    )
+    calls = []
+
+    def counted(**params):
+        calls.append(params)
+        return factory(**params)
+
+    grid = prospect.SurveyGrid(
+        name="counted",
+        area=a_full_survey.area,
+        assemblage=a_full_survey.assemblage,
+        team=a_full_survey.team,
+    )
+    grid.vary("coverage", counted, spacing=[10.0, 20.0, 40.0])
+    grid.run(n_runs=2)
+    grid.run(n_runs=2)
+    assert len(calls) == 3
+
+
+def test_run_returns_row_per_config_run_and_layer(a_grid):
+    results = a_grid.run(n_runs=3)
+    assert results.shape[0] == 8 * 3
+    assert list(results.columns[:5]) == ["config", "n", "spacing", "sweep_width", "run"]
+    assert (results["n_features"] == results["n"]).all()
+    assert {"n_discovered", "total_time", "makespan"} <= set(results.columns)
+
+
+def test_run_matches_survey(a_grid):
+    results = a_grid.run(n_runs=3)
+    survey = a_grid.surveys()[5]
+    survey.run(n_runs=3)
+    expected = pd.merge(
+        survey.discovery_counts, survey.time_team, on=["run", "config"]
+    ).drop(columns="config")
+    assert_frame_equal(
+        results.loc[results["config"] == 5, expected.columns].reset_index(drop=True),
+        expected,
+    )
+
+
+def test_run_with_executor(a_grid):
+    serial = a_grid.run(n_runs=2)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        parallel = a_grid.run(n_runs=2, n_jobs=2, executor=executor)
+    assert_frame_equal(serial, parallel)
+
+
+def test_parameter_names_must_be_unique(a_grid):
+    with pytest.raises(AssertionError):
+        a_grid.vary("team", lambda spacing: None, spacing=[1.0])
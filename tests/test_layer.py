@@ -1,3 +1,5 @@
+import numpy as np
+import pandas as pd
 import pytest
 from geopandas import GeoDataFrame
 
@@ -96,6 +98,17 @@ def test_from_pseudorandom_pts_creates_expected_25_points(
     assert a_layer_from_pseudorandom_points.df.shape[0] == 25
 
 
+def test_from_pseudorandom_pts_many_points_all_inside_area(an_area_from_shapefile):
+    layer = prospect.Layer.from_pseudorandom_points(
+        n=5000, name="layer_from_pseudorandom_pts", area=an_area_from_shapefile, rng=0
+    )
+    poly = an_area_from_shapefile.df.geometry.unary_union
+
+    assert len(layer.input_features) == 5000
+    assert layer.df.shape[0] == 5000
+    assert layer.df.geometry.intersects(poly).all()
+
+
 def test_from_pseudorandom_pts_df_attribute_gdf(a_layer_from_pseudorandom_points):
     assert isinstance(a_layer_from_pseudorandom_points.df, GeoDataFrame)
 
@@ -201,6 +214,135 @@ def test_from_matern_pts_df_attribute_gdf(a_layer_from_matern_points):
     assert isinstance(a_layer_from_matern_points.df, GeoDataFrame)
 
 
+def test_from_coordinates_returns_Layer(an_area):
+    xmin, ymin, xmax, ymax = an_area.df.total_bounds
+    xy = np.column_stack((np.linspace(xmin, xmax, 20), np.linspace(ymin, ymax, 20)))
+    layer = prospect.Layer.from_coordinates(xy, name="layer_from_coords", area=an_area)
+
+    assert isinstance(layer, prospect.Layer)
+    assert isinstance(layer.df, GeoDataFrame)
+
+
+def test_from_coordinates_clips_df_keeps_input_features(a_rectangular_area):
+    xmin, ymin, xmax, ymax = a_rectangular_area.df.total_bounds
+    xy = np.array([[xmin + 1, ymin + 1], [xmax - 1, ymax - 1], [xmax + 10, ymax + 10]])
+    layer = prospect.Layer.from_coordinates(
+        xy, name="layer_from_coords", area=a_rectangular_area, time_penalty=2.0
+    )
+
+    assert layer.df.shape[0] == 2
+    assert layer._input_features is None
+    assert len(layer.input_features) == 3
+    assert all(
+        isinstance(feature, prospect.Feature) for feature in layer.input_features
+    )
+    assert [feature.name for feature in layer.input_features] == [
+        "layer_from_coords_0",
+        "layer_from_coords_1",
+        "layer_from_coords_2",
+    ]
+    assert layer.input_features[2].time_penalty == 2.0
+
+
+@pytest.mark.parametrize(
+    "builder, kwargs",
+    [
+        ("from_poisson_points", {"rate": 0.001}),
+        ("from_thomas_points", {"parent_rate": 0.001, "child_rate": 5, "gauss_var": 5}),
+        ("from_matern_points", {"parent_rate": 0.001, "child_rate": 5, "radius": 5}),
+    ],
+)
+def test_point_process_same_rng_seed_same_points(
+    an_area_from_shapefile, builder, kwargs
+):
+    layers = [
+        getattr(prospect.Layer, builder)(
+            name="layer", area=an_area_from_shapefile, rng=42, **kwargs
+        )
+        for __ in range(2)
+    ]
+    assert layers[0].df.geometry.geom_equals(layers[1].df.geometry).all()
+
+
+@pytest.mark.parametrize(
+    "builder, kwargs",
+    [
+        ("from_poisson_points", {"rate": 0.001}),
+        ("from_thomas_points", {"parent_rate": 0.001, "child_rate": 5, "gauss_var": 5}),
+        ("from_matern_points", {"parent_rate": 0.001, "child_rate": 5, "radius": 5}),
+    ],
+)
+def test_point_process_without_rng_follows_global_seed(
+    an_area_from_shapefile, builder, kwargs
+):
+    layers = []
+    for __ in range(2):
+        np.random.seed(42)
+        layers.append(
+            getattr(prospect.Layer, builder)(
+                name="layer", area=an_area_from_shapefile, **kwargs
+            )
+        )
+    assert layers[0].df.geometry.geom_equals(layers[1].df.geometry).all()
+
+
+def test_uniform_disk_arrays_within_radius():
+    centers = np.zeros(1000)
+    xs, ys = prospect.Layer.uniform_disk(centers, centers + 10, 5, rng=1)
+    assert xs.shape == (1000,)
+    assert (np.hypot(xs, ys - 10) <= 5).all()
+
+
 def test_from_rectangles_raises_NotImplementedError(an_area_from_shapefile):
     with pytest.raises(NotImplementedError):
         prospect.Layer.from_rectangles(an_area_from_shapefile, n=25)
+
+
+@pytest.fixture
+def a_finds_table(a_rectangular_area):
+    xmin, ymin, xmax, ymax = a_rectangular_area.df.total_bounds
+    return pd.DataFrame(
+        {
+            "UID": ["find_a", "find_b", "find_c", "find_d"],
+            "Xsugg": [xmin + 1, xmax - 1, xmax + 10, np.nan],
+            "Ysugg": [ymin + 1, ymax - 1, ymax + 10, ymin + 1],
+            "obs_rate": [0.5, 0.6, 0.7, 0.8],
+            "Comments": ["", "rim", "", "base"],
+        }
+    )
+
+
+def test_from_dataframe_maps_columns(a_finds_table, a_rectangular_area):
+    layer = prospect.Layer.from_dataframe(
+        a_finds_table,
+        name="finds",
+        area=a_rectangular_area,
+        x="Xsugg",
+        y="Ysugg",
+        ideal_obs_rate="obs_rate",
+        time_penalty=1.5,
+        feature_name="UID",
+    )
+
+    assert layer.df["feature_name"].to_list() == ["find_a", "find_b"]
+    assert layer.df["ideal_obs_rate"].to_list() == [0.5, 0.6]
+    assert (layer.df["time_penalty"] == 1.5).all()
+    assert len(layer.input_features) == 4
+
+
+def test_from_csv_matches_from_dataframe(a_finds_table, a_rectangular_area, tmp_path):
+    path = tmp_path / "finds.csv"
+    a_finds_table.to_csv(path, index=False)
+    kwargs = dict(
+        name="finds",
+        area=a_rectangular_area,
+        x="Xsugg",
+        y="Ysugg",
+        ideal_obs_rate="obs_rate",
+        feature_name="UID",
+    )
+
+    from_csv = prospect.Layer.from_csv(path, chunksize=3, **kwargs)
+    from_df = prospect.Layer.from_dataframe(a_finds_table, **kwargs)
+    assert from_csv.df.drop(columns="shape").equals(from_df.df.drop(columns="shape"))
+    assert from_csv.df.geometry.equals(from_df.df.geometry)
@@ -0,0 +1,129 @@
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+import prospect
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture(scope="module")
+def a_results_on_disk(a_full_survey, tmp_path_factory):
+    return a_full_survey.run_to_disk(
+        tmp_path_factory.mktemp("results"), n_runs=7, chunk_size=3
+    )
+
+
+def test_run_to_disk_returns_SurveyResults(a_results_on_disk):
+    assert isinstance(a_results_on_disk, prospect.SurveyResults)
+
+
+def test_one_part_per_chunk(a_results_on_disk):
+    assert a_results_on_disk.runs == [(0, 2), (3, 5), (6, 6)]
+
+
+def test_discovery_names_read_back_as_categorical(a_results_on_disk):
+    assert a_results_on_disk.discovery["feature_name"].dtype == "category"
+
+
+def test_matches_in_memory_run(a_full_survey, a_results_on_disk):
+    a_full_survey.run(n_runs=7, overwrite=True)
+    assert_frame_equal(
+        pd.DataFrame(a_full_survey.discovery),
+        pd.DataFrame(a_results_on_disk.discovery),
+    )
+    assert_frame_equal(a_full_survey.time_surveyunit, a_results_on_disk.time_surveyunit)
+    assert_frame_equal(a_full_survey.time_surveyor, a_results_on_disk.time_surveyor)
+    assert a_results_on_disk.total_time == pytest.approx(a_full_survey.total_time)
+
+
+def test_read_selected_columns_and_runs(a_results_on_disk):
+    df = a_results_on_disk.read(
+        "time_surveyor", columns=["run", "total_time_per_surveyor"], runs=[1, 6]
+    )
+    assert df.columns.to_list() == ["run", "total_time_per_surveyor"]
+    assert sorted(df["run"].unique()) == [1, 6]
+
+
+def test_read_unknown_table_raises_ValueError(a_results_on_disk):
+    with pytest.raises(ValueError):
+        a_results_on_disk.read("raw")
+
+
+@pytest.fixture(scope="module")
+def a_saved_survey(a_full_survey, tmp_path_factory):
+    a_full_survey.run(n_runs=5, overwrite=True)
+    path = tmp_path_factory.mktemp("saved")
+    a_full_survey.save(path, chunk_size=2)
+    return path
+
+
+def test_save_one_part_per_chunk(a_saved_survey):
+    assert prospect.Survey.load(a_saved_survey).runs == [(0, 1), (2, 3), (4, 4)]
+
+
+def test_load_matches_saved_survey(a_full_survey, a_saved_survey):
+    loaded = prospect.Survey.load(a_saved_survey)
+    for table in ["discovery_counts", "time_surveyunit", "time_surveyor", "time_team"]:
+        assert_frame_equal(getattr(a_full_survey, table), getattr(loaded, table))
+    assert loaded.total_time == pytest.approx(a_full_survey.total_time)
+
+
+def test_load_building_block_tables(a_full_survey, a_saved_survey):
+    loaded = prospect.Survey.load(a_saved_survey)
+    assert loaded.features.shape[0] == a_full_survey.assemblage.df.shape[0]
+    assert loaded.features.geometry.equals(a_full_survey.features.geometry)
+    assert loaded.surveyors["surveyor_name"].to_list() == (
+        a_full_survey.team.df["surveyor_name"].to_list()
+    )
+    assert loaded.surveyunits.crs == a_full_survey.coverage.df.crs
+    assert loaded.metadata["name"] == a_full_survey.name
+    assert loaded.metadata["seed"] == a_full_survey.seed
+    assert set(a_full_survey.time_team["config"]) <= set(loaded.metadata["configs"])
+
+
+def test_save_refuses_to_overwrite(a_full_survey, a_saved_survey):
+    with pytest.raises(FileExistsError):
+        a_full_survey.save(a_saved_survey)
+
+
+def test_save_overwrite_replaces_results(a_full_survey, tmp_path):
+    a_full_survey.run(n_runs=4, overwrite=True)
+    a_full_survey.save(tmp_path)
+    a_full_survey.run(n_runs=2, overwrite=True)
+    a_full_survey.save(tmp_path, overwrite=True)
+    assert prospect.Survey.load(tmp_path).runs == [(0, 1)]
+
+
+def test_run_to_disk_writes_building_blocks(a_results_on_disk):
+    assert a_results_on_disk.area.shape[0] == 1
+    assert "vis" in a_results_on_disk.area.columns
+
+
+def test_run_to_disk_twice_continues_runs(a_full_survey, tmp_path):
+    a_full_survey.run_to_disk(tmp_path, n_runs=4, chunk_size=2)
+    results = a_full_survey.run_to_disk(tmp_path, n_runs=3, chunk_size=3)
+    assert results.runs == [(0, 1), (2, 3), (4, 6)]
+    assert sorted(results.time_team["run"]) == list(range(7))
+
+
+def test_run_to_disk_refuses_stored_runs(a_full_survey, tmp_path):
+    results = a_full_survey.run_to_disk(tmp_path, n_runs=4, chunk_size=2)
+    with pytest.raises(FileExistsError):
+        a_full_survey.run_to_disk(tmp_path, n_runs=4, start_run_id=0, chunk_size=2)
+    with pytest.raises(FileExistsError):
+        a_full_survey.run_to_disk(tmp_path, n_runs=2, start_run_id=1, chunk_size=3)
+    assert results.runs == [(0, 1), (2, 3)]
+    assert sorted(results.time_team["run"]) == list(range(4))
+
+
+def test_run_to_disk_keeps_each_config(a_full_survey, tmp_path):
+    a_full_survey.run_to_disk(tmp_path, n_runs=3)
+    results = a_full_survey.run_to_disk(tmp_path, n_runs=3, discovery_threshold=0.5)
+    time_team = results.time_team
+    assert time_team["config"].nunique() == 2
+    assert time_team.groupby("config")["run"].apply(sorted).to_list() == [
+        [0, 1, 2],
+        [0, 1, 2],
+    ]
+    assert set(time_team["config"]) == set(results.metadata["configs"])
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+import scipy.stats
+
+from prospect.stats import P2Quantile, RunningMoments
+
+
+def test_running_moments_match_numpy():
+    values = np.random.default_rng(0).normal(5, 2, size=(103, 3))
+    moments = RunningMoments(n_stats=3)
+    for start in range(0, 103, 10):
+        moments.update(values[start : start + 10])
+    assert moments.n == 103
+    assert moments.mean == pytest.approx(values.mean(axis=0))
+    assert moments.var == pytest.approx(values.var(axis=0, ddof=1))
+
+
+def test_half_width_uses_t_distribution():
+    values = np.array([1.0, 2.0, 4.0, 7.0])
+    moments = RunningMoments()
+    moments.update(values)
+    t = scipy.stats.t.ppf(0.975, df=3)
+    expected = t * values.std(ddof=1) / np.sqrt(4)
+    assert moments.half_width(0.95) == pytest.approx([expected])
+
+
+def test_no_variance_before_two_observations():
+    moments = RunningMoments()
+    moments.update([3.0])
+    assert np.isnan(moments.var).all()
+    assert np.isnan(moments.half_width()).all()
+
+
+def test_p2_quantile_close_to_exact():
+    values = np.random.default_rng(1).exponential(size=(5000, 2))
+    for p in (0.05, 0.5, 0.95):
+        quantile = P2Quantile(p, n_stats=2)
+        for start in range(0, 5000, 64):
+            quantile.update(values[start : start + 64])
+        exact = np.quantile(values, p, axis=0)
+        assert quantile.value == pytest.approx(exact, rel=0.05, abs=0.01)
+
+
+def test_p2_quantile_exact_for_few_observations():
+    quantile = P2Quantile(0.5)
+    quantile.update([3.0, 1.0, 2.0])
+    assert quantile.value == pytest.approx([2.0])
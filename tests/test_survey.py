@@ -1,3 +1,14 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from geopandas import GeoDataFrame, sjoin
+from matplotlib.figure import Figure
+from pandas.testing import assert_frame_equal
+from shapely.geometry import box
+
 import prospect
 
 
@@ -7,3 +18,478 @@ def test_returns_Survey(a_survey):
 
 def test_has_name_attribute(a_survey):
     assert hasattr(a_survey, "name")
+
+
+def test_run_returns_row_per_feature_per_run(a_full_survey):
+    a_full_survey.run(n_runs=5, overwrite=True)
+    n_features = a_full_survey.assemblage.df.shape[0]
+    assert a_full_survey.discovery.shape[0] == 5 * n_features
+    assert a_full_survey.raw.shape[0] == 5 * n_features
+    assert sorted(a_full_survey.discovery["run"].unique()) == list(range(5))
+
+
+def test_run_time_tables_agree(a_full_survey):
+    a_full_survey.run(n_runs=5, overwrite=True)
+    by_surveyunit = a_full_survey.time_surveyunit.groupby("run")[
+        "total_time_per_surveyunit"
+    ].sum()
+    by_surveyor = a_full_survey.time_surveyor.groupby("run")[
+        "total_time_per_surveyor"
+    ].sum()
+    assert by_surveyunit.values == pytest.approx(by_surveyor.values)
+    assert a_full_survey.total_time == pytest.approx(by_surveyunit.sum())
+
+
+def test_run_appends_without_overwrite(a_full_survey):
+    a_full_survey.run(n_runs=2, overwrite=True)
+    a_full_survey.run(n_runs=3, start_run_id=2)
+    assert sorted(a_full_survey.time_surveyor["run"].unique()) == list(range(5))
+
+
+def test_run_continues_after_stored_runs(a_full_survey):
+    a_full_survey.run(n_runs=3, overwrite=True)
+    a_full_survey.run(n_runs=3)
+    assert sorted(a_full_survey.time_team["run"].unique()) == list(range(6))
+
+    draws = a_full_survey.raw.pivot(
+        index="run", columns="feature_name", values="vis_obs"
+    ).to_numpy()
+    assert len({tuple(row) for row in draws}) == 6
+    assert a_full_survey.summary.n_runs == 6
+
+
+def test_feature_unit_index_matches_sjoin(a_full_survey):
+    unit_idx = prospect.survey._feature_unit_index(
+        a_full_survey.assemblage, a_full_survey.coverage
+    )
+    joined = sjoin(a_full_survey.assemblage.df, a_full_survey.coverage.df, how="left")
+    assert list(unit_idx) == list(joined["index_right"].fillna(-1).astype(int))
+
+
+def test_feature_unit_index_shared_across_surveys(a_full_survey):
+    other = prospect.Survey(
+        name="other_survey",
+        area=a_full_survey.area,
+        assemblage=prospect.Assemblage(
+            name="copied_assemblage", layer_list=a_full_survey.assemblage.layer_list
+        ),
+        coverage=a_full_survey.coverage,
+        team=a_full_survey.team,
+    )
+    assert prospect.survey._feature_unit_index(
+        a_full_survey.assemblage, a_full_survey.coverage
+    ) is prospect.survey._feature_unit_index(other.assemblage, other.coverage)
+
+
+def test_run_reproducible_with_seed(a_full_survey):
+    first = prospect.Survey(
+        name="seeded",
+        area=a_full_survey.area,
+        assemblage=a_full_survey.assemblage,
+        coverage=a_full_survey.coverage,
+        team=a_full_survey.team,
+        seed=42,
+    )
+    second = prospect.Survey(
+        name="seeded",
+        area=a_full_survey.area,
+        assemblage=a_full_survey.assemblage,
+        coverage=a_full_survey.coverage,
+        team=a_full_survey.team,
+        seed=42,
+    )
+    first.run(n_runs=4)
+    second.run(n_runs=2)
+    second.run(n_runs=2, start_run_id=2)
+    assert_frame_equal(first.discovery, second.discovery)
+    assert_frame_equal(first.time_surveyunit, second.time_surveyunit)
+
+
+def test_run_identical_across_n_jobs(a_full_survey):
+    a_full_survey.run(n_runs=6, overwrite=True)
+    serial = a_full_survey.time_surveyor.copy()
+    a_full_survey.run(n_runs=6, overwrite=True, n_jobs=3)
+    assert_frame_equal(serial, a_full_survey.time_surveyor)
+
+
+def test_run_with_executor(a_full_survey):
+    a_full_survey.run(n_runs=4, overwrite=True)
+    serial = a_full_survey.discovery.copy()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        a_full_survey.run(n_runs=4, overwrite=True, n_jobs=2, executor=executor)
+    assert_frame_equal(serial, a_full_survey.discovery)
+
+
+def test_draw_values_one_rvs_call_per_distribution_per_run():
+    distr = prospect.utils.beta(2, 2)
+    values = pd.Series([distr, 1.0, distr, np.nan, distr], dtype=object)
+    rngs = prospect.survey._run_rngs(0, np.arange(3))
+    with patch.object(distr, "rvs", wraps=distr.rvs) as rvs:
+        drawn = prospect.survey._draw_values(values, rngs)
+    assert rvs.call_count == 3
+    assert drawn.shape == (3, 5)
+    assert all(drawn[:, 1] == 1.0)
+    assert all(np.isnan(drawn[:, 3]))
+    assert ((drawn[:, [0, 2, 4]] > 0) & (drawn[:, [0, 2, 4]] < 1)).all()
+
+
+def test_draw_values_broadcasts_constants():
+    values = pd.Series([0.5, 0.25, 1.0])
+    drawn = prospect.survey._draw_values(values, [None] * 4)
+    assert drawn.shape == (4, 3)
+    assert (drawn == [0.5, 0.25, 1.0]).all()
+
+
+def test_result_tables_hold_no_geometry(a_full_survey):
+    a_full_survey.run(n_runs=2, overwrite=True)
+    for table in [a_full_survey.raw, a_full_survey.discovery]:
+        assert not isinstance(table, GeoDataFrame)
+        assert "shape" not in table.columns
+        assert table["feature_name"].dtype == "category"
+
+
+def test_features_table_has_geometry_and_surveyunit(a_full_survey):
+    features = a_full_survey.features
+    assert isinstance(features, GeoDataFrame)
+    assert features.shape[0] == a_full_survey.assemblage.df.shape[0]
+    assert "surveyunit_name" in features.columns
+
+
+def test_with_geometry_joins_feature_shapes(a_full_survey):
+    a_full_survey.run(n_runs=2, overwrite=True)
+    gdf = a_full_survey.with_geometry(a_full_survey.discovery)
+    assert isinstance(gdf, GeoDataFrame)
+    assert gdf.shape[0] == a_full_survey.discovery.shape[0]
+    assert gdf.geometry.notna().all()
+
+
+def test_with_geometry_joins_surveyunit_shapes(a_full_survey):
+    a_full_survey.run(n_runs=2, overwrite=True)
+    gdf = a_full_survey.with_geometry(a_full_survey.time_surveyunit)
+    assert gdf.geometry.notna().all()
+
+
+def test_discovery_plot_returns_Figure(a_full_survey):
+    a_full_survey.run(n_runs=2, overwrite=True)
+    assert isinstance(a_full_survey.discovery_plot(), Figure)
+
+
+def test_discovered_only_where_probability_is_positive(a_full_survey):
+    a_full_survey.run(n_runs=5, overwrite=True)
+    discovery = a_full_survey.discovery
+    assert discovery["discovered"].dtype == bool
+    assert not discovery.loc[discovery["proximity_obs"] == 0, "discovered"].any()
+
+
+def test_discovery_threshold_excludes_low_probabilities(a_full_survey):
+    a_full_survey.run(n_runs=5, overwrite=True, discovery_threshold=0.5)
+    discovery = a_full_survey.discovery
+    assert not discovery.loc[discovery["discovery_prob"] < 0.5, "discovered"].any()
+
+
+def test_discovery_counts_match_discovery(a_full_survey):
+    a_full_survey.run(n_runs=5, overwrite=True)
+    counts = a_full_survey.discovery_counts
+    assert counts.shape[0] == 5 * a_full_survey.assemblage.df["layer_name"].nunique()
+    assert list(counts["n_discovered"]) == list(
+        a_full_survey.discovery.groupby("run")["discovered"].sum()
+    )
+
+
+def test_run_uses_vis_of_the_area_polygon_of_each_feature(a_full_survey):
+    area = prospect.Area.from_polygons(
+        name="test_area",
+        shapes=[box(0, 0, 100, 100), box(100, 0, 200, 100)],
+        vis=[0.0, 1.0],
+    )
+    layer = prospect.Layer.from_pseudorandom_points(
+        n=100, name="test_layer", area=area, rng=0
+    )
+    survey = prospect.Survey(
+        name="test_multi_area_survey",
+        area=area,
+        assemblage=prospect.Assemblage(name="test_assemblage", layer_list=[layer]),
+        coverage=prospect.Coverage.from_transects(name="test_coverage", area=area),
+        team=a_full_survey.team,
+        seed=0,
+    )
+    survey.run(n_runs=2)
+
+    xs = survey.features.set_index("feature_name").geometry.x
+    vis = survey.discovery.set_index("feature_name")["vis_obs"]
+    assert (vis == np.where(xs.reindex(vis.index) < 100, 0.0, 1.0)).all()
+    assert not survey.discovery.loc[vis.to_numpy() == 0.0, "discovered"].any()
+
+
+@pytest.mark.parametrize("on_surface", [False, True])
+def test_run_never_discovers_features_outside_area(a_full_survey, on_surface):
+    region = prospect.Area(name="test_region", shape=box(0, 0, 200, 100))
+    vis = 1.0
+    if on_surface:
+        # the surface covers the whole region, not just the area
+        vis = prospect.VisibilitySurface.from_polygons(
+            name="test_surface", shapes=[region.shape], values=[1.0]
+        )
+    layer = prospect.Layer.from_coordinates(
+        np.array([[25.0, 50.0], [75.0, 50.0], [125.0, 50.0], [175.0, 50.0]]),
+        name="test_layer",
+        area=region,
+    )
+    survey = prospect.Survey(
+        name="test_outside_survey",
+        area=prospect.Area(name="test_area", shape=box(0, 0, 100, 100), vis=vis),
+        assemblage=prospect.Assemblage(name="test_assemblage", layer_list=[layer]),
+        coverage=prospect.Coverage.from_transects(
+            name="test_coverage", area=region, spacing=50.0, sweep_width=10.0
+        ),
+        team=a_full_survey.team,
+        seed=0,
+    )
+    survey.run(n_runs=3)
+
+    assert survey.features["surveyunit_name"].notna().all()
+    outside = survey.discovery["feature_name"].isin(layer.df["feature_name"].iloc[2:])
+    assert survey.discovery.loc[outside, "vis_obs"].isna().all()
+    assert not survey.discovery.loc[outside, "discovered"].any()
+    assert survey.discovery.loc[~outside, "vis_obs"].eq(1.0).all()
+
+
+@pytest.mark.parametrize("assignment", ["speed", "random"])
+def test_run_with_assignment_time_tables_agree(a_full_survey, assignment):
+    team = prospect.Team(
+        name="test_team",
+        surveyor_list=a_full_survey.team.surveyor_list,
+        assignment=assignment,
+    )
+    survey = prospect.Survey(
+        name="test_assignment_survey",
+        area=a_full_survey.area,
+        assemblage=a_full_survey.assemblage,
+        coverage=a_full_survey.coverage,
+        team=team,
+        seed=0,
+    )
+    survey.run(n_runs=4)
+
+    by_surveyor = (
+        survey.time_surveyunit.groupby(["run", "surveyor_name"], observed=True)[
+            "total_time_per_surveyunit"
+        ]
+        .sum()
+        .reset_index()
+    )
+    assert np.allclose(
+        by_surveyor["total_time_per_surveyunit"],
+        survey.time_surveyor["total_time_per_surveyor"],
+    )
+    assert survey.discovery.shape[0] == 4 * survey.assemblage.df.shape[0]
+
+
+def test_makespan_is_max_time_per_surveyor(a_full_survey):
+    a_full_survey.run(n_runs=5, overwrite=True)
+    by_surveyor = a_full_survey.time_surveyor.groupby("run")["total_time_per_surveyor"]
+    time_team = a_full_survey.time_team.set_index("run")
+    assert time_team["makespan"].values == pytest.approx(by_surveyor.max().values)
+    assert time_team["total_time"].values == pytest.approx(by_surveyor.sum().values)
+    assert (time_team["walk_time"] == 0).all()
+
+
+def test_makespan_adds_walking_time(a_full_survey):
+    a_full_survey.run(n_runs=3, overwrite=True)
+    no_walk = a_full_survey.time_team.copy()
+    a_full_survey.run(n_runs=3, overwrite=True, walking_speed=2.0)
+    time_team = a_full_survey.time_team
+    assert (time_team["walk_time"] >= 0).all()
+    assert (time_team["makespan"] >= no_walk["makespan"]).all()
+    assert (
+        time_team["makespan"] <= no_walk["makespan"] + time_team["walk_time"] + 1e-9
+    ).all()
+
+
+def test_walking_distance_between_consecutive_units():
+    unit_surveyor = np.array([[0, 1, 0, 0], [1, 1, 1, 0]])
+    xs = np.array([0.0, 6.0, 3.0, 3.0])
+    ys = np.array([0.0, 0.0, 4.0, 0.0])
+    distance = prospect.survey._walking_distance(unit_surveyor, xs, ys, n_team=2)
+    assert distance.tolist() == [[9.0, 0.0], [0.0, 6.0 + 5.0]]
+
+
+def test_results_tagged_with_config(a_full_survey):
+    a_full_survey.run(n_runs=2, overwrite=True)
+    configs = a_full_survey.discovery["config"].unique()
+    assert len(configs) == 1
+    assert a_full_survey.configs[configs[0]]["team"] == a_full_survey.team.name
+    assert (a_full_survey.time_surveyor["config"] == configs[0]).all()
+
+
+def test_swapping_team_reuses_spatial_work(a_full_survey):
+    survey = prospect.Survey(
+        name="swapped",
+        area=a_full_survey.area,
+        assemblage=a_full_survey.assemblage,
+        coverage=a_full_survey.coverage,
+        team=a_full_survey.team,
+    )
+    survey.run(n_runs=2)
+    other_team = prospect.Team(
+        name="other_team",
+        surveyor_list=a_full_survey.team.surveyor_list,
+        assignment="random",
+    )
+    survey.add_bb([other_team])
+    with patch.object(
+        prospect.survey,
+        "_feature_unit_index",
+        wraps=prospect.survey._feature_unit_index,
+    ) as unit_index:
+        survey.run(n_runs=2, start_run_id=2)
+    unit_index.assert_not_called()
+
+    by_config = survey.time_surveyor.groupby("config", observed=True)["run"].unique()
+    assert len(by_config) == 2
+    assert {config["team"] for config in survey.configs.values()} == {
+        "test_team",
+        "other_team",
+    }
+
+
+def test_swapping_coverage_redoes_spatial_work(a_full_survey):
+    survey = prospect.Survey(
+        name="swapped",
+        area=a_full_survey.area,
+        assemblage=a_full_survey.assemblage,
+        coverage=a_full_survey.coverage,
+        team=a_full_survey.team,
+    )
+    survey.run(n_runs=1)
+    survey.add_bb(
+        [
+            prospect.Coverage.from_transects(
+                name="wide_coverage",
+                area=a_full_survey.area,
+                spacing=20.0,
+                min_time_per_unit=0.5,
+            )
+        ]
+    )
+    with patch.object(
+        prospect.survey,
+        "_feature_unit_index",
+        wraps=prospect.survey._feature_unit_index,
+    ) as unit_index:
+        survey.run(n_runs=1, start_run_id=1)
+    unit_index.assert_called_once()
+    assert survey.discovery["config"].nunique() == 2
+
+
+def test_run_until_stops_at_max_runs(a_full_survey):
+    estimates = a_full_survey.run_until(
+        tolerance=0.0, batch_size=3, max_runs=7, overwrite=True
+    )
+    assert sorted(a_full_survey.time_surveyor["run"].unique()) == list(range(7))
+    assert (estimates["n_runs"] == 7).all()
+    assert list(estimates["estimate"]) == [
+        "n_discovered",
+        "discovery_rate",
+        "total_time",
+    ]
+
+    by_run = a_full_survey.time_team.set_index("run")["total_time"]
+    assert estimates["mean"].iloc[-1] == pytest.approx(by_run.mean())
+    assert estimates["std"].iloc[-1] == pytest.approx(by_run.std())
+
+
+def test_run_until_stops_when_converged(a_full_survey):
+    estimates = a_full_survey.run_until(
+        tolerance=0.5, batch_size=5, max_runs=1000, overwrite=True
+    )
+    assert estimates["converged"].all()
+    assert estimates["n_runs"].iloc[0] < 1000
+    assert (estimates["half_width"] <= 0.5 * estimates["mean"].abs()).all()
+
+
+@pytest.mark.parametrize("max_runs", [0, -1])
+def test_run_until_without_runs_raises_AssertionError(a_full_survey, max_runs):
+    with pytest.raises(AssertionError):
+        a_full_survey.run_until(max_runs=max_runs, overwrite=True)
+
+
+def test_run_until_matches_run(a_full_survey):
+    a_full_survey.run_until(tolerance=0.0, batch_size=2, max_runs=4, overwrite=True)
+    until = a_full_survey.discovery.copy()
+    a_full_survey.run(n_runs=4, overwrite=True)
+    assert_frame_equal(until, a_full_survey.discovery)
+
+
+def test_summary_matches_result_tables(a_full_survey):
+    a_full_survey.run(n_runs=4, overwrite=True)
+    a_full_survey.run(n_runs=3, start_run_id=4)
+    summary = a_full_survey.summary
+    assert summary.n_runs == 7
+
+    by_feature = a_full_survey.discovery.groupby("feature_name", observed=True)
+    features = summary.features
+    assert features["mean_discovery_prob"].to_numpy() == pytest.approx(
+        by_feature["discovery_prob"].mean().to_numpy(), nan_ok=True
+    )
+    assert features["discovery_rate"].to_numpy() == pytest.approx(
+        by_feature["discovered"].mean().to_numpy()
+    )
+
+    counts = a_full_survey.discovery_counts.groupby("layer_name")
+    assert summary.layers["mean_n_discovered"].to_numpy() == pytest.approx(
+        counts["n_discovered"].mean().to_numpy()
+    )
+
+    time_team = a_full_survey.time_team
+    time = summary.time.loc["total_time"]
+    assert time["mean"] == pytest.approx(time_team["total_time"].mean())
+    assert time["min"] == pytest.approx(time_team["total_time"].min())
+    assert time["max"] == pytest.approx(time_team["total_time"].max())
+
+
+def test_run_without_keeping_tables(a_full_survey):
+    a_full_survey.run(n_runs=3, overwrite=True)
+    discovery = a_full_survey.discovery.copy()
+    a_full_survey.run(n_runs=5, start_run_id=3, keep_tables=False)
+    assert_frame_equal(discovery, a_full_survey.discovery)
+    assert a_full_survey.summary.n_runs == 8
+    assert (a_full_survey.summary.features["n_runs"] == 8).all()
+
+
+def test_run_without_keeping_tables_resolves_bounded_batches(a_full_survey):
+    a_full_survey.run(n_runs=7, overwrite=True)
+    kept = a_full_survey.summary.time
+
+    with patch.object(prospect.Survey, "BATCH_SIZE", 2), patch.object(
+        prospect.survey, "_resolve", wraps=prospect.survey._resolve
+    ) as resolve:
+        a_full_survey.run(n_runs=7, overwrite=True, keep_tables=False)
+    batch_sizes = [len(call.kwargs["run_ids"]) for call in resolve.call_args_list]
+    assert batch_sizes == [2, 2, 2, 1]
+    assert a_full_survey.discovery is None
+    assert a_full_survey.summary.n_runs == 7
+    assert a_full_survey.summary.time["mean"].to_numpy() == pytest.approx(
+        kept["mean"].to_numpy()
+    )
+
+
+def test_overwrite_resets_summary(a_full_survey):
+    a_full_survey.run(n_runs=3, overwrite=True)
+    a_full_survey.run(n_runs=2, overwrite=True)
+    assert a_full_survey.summary.n_runs == 2
+
+
+def test_summaries_keyed_by_config(a_full_survey):
+    a_full_survey.run(n_runs=3, overwrite=True)
+    a_full_survey.run(n_runs=2, discovery_threshold=0.5)
+    assert len(a_full_survey.summaries) == 2
+
+    by_config = a_full_survey.time_team.groupby("config", observed=True)
+    for config, time_team in by_config:
+        summary = a_full_survey.summaries[config]
+        assert summary.n_runs == time_team.shape[0]
+        assert summary.total_time == pytest.approx(time_team["total_time"].sum())
+    last_config = a_full_survey.time_team["config"].iloc[-1]
+    assert a_full_survey.summary is a_full_survey.summaries[last_config]
+    assert a_full_survey.summary.n_runs == 2
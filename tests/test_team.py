@@ -1,3 +1,7 @@
+import numpy as np
+import pandas as pd
+import pytest
+
 import prospect
 
 
@@ -8,3 +12,101 @@ def test_returns_Team(a_team):
 def test_has_desired_attributes(a_team):
     for a in ["name", "surveyor_list", "assignment", "df"]:
         assert hasattr(a_team, a)
+
+
+def _make_team(assignment, speed_penalties=(0.0, 0.0, 0.0)):
+    return prospect.Team(
+        name="test_team",
+        surveyor_list=[
+            prospect.Surveyor(
+                name=f"surveyor_{i}",
+                team_name="test_team",
+                surveyor_type="test_type",
+                skill=1.0,
+                speed_penalty=penalty,
+            )
+            for i, penalty in enumerate(speed_penalties)
+        ],
+        assignment=assignment,
+    )
+
+
+def test_unknown_assignment_raises_AssertionError():
+    with pytest.raises(AssertionError):
+        _make_team("fastest")
+
+
+def test_naive_assign_cycles_surveyors():
+    team = _make_team("naive")
+    assigned = team.assign(np.ones((2, 7)), rngs=[None, None])
+    assert assigned.tolist() == [[0, 1, 2, 0, 1, 2, 0]] * 2
+
+
+def test_random_assign_shuffles_naive_per_run():
+    team = _make_team("random")
+    rngs = [np.random.default_rng(i) for i in range(4)]
+    assigned = team.assign(np.ones((4, 30)), rngs=rngs)
+
+    assert all(np.bincount(row).tolist() == [10, 10, 10] for row in assigned)
+    assert len({tuple(row) for row in assigned}) == 4
+
+
+def test_speed_assign_balances_search_time():
+    team = _make_team("speed", speed_penalties=(0.0, 0.5, prospect.utils.beta(2, 2)))
+    base_search_time = np.random.default_rng(0).exponential(10.0, size=(3, 2000))
+    assigned = team.assign(base_search_time, rngs=[None] * 3)
+
+    factor = np.array([1.0, 1.5, 1.5])
+    for times, surveyors in zip(base_search_time, assigned):
+        load = np.bincount(surveyors, weights=times * factor[surveyors])
+        # LPT keeps every surveyor within one unit of the others
+        assert load.max() - load.min() <= (times * factor.max()).max()
+        naive = np.bincount(
+            np.arange(2000) % 3, weights=times * factor[np.arange(2000) % 3]
+        )
+        assert load.max() <= naive.max()
+
+
+def test_from_dataframe_one_surveyor_per_walker():
+    walkers = pd.DataFrame(
+        {
+            "Tract": [1001, 1001, 1002, 1002],
+            "Walker": [1, 3, 1, 5],
+            "Skill": [0.8, 0.6, 0.9, 0.7],
+        }
+    )
+    team = prospect.Team.from_dataframe(
+        walkers,
+        name="walkers",
+        surveyor_name="Walker",
+        skill="Skill",
+        speed_penalty=0.2,
+        assignment="speed",
+    )
+
+    assert team.df["surveyor_name"].to_list() == ["1", "3", "5"]
+    assert team.df["skill"].to_list() == [0.8, 0.6, 0.7]
+    assert (team.df["speed_penalty"] == 0.2).all()
+    assert (team.df["team_name"] == "walkers").all()
+    assert team.assignment == "speed"
+
+
+@pytest.mark.parametrize("column", ["skill", "speed_penalty"])
+def test_from_dataframe_missing_column_raises_KeyError(column):
+    walkers = pd.DataFrame({"Walker": [1, 3], "Skill": [0.8, 0.6]})
+    with pytest.raises(KeyError):
+        prospect.Team.from_dataframe(
+            walkers, name="walkers", surveyor_name="Walker", **{column: "Skil"}
+        )
+
+
+def test_from_dataframe_surveyor_type_column_or_value():
+    walkers = pd.DataFrame({"Walker": [1, 3], "Role": ["leader", "walker"]})
+    by_column = prospect.Team.from_dataframe(
+        walkers, name="walkers", surveyor_name="Walker", surveyor_type="Role"
+    )
+    by_value = prospect.Team.from_dataframe(
+        walkers, name="walkers", surveyor_name="Walker", surveyor_type="student"
+    )
+    assert by_column.df["surveyor_type"].to_list() == ["leader", "walker"]
+    assert by_value.df["surveyor_type"].to_list() == ["student", "student"]
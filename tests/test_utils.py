@@ -1,6 +1,7 @@
+import numpy as np
 import pytest
 from geopandas import GeoDataFrame
-from shapely.geometry import LineString, MultiLineString, MultiPolygon
+from shapely.geometry import LineString, MultiLineString, MultiPolygon, Polygon
 
 import prospect
 
@@ -22,6 +23,16 @@ def test_clip_points_returns_expected_points(a_clipped_points_gdf):
     assert all(intersect_bools)
 
 
+def test_clip_points_by_Area_matches_GeoDataFrame(a_points_gdf_for_clip):
+    polygon = Polygon([(0, 0), (0, 2), (2, 2), (2, 0), (0, 0)])
+    area = prospect.Area(name="test_area", shape=polygon)
+
+    by_area = prospect.utils.clip_points(points=a_points_gdf_for_clip, by=area)
+    by_gdf = prospect.utils.clip_points(points=a_points_gdf_for_clip, by=area.df)
+    assert by_area.index.tolist() == by_gdf.index.tolist()
+    assert area.prepared_shape is prospect.utils._clipping_polygon(area)
+
+
 @pytest.fixture(scope="module")
 def a_clipped_lines_gdf(a_line_string_gdf_for_clip, a_polygon_gdf_for_clip):
     return prospect.utils.clip_lines_polys(
@@ -33,6 +44,20 @@ def test_clip_lines_returns_GeoDataFrame(a_clipped_lines_gdf):
     assert isinstance(a_clipped_lines_gdf, GeoDataFrame)
 
 
+def test_clip_by_polygon_only_intersects_crossing_geometries():
+    poly = Polygon([(0, 0), (0, 2), (2, 2), (2, 0), (0, 0)])
+    inside = LineString([(0.5, 0.5), (1.5, 1.5)])
+    crossing = LineString([(1, 1), (3, 1)])
+    outside = LineString([(3, 3), (4, 4)])
+
+    keep, clipped = prospect.utils._clip_by_polygon(
+        np.array([inside, crossing, outside]), poly
+    )
+    assert keep.tolist() == [True, True, False]
+    assert clipped[0] is inside
+    assert clipped[1].equals(LineString([(1, 1), (2, 1)]))
+
+
 def test_clip_lines_polys_returns_correct_lines(a_clipped_lines_gdf):
     expected_shapes = [
         MultiLineString([((0, 0), (0.5, 0.5)), ((0.5, 0.5), (1, 1))]),
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+from geopandas import GeoDataFrame, points_from_xy
+from shapely.geometry import box
+
+import prospect
+
+
+@pytest.fixture(scope="module")
+def a_raster_surface():
+    # 2 x 3 cells of 10 units, upper left corner at (0, 20)
+    values = np.array([[0.1, 0.2, 0.3], [0.4, 0.5, -1.0]])
+    return prospect.VisibilitySurface.from_raster(
+        name="test_raster",
+        values=values,
+        transform=(10.0, 0.0, 0.0, 0.0, -10.0, 20.0),
+        nodata=-1.0,
+    )
+
+
+def _points(xs, ys):
+    return GeoDataFrame(geometry=points_from_xy(xs, ys))
+
+
+def test_from_raster_returns_VisibilitySurface(a_raster_surface):
+    assert isinstance(a_raster_surface, prospect.VisibilitySurface)
+
+
+def test_raster_sample_indexes_cells(a_raster_surface):
+    vals = a_raster_surface.sample(
+        _points([5, 15, 25, 5, 15, 25, 50], [15] * 3 + [5] * 3 + [5])
+    )
+    np.testing.assert_array_equal(vals, [0.1, 0.2, 0.3, 0.4, 0.5, np.nan, np.nan])
+
+
+def test_sample_is_cached(a_raster_surface):
+    points = _points([5, 15], [15, 15])
+    assert a_raster_surface.sample(points) is a_raster_surface.sample(points.copy())
+
+
+def test_polygon_sample_uses_first_polygon():
+    surface = prospect.VisibilitySurface.from_polygons(
+        name="test_polygons",
+        shapes=[box(0, 0, 10, 10), box(5, 0, 20, 10)],
+        values=[0.3, 0.9],
+    )
+    vals = surface.sample(_points([2, 7, 15, 30], [5, 5, 5, 5]))
+    np.testing.assert_array_equal(vals, [0.3, 0.3, 0.9, np.nan])
+
+
+def test_draw_adds_noise_per_run_within_bounds():
+    surface = prospect.VisibilitySurface.from_polygons(
+        name="test_polygons",
+        shapes=[box(0, 0, 10, 10)],
+        values=[0.95],
+        noise=prospect.utils.truncnorm(0, 0.1, -0.3, 0.3),
+    )
+    vals = surface.sample(_points(np.full(100, 5.0), np.full(100, 5.0)))
+    rngs = [np.random.default_rng(i) for i in range(3)]
+    draws = surface.draw(vals, rngs)
+
+    assert draws.shape == (3, 100)
+    assert ((draws >= 0) & (draws <= 1)).all()
+    assert not np.allclose(draws[0], draws[1])
+
+
+def test_survey_uses_visibility_surface(a_full_survey):
+    surface = prospect.VisibilitySurface.from_raster(
+        name="test_raster",
+        values=np.array([[0.0, 1.0]]),
+        transform=(50.0, 0.0, 0.0, 0.0, -100.0, 100.0),
+    )
+    area = prospect.Area.from_area_value(name="test_area", value=10000, vis=surface)
+    layer = prospect.Layer.from_pseudorandom_points(
+        n=100, name="test_layer", area=area, rng=0
+    )
+    survey = prospect.Survey(
+        name="test_vis_survey",
+        area=area,
+        assemblage=prospect.Assemblage(name="test_assemblage", layer_list=[layer]),
+        coverage=prospect.Coverage.from_transects(name="test_coverage", area=area),
+        team=a_full_survey.team,
+        seed=0,
+    )
+    survey.run(n_runs=2)
+
+    xs = survey.features.set_index("feature_name").geometry.x
+    vis = survey.discovery.set_index("feature_name")["vis_obs"]
+    assert (vis == np.where(xs.reindex(vis.index) < 50, 0.0, 1.0)).all()